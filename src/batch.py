@@ -0,0 +1,190 @@
+import csv
+import json
+from typing import Any, Iterable, Optional, TextIO
+import click
+from integer_statistics import IntegerStatistics
+from parallel_simulator import run_jobs
+from player_factory import player_class
+from result_cache import SimulationConfig
+
+FORMATS = ("jsonl", "csv")
+
+SUMMARY_FIELDS = (
+    "player",
+    "stake",
+    "duration",
+    "limit",
+    "samples",
+    "seed",
+    "durations_mean",
+    "durations_stdev",
+    "maxima_mean",
+    "maxima_stdev",
+)
+
+
+def run_batch(
+    configs: list[SimulationConfig], workers: int = 1, chunkSize: int = 64
+) -> list[tuple[IntegerStatistics, IntegerStatistics]]:
+    """
+    Plays the sessions of every configuration and returns their durations and maxima.
+
+    The sessions of all the configurations are played by :func:`run_jobs`, split into chunks of
+    at most **chunkSize** and spread over **workers** processes, so a single configuration is
+    parallelized as well as several. Each session is seeded from its configuration, as in
+    :func:`simulate`, so the results do not depend on the number of workers.
+
+    :param configs: the configurations.
+    :param workers: the number of worker processes. With a single worker, the sessions are
+                    played in the current process.
+    :param chunkSize: the largest number of sessions handed to a worker at a time.
+    :return: the durations and maxima of each configuration, in order.
+    """
+
+    results = [(IntegerStatistics(), IntegerStatistics()) for _ in configs]
+    jobs = [config.job() for config in configs]
+    for index, sessions in run_jobs(jobs, workers, chunkSize):
+        durations, maxima = results[index]
+        for duration, maximum in sessions:
+            durations.append(duration)
+            maxima.append(maximum)
+    return results
+
+
+def record(
+    config: SimulationConfig,
+    durations: IntegerStatistics,
+    maxima: IntegerStatistics,
+    raw: bool = False,
+) -> dict[str, Any]:
+    """
+    Returns the output record of a configuration: its parameters and the means and standard
+    deviations of its durations and maxima, and, if **raw** is set, the value of every session.
+    A configuration without sessions has no means nor standard deviations; they are
+    :samp:`None`.
+    """
+
+    def summary(values: IntegerStatistics) -> tuple[Optional[float], Optional[float]]:
+        if not values:
+            return None, None
+        return values.mean(), values.stdev() if len(values) > 1 else 0.0
+
+    result: dict[str, Any] = dict(
+        zip(
+            SUMMARY_FIELDS,
+            (
+                config.playerName,
+                config.initStake,
+                config.initDuration,
+                config.limit,
+                config.samples,
+                config.seed,
+                *summary(durations),
+                *summary(maxima),
+            ),
+        )
+    )
+    if raw:
+        result["durations"] = list(durations)
+        result["maxima"] = list(maxima)
+    return result
+
+
+def write_records(
+    records: Iterable[dict[str, Any]], file: TextIO, format: str, raw: bool = False
+) -> None:
+    """
+    Writes records as JSON Lines, one object per line, or as CSV with a header row. In CSV, the
+    raw values of a record are written as space-separated lists.
+
+    :param records: the records, as returned by :func:`record`.
+    :param file: the file to write to.
+    :param format: :samp:`"jsonl"` or :samp:`"csv"`.
+    :param raw: whether the records hold the raw values.
+    """
+
+    if format == "jsonl":
+        for result in records:
+            file.write(json.dumps(result) + "\n")
+        return
+    if format != "csv":
+        raise ValueError(f"Unknown format {format}, expected one of {FORMATS}")
+    fields = SUMMARY_FIELDS + (("durations", "maxima") if raw else ())
+    writer = csv.DictWriter(file, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    for result in records:
+        if raw:
+            result = dict(
+                result,
+                durations=" ".join(map(str, result["durations"])),
+                maxima=" ".join(map(str, result["maxima"])),
+            )
+        writer.writerow(result)
+
+
+def check_players(  # pylint: disable=unused-argument
+    context: click.Context, parameter: click.Parameter, names: tuple[str, ...]
+) -> tuple[str, ...]:
+    """
+    Capitalizes the player names given on the command line, as :py:mod:`roulette` does, leaving
+    :samp:`"module:Class"` references alone, and checks that each names a player.
+    """
+
+    players = tuple(name if ":" in name else name.capitalize() for name in names)
+    for player in players:
+        try:
+            player_class(player)
+        except (ValueError, ImportError, AttributeError) as error:
+            raise click.BadParameter(f"{player}: {error}") from error
+    return players
+
+
+@click.command()
+@click.option(
+    "--player",
+    "players",
+    multiple=True,
+    required=True,
+    callback=check_players,
+    help="Strategy to simulate.",
+)
+@click.option(
+    "--samples",
+    type=click.IntRange(min=1),
+    default=50,
+    help="Number of sessions per strategy.",
+)
+@click.option("--seed", default=0, help="Seed of the sessions.")
+@click.option("--stake", default=100, help="Initial stake.")
+@click.option("--duration", default=250, help="Initial duration.")
+@click.option("--limit", default=300, help="Table limit.")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes.",
+)
+@click.option("--format", "format", type=click.Choice(FORMATS), default="jsonl")
+@click.option("--output", type=click.File("w"), default="-", help="File to write to.")
+@click.option("--raw", is_flag=True, help="Include the value of every session.")
+def main(  # pylint: disable=too-many-arguments
+    players, samples, seed, stake, duration, limit, workers, format, output, raw
+) -> None:  # pragma: no cover
+    """
+    Simulates each of the given strategies without prompting, and writes one record per strategy
+    to the output, or to stdout.
+    """
+    configs = [
+        SimulationConfig(player, stake, duration, limit, samples, seed)
+        for player in players
+    ]
+    results = run_batch(configs, workers)
+    records = (
+        record(config, durations, maxima, raw)
+        for config, (durations, maxima) in zip(configs, results)
+    )
+    write_records(records, output, format, raw)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()  # pylint: disable=no-value-for-parameter
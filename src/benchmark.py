@@ -0,0 +1,321 @@
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Optional, TypedDict
+import click
+from bin_builder import BinBuilder, american_wheel
+from game import Game
+from integer_statistics import IntegerStatistics
+from player_factory import player_factory, player_names as registered_player_names
+from seed_sequence import SeedStream
+from simulator import Simulator
+from table import Table
+from wheel import Wheel
+from players.passenger57 import Passenger57
+
+
+class Measurement(TypedDict):
+    """
+    The rate of one measurement, in operations per second, and the name of its unit.
+    """
+
+    rate: float
+    unit: str
+
+
+Results = dict[str, Measurement]
+
+
+class Benchmark:
+    """
+    :class:`Benchmark` measures the speed of the simulation hot path: building the bins, spinning
+    the wheel, cycling a game and computing statistics, and playing whole sessions with each of the
+    strategies of :func:`player_factory`.
+
+    Each measurement is repeated **repeat** times and the fastest run is kept, since the slower
+    runs only measure interference from the rest of the machine. The results are rates, in
+    operations per second, so a larger number is always better.
+
+    .. attribute:: repeat
+
+       The number of times each measurement is repeated.
+
+    .. attribute:: builds
+
+       The number of wheels built when timing **BinBuilder.buildBins()**.
+
+    .. attribute:: spins
+
+       The number of spins, cycles or values used when timing **Wheel.choose()**,
+       **Game.cycle()** and :class:`IntegerStatistics`.
+
+    .. attribute:: sessions
+
+       The number of sessions played by each strategy.
+
+    .. attribute:: startups
+
+       The number of times the interpreter is started when timing the import of the
+       :mod:`roulette` command.
+
+    .. attribute:: seed
+
+       The master seed of the random number generators of the wheel and of the players, so that
+       every run plays the same spins and places the same bets.
+
+    .. attribute:: results
+
+       A **dict** that maps the name of each measurement to its **rate** and its **unit**.
+    """
+
+    def __init__(self, seed: int = 1) -> None:
+        """
+        :param seed: The master seed of the random number generators.
+        """
+
+        self.repeat = 3
+        self.builds = 20
+        self.spins = 20_000
+        self.sessions = 50
+        self.startups = 5
+        self.seed = seed
+        self.results: Results = {}
+
+    def best(self, action: Callable[[], int]) -> tuple[int, float]:
+        """
+        Runs the action **repeat** times.
+
+        :param action: a function which does the work to be timed and returns the number of
+                       operations it did.
+        :return: the number of operations and the elapsed seconds of the fastest run.
+        """
+
+        fastest = (0, math.inf)
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            count = action()
+            elapsed = time.perf_counter() - start
+            if elapsed < fastest[1]:
+                fastest = (count, elapsed)
+        return fastest
+
+    def record(self, name: str, count: int, seconds: float, unit: str) -> None:
+        """
+        Saves the rate of a measurement in **results**.
+
+        :param name: the name of the measurement.
+        :param count: the number of operations.
+        :param seconds: the time they took.
+        :param unit: the name of the rate’s unit, such as :samp:`"spins/s"`.
+        """
+
+        self.results[name] = {"rate": count / max(seconds, 1e-9), "unit": unit}
+
+    def run(self, player_names: Optional[list[str]] = None) -> Results:
+        """
+        Runs every measurement.
+
+        :param player_names: the strategies to play sessions with. By default, every
+                             registered player, as listed by :func:`player_names`.
+        :return: the **results**.
+        """
+
+        self.buildBins()
+        self.choose()
+        self.cycle()
+        self.statistics()
+        self.startup()
+        for player_name in (
+            registered_player_names() if player_names is None else player_names
+        ):
+            self.play(player_name)
+        return self.results
+
+    def buildBins(self) -> None:
+        """
+        Times **BinBuilder.buildBins()** on new wheels.
+        """
+
+        def build() -> int:
+            for _ in range(self.builds):
+                BinBuilder().buildBins(Wheel())
+            return self.builds
+
+        self.record("BinBuilder.buildBins", *self.best(build), "wheels/s")
+
+    def choose(self) -> None:
+        """
+        Times **Wheel.choose()**.
+        """
+
+        wheel = american_wheel()
+        SeedStream(self.seed).seed(wheel)
+
+        def spin() -> int:
+            for _ in range(self.spins):
+                wheel.choose()
+            return self.spins
+
+        self.record("Wheel.choose", *self.best(spin), "spins/s")
+
+    def cycle(self) -> None:
+        """
+        Times **Game.cycle()** with a :py:class:`~players.passenger57.Passenger57`, who places one
+        bet per cycle.
+        """
+
+        wheel = american_wheel()
+        SeedStream(self.seed).seed(wheel)
+        table = Table()
+        game = Game(wheel, table)
+        player = Passenger57(table, wheel)
+
+        def play() -> int:
+            for _ in range(self.spins):
+                table.clear()
+                game.cycle(player)
+            return self.spins
+
+        self.record("Game.cycle", *self.best(play), "cycles/s")
+
+    def startup(self) -> None:
+        """
+        Times starting a new interpreter and importing the :mod:`roulette` command, which is what
+        every short command-line run pays before simulating anything.
+        """
+
+        source = os.path.dirname(os.path.abspath(__file__))
+        path = os.environ.get("PYTHONPATH")
+        env = dict(
+            os.environ,
+            PYTHONPATH=source if not path else os.pathsep.join((source, path)),
+        )
+
+        def start() -> int:
+            for _ in range(self.startups):
+                subprocess.run(
+                    [sys.executable, "-c", "import roulette"], env=env, check=True
+                )
+            return self.startups
+
+        self.record("roulette startup", *self.best(start), "starts/s")
+
+    def statistics(self) -> None:
+        """
+        Times the **mean()** and **stdev()** of an :class:`IntegerStatistics`.
+        """
+
+        values = IntegerStatistics(range(self.spins))
+
+        def summarize() -> int:
+            values.mean()
+            values.stdev()
+            return len(values)
+
+        self.record("IntegerStatistics", *self.best(summarize), "values/s")
+
+    def play(self, player_name: str) -> None:
+        """
+        Times **sessions** sessions of a strategy, and records both the sessions per second and the
+        spins per second.
+
+        :param player_name: name of the player, as accepted by :func:`player_factory`.
+        """
+
+        wheel = american_wheel()
+        table = Table()
+        game = Game(wheel, table)
+
+        def sessions() -> int:
+            player = player_factory(player_name, table, wheel)
+            SeedStream(self.seed).seed(wheel, player)
+            simulator = Simulator(game, player)
+            return sum(len(simulator.session()) for _ in range(self.sessions))
+
+        spins, seconds = self.best(sessions)
+        self.record(f"{player_name} sessions", self.sessions, seconds, "sessions/s")
+        self.record(f"{player_name} spins", spins, seconds, "spins/s")
+
+    def write(self, path: str) -> None:
+        """
+        Writes the **results** to a JSON file, along with the Python version they were measured
+        with.
+
+        :param path: the name of the file.
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"python": platform.python_version(), "results": self.results},
+                file,
+                indent=2,
+            )
+
+
+def load(path: str) -> Results:
+    """
+    Reads results written by **Benchmark.write()**.
+
+    :param path: the name of the file.
+    :return: the results.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        results: Results = json.load(file)["results"]
+    return results
+
+
+def compare(
+    baseline: Results, results: Results, tolerance: float = 0.2
+) -> list[tuple[str, float, float]]:
+    """
+    Finds the measurements which are slower than the baseline by more than the tolerance.
+    Measurements missing from either set of results are ignored.
+
+    :param baseline: the stored results.
+    :param results: the new results.
+    :param tolerance: the fraction of the baseline rate which may be lost before a measurement is
+                      flagged, to allow for noise.
+    :return: list of ``(name, baseline rate, rate)`` triples, one per regression.
+    """
+
+    return [
+        (name, baseline[name]["rate"], result["rate"])
+        for name, result in results.items()
+        if name in baseline
+        and result["rate"] < baseline[name]["rate"] * (1 - tolerance)
+    ]
+
+
+@click.command()
+@click.option(
+    "--output", default="benchmark.json", help="File to write the results to."
+)
+@click.option("--baseline", default=None, help="Results to compare against.")
+@click.option("--tolerance", default=0.2, help="Fraction of a rate which may be lost.")
+@click.option("--player", "players", multiple=True, help="Strategy to benchmark.")
+def main(output, baseline, tolerance, players) -> None:  # pragma: no cover
+    """
+    Runs the benchmarks, writes the results and, given a baseline, exits with status 1 if any
+    measurement regressed.
+    """
+    benchmark = Benchmark()
+    benchmark.run(list(players) or None)
+    benchmark.write(output)
+    for name, result in benchmark.results.items():
+        print(f"{name:30} {result['rate']:14,.0f} {result['unit']}")
+
+    if baseline is not None:
+        regressions = compare(load(baseline), benchmark.results, tolerance)
+        for name, old_rate, new_rate in regressions:
+            print(f"REGRESSION {name}: {old_rate:,.0f} -> {new_rate:,.0f}")
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()  # pylint: disable=no-value-for-parameter
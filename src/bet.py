@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from outcome import Outcome
 
 
-@dataclass
+@dataclass(slots=True)
 class Bet:
     """
     :class:`Bet` associates an amount and an :class:`Outcome`. In a future round of design, we can
@@ -15,6 +15,9 @@ class Bet:
     .. attribute:: outcome
 
         The :class:`Outcome` on which the bet is placed.
+
+    The class uses **__slots__**, so an instance holds only its amount and outcome, without a
+    **__dict__**.
     """
 
     amount: int
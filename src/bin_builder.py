@@ -1,3 +1,4 @@
+from functools import lru_cache
 from outcome import Outcome
 from wheel import Wheel
 
@@ -18,12 +19,14 @@ class BinBuilder:
         Creates the :class:`Outcome` instances and uses the **addOutcome()** method to place each
         :class:`Outcome` in the appropriate Bin of wheel.
 
-        It’s then the :class:`Bin` instances responsibility to update the data structure used to
-        store the :class:`Outcome` instances.
+        The wheel collects the :class:`Outcome` instances in mutable sets while they are being
+        placed and freezes them into :class:`Bin` instances at the end. Once every
+        :class:`Outcome` is placed, the wheel’s payout matrix is built.
 
         :param wheel: The Wheel with Bins that must be populated with :class:`Outcome` instances.
         :type wheel: :class:`Wheel`
         """
+        wheel.startBuild()
         self.build_bins_for_straight_bets(wheel)
         self.build_bins_for_horizontal_split_bets(wheel)
         self.build_bins_for_vertical_split_bets(wheel)
@@ -34,6 +37,8 @@ class BinBuilder:
         self.build_bins_for_even_money_bets(wheel)
         self.build_bins_for_dozen_bets(wheel)
         self.build_bins_for_column_bets(wheel)
+        wheel.finishBuild()
+        wheel.buildPayoutMatrix()
 
     @staticmethod
     def build_bins_for_straight_bets(wheel: Wheel) -> None:
@@ -373,3 +378,26 @@ class BinBuilder:
 
             for bin_number in range(12):
                 wheel.addOutcome(3 * bin_number + column + 1, column_bet_outcome)
+
+
+@lru_cache(maxsize=None)
+def _american_layout() -> Wheel:
+    """
+    Builds the bins of an American wheel once per process. The result is cached and only used as
+    a layout to share, never spun.
+    """
+
+    wheel = Wheel()
+    BinBuilder().buildBins(wheel)
+    return wheel
+
+
+def american_wheel() -> Wheel:
+    """
+    Returns a new :class:`Wheel` with its own random number generator, sharing the immutable bins,
+    outcomes and payout matrix of a cached, prebuilt American wheel instead of building them again.
+    """
+
+    wheel = Wheel()
+    wheel.useLayout(_american_layout())
+    return wheel
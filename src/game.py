@@ -1,3 +1,4 @@
+from bin import Bin
 from wheel import Wheel
 from table import Table
 from players.player import Player
@@ -36,7 +37,7 @@ class Game:
         self.wheel = wheel
         self.table = table
 
-    def cycle(self, player: Player) -> None:
+    def cycle(self, player: Player) -> bool:
         """
         :param player: the individual player that places bets, receives winnings and pays losses.
 
@@ -49,11 +50,82 @@ class Game:
            For each :class:`Bet` instance, if the winning :class:`Bin` contains the
            :class:`Outcome`, call **Player.win()** method, otherwise, call the
            **Player.lose()** method.
+
+        If, after step 1, **Player.validBets()** reports that the player’s bets are invalid, the
+        wheel is not spun and nothing is resolved: a status is returned, rather than an exception
+        raised. Only the players which check the table limit report invalid bets.
+
+        Each step is a method of its own, **placeBets()**, **spin()** and **settle()**, so a
+        subclass such as :class:`ProfiledGame` can wrap a step without repeating the cycle.
+
+        :return: :samp:`True` if the cycle was played, :samp:`False` if the bets were invalid.
+        """
+
+        if not self.placeBets(player):
+            return False
+        self.settle(player, self.spin())
+        return True
+
+    def placeBets(self, player: Player) -> bool:
+        """
+        Step 1 of **cycle()**: asks the player to place their bets.
+
+        :param player: the individual player who bets.
+        :return: **Player.validBets()**, whether the bets placed are valid.
         """
 
         player.placeBets()
-        winning_bin = self.wheel.choose()
-        player.winners(set(winning_bin))
+        return player.validBets()
+
+    def spin(self) -> Bin:
+        """
+        Step 2 of **cycle()**: spins the wheel.
+
+        :return: the winning :class:`Bin` from **Wheel.choose()**.
+        """
+
+        return self.wheel.choose()
+
+    def settle(self, player: Player, winning_bin: Bin) -> None:
+        """
+        Resolves the :class:`Bet` instances on the :class:`Table` against a winning :class:`Bin`
+        chosen elsewhere. This is steps 2 and 3 of **cycle()** without spinning the wheel, so that
+        one spin can be shared by several players.
+
+        :param player: the individual player whose bets are resolved.
+        :param winning_bin: the winning :class:`Bin`.
+        """
+
+        self.notify(player, winning_bin)
+        self.resolve(player, winning_bin)
+
+    def notify(self, player: Player, winning_bin: Bin) -> None:
+        """
+        Tells the player the winning :class:`Bin` with **Player.winners()**, whether or not they
+        placed bets on it.
+
+        :param player: the individual player to notify.
+        :param winning_bin: the winning :class:`Bin`.
+        """
+
+        player.winners(winning_bin)
+
+    def resolve(self, player: Player, winning_bin: Bin) -> None:
+        """
+        Resolves each :class:`Bet` instance on the :class:`Table`: if the winning :class:`Bin`
+        contains its :class:`Outcome`, call **Player.win()**, otherwise, call **Player.lose()**.
+
+        Each bet is resolved by a lookup of its interned :class:`Outcome` in the :class:`Bin`,
+        rather than in **Wheel.payouts**: the matrix needs the number of the winning bin and the
+        wheel’s id of the outcome, which is one more dictionary lookup per bet, and the
+        :class:`Bin` here may be chosen elsewhere, as by :class:`MultiSeatGame`. The matrix is
+        for the vectorized path, :class:`VectorizedSimulator`, which resolves whole sessions at
+        once.
+
+        :param player: the individual player whose bets are resolved.
+        :param winning_bin: the winning :class:`Bin`.
+        """
+
         for bet in self.table:
             if bet.outcome in winning_bin:
                 player.win(bet)
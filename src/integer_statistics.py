@@ -23,3 +23,20 @@ class IntegerStatistics(list):
 
         mean = self.mean()
         return round(math.sqrt(sum((x - mean) ** 2 for x in self) / (len(self) - 1)), 3)
+
+    def halfWidth(self, confidence: float = 0.95) -> float:
+        """
+        Computes the half-width of the normal-approximation confidence interval on the mean: the
+        mean lies within this distance of **mean()** with the given confidence. Fewer than two
+        values give an infinite half-width.
+
+        :param confidence: the confidence level, between zero and one.
+        """
+
+        if len(self) < 2:
+            return math.inf
+        # pylint: disable-next=import-outside-toplevel
+        from statistics import NormalDist
+
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        return z * self.stdev() / math.sqrt(len(self))
@@ -0,0 +1,369 @@
+import math
+from collections import defaultdict
+from typing import Any, Hashable, Optional
+import numpy as np
+from game import Game
+from invalid_bet import InvalidBet
+from spin_stream import SpinGenerator, SpinStream
+from wheel import Wheel
+from players.player import Player
+
+StrategyState = tuple[Hashable, ...]
+Transitions = Optional[list[tuple[float, int, StrategyState]]]
+
+
+class Distribution(dict[int, float]):
+    """
+    :class:`Distribution` maps each possible int value to its probability.
+
+    This extends **dict** with the same summary methods as :class:`IntegerStatistics`, so that an
+    exact distribution can be compared with the values gathered by a :class:`Simulator`.
+    """
+
+    def mean(self) -> float:
+        """
+        Computes the expected value.
+        """
+
+        return sum(value * probability for value, probability in self.items())
+
+    def stdev(self) -> float:
+        """
+        Computes the standard deviation, rounded like **IntegerStatistics.stdev()**.
+        """
+
+        mean = self.mean()
+        variance = sum(
+            (value - mean) ** 2 * probability for value, probability in self.items()
+        )
+        return round(math.sqrt(variance), 3)
+
+
+class _FixedSpin(SpinGenerator):
+    """
+    Draws the same bin index over and over, so that a :class:`Game` cycle can be played against
+    each bin in turn.
+    """
+
+    def __init__(self, bins: int) -> None:
+        super().__init__(bins)
+        self.index = 0
+
+    def draw(self, size: int) -> list[int]:
+        return [self.index] * size
+
+
+class MarkovEvaluator:  # pylint: disable=too-many-instance-attributes
+    """
+    :class:`MarkovEvaluator` computes the exact distributions of the duration and of the maximum
+    stake of a session, for a player whose betting strategy is a finite-state system described by
+    its **stateAttributes**.
+
+    A state of the session is the player’s stake and strategy state, together with the highest
+    stake seen so far. The transitions out of each strategy state are found by playing one
+    :class:`Game` cycle against each of the bins of the wheel, and the probability of every state
+    is carried forward one round at a time until the rounds to go run out.
+
+    The player’s bets must depend only on its strategy state, not on its stake, as they do for the
+    betting systems in :py:mod:`players`.
+
+    .. attribute:: player
+
+       The :class:`Player` to evaluate.
+
+    .. attribute:: wheel
+
+       The :class:`Wheel` whose bins are all equally likely.
+
+    .. attribute:: initDuration
+
+       The duration value to use when initializing the session.
+
+    .. attribute:: initStake
+
+       The stake value to use when initializing the session.
+
+    .. attribute:: maxStates
+
+       The largest number of (stake, strategy state) pairs to explore. A player whose bets aren’t
+       capped, such as :py:class:`~players.fibonacci.PlayerFibonacci`, can reach so many different
+       stakes over a long session that an exact evaluation is out of reach; a :class:`ValueError`
+       is raised instead.
+
+    .. attribute:: durations
+
+       The :class:`Distribution` of the lengths of time the :class:`Player` remained in the game.
+
+    .. attribute:: maxima
+
+       The :class:`Distribution` of the maximum stakes of the :class:`Player`. As in
+       **Simulator.gather()**, a session which ends before the first cycle has the initial stake as
+       its maximum.
+    """
+
+    def __init__(self, player: Player, wheel: Wheel) -> None:
+        """
+        :param player: The player to evaluate. Its current strategy state is the initial state.
+        :param wheel: The wheel, with its bins already built.
+        """
+
+        if player.stateAttributes is None:
+            raise ValueError(
+                f"{type(player).__name__} does not describe its betting state"
+            )
+        self.player = player
+        self.wheel = wheel
+        self.initDuration = 250
+        self.initStake = 100
+        self.maxStates = 200_000
+        self.durations = Distribution()
+        self.maxima = Distribution()
+        self._spin = _FixedSpin(len(wheel.bins))
+        spin_wheel = Wheel()
+        spin_wheel.useLayout(wheel)
+        spin_wheel.useSpinStream(SpinStream(self._spin, blockSize=1))
+        self._game = Game(spin_wheel, player.table)
+        self._transitions: dict[tuple[int, StrategyState], Transitions] = {}
+        self._steps_by_strategy: dict[StrategyState, Transitions] = {}
+
+    def _snapshot(self) -> StrategyState:
+        """
+        Returns the strategy state of the player, with lists turned into tuples.
+        """
+
+        values = (getattr(self.player, name) for name in self._attributes())
+        return tuple(
+            tuple(value) if isinstance(value, list) else value for value in values
+        )
+
+    def _restore(self, stake: int, strategy: StrategyState) -> None:
+        """
+        Puts the player back into the given stake and strategy state.
+        """
+
+        self.player.stake = stake
+        self.player.roundsToGo = 1
+        self.player.table.clear()
+        for name, value in zip(self._attributes(), strategy):
+            restored: Any = list(value) if isinstance(value, tuple) else value
+            setattr(self.player, name, restored)
+
+    def _attributes(self) -> tuple[str, ...]:
+        return self.player.stateAttributes or ()
+
+    def transitions(self, stake: int, strategy: StrategyState) -> Transitions:
+        """
+        Returns the possible results of one cycle of play from the given stake and strategy state.
+
+        :param stake: the stake before the cycle.
+        :param strategy: the strategy state before the cycle.
+        :return: a list of ``(probability, stake, strategy)`` triples, or :samp:`None` if the
+                 session ends instead, either because the player stops playing or because the bet
+                 is invalid.
+        """
+
+        key = (stake, strategy)
+        if key not in self._transitions:
+            self._restore(stake, strategy)
+            steps = self._steps(stake, strategy) if self.player.playing() else None
+            self._transitions[key] = (
+                None
+                if steps is None
+                else [
+                    (probability, stake + change, next_strategy)
+                    for probability, change, next_strategy in steps
+                ]
+            )
+        return self._transitions[key]
+
+    def _steps(self, stake: int, strategy: StrategyState) -> Transitions:
+        """
+        Plays one cycle against each bin, and returns the probability of each change of stake and
+        next strategy state, or :samp:`None` if the bet is invalid.
+
+        The bets a betting system places depend on its strategy state, not on its stake, so the
+        result is computed once per strategy state. The stake only decides, through
+        **Player.playing()**, whether the player carries on.
+        """
+
+        if strategy in self._steps_by_strategy:
+            return self._steps_by_strategy[strategy]
+
+        outcomes: dict[tuple[int, StrategyState], float] = defaultdict(float)
+        probability = 1 / len(self.wheel.bins)
+        steps: Transitions = None
+        try:
+            for index in range(len(self.wheel.bins)):
+                self._restore(stake, strategy)
+                self._spin.index = index
+                if not self._game.cycle(self.player):
+                    break
+                outcomes[(self.player.stake - stake, self._snapshot())] += probability
+            else:
+                steps = [
+                    (probability, change, next_strategy)
+                    for (change, next_strategy), probability in outcomes.items()
+                ]
+        except InvalidBet:
+            steps = None
+        self._steps_by_strategy[strategy] = steps
+        return steps
+
+    def reachableStates(
+        self, strategy: StrategyState
+    ) -> list[tuple[int, StrategyState]]:
+        """
+        Lists every (stake, strategy state) pair the player can be in at the end of a cycle within
+        **initDuration** rounds.
+
+        :param strategy: the strategy state at the start of the session.
+        :return: list of (stake, strategy state) pairs.
+        """
+
+        frontier = {(self.initStake, strategy)}
+        reachable: set[tuple[int, StrategyState]] = set()
+        for _ in range(self.initDuration):
+            next_frontier = set()
+            for stake, state in frontier:
+                for _, next_stake, next_strategy in (
+                    self.transitions(stake, state) or []
+                ):
+                    next_frontier.add((next_stake, next_strategy))
+            reachable.update(next_frontier)
+            if len(reachable) > self.maxStates:
+                raise ValueError(
+                    f"{type(self.player).__name__} has more than {self.maxStates} states"
+                )
+            frontier = next_frontier
+        return list(reachable)
+
+    def evaluate(self) -> None:
+        """
+        Computes the **durations** and **maxima** distributions of a session.
+
+        The probabilities of the session’s states are kept in a matrix with one row per reachable
+        (stake, strategy state) pair and one column per possible highest stake, and carried forward
+        one round at a time. A state whose player stops playing ends the session with the number of
+        rounds played so far; after **initDuration** rounds, every remaining state ends the
+        session.
+        """
+
+        initial_stake = self.player.stake
+        initial_rounds = self.player.roundsToGo
+        initial_strategy = self._snapshot()
+        self.durations = Distribution()
+        self.maxima = Distribution()
+
+        first_transitions = self.transitions(self.initStake, initial_strategy)
+        if first_transitions is None:
+            self.durations[0] = 1.0
+            self.maxima[self.initStake] = 1.0
+        else:
+            self._carry(first_transitions, self.reachableStates(initial_strategy))
+
+        self._restore(initial_stake, initial_strategy)
+        self.player.roundsToGo = initial_rounds
+
+    def _carry(  # pylint: disable=too-many-locals
+        self,
+        first_transitions: list[tuple[float, int, StrategyState]],
+        states: list[tuple[int, StrategyState]],
+    ) -> None:
+        """
+        Carries the probabilities forward from the end of the first round to the end of the
+        session, recording the durations and maxima of the sessions as they end.
+        """
+
+        levels = sorted({stake for stake, _ in states})
+        alive, moves = self._moves(states, levels)
+        matrix = np.zeros((len(states), len(levels)))
+        state_index = {state: index for index, state in enumerate(states)}
+        for probability, next_stake, next_strategy in first_transitions:
+            row = state_index[(next_stake, next_strategy)]
+            matrix[row, levels.index(next_stake)] += probability
+
+        peaks = np.zeros(len(levels))
+        for rounds_played in range(1, self.initDuration):
+            rows = np.flatnonzero(matrix.any(axis=1))
+            ended = matrix[rows[~alive[rows]]]
+            if len(ended):
+                self._end(rounds_played, ended.sum())
+                peaks += ended.sum(axis=0)
+            matrix = self._advance(matrix, rows[alive[rows]], moves)
+
+        self._end(self.initDuration, matrix.sum())
+        peaks += matrix.sum(axis=0)
+        for index in np.flatnonzero(peaks):
+            self.maxima[levels[index]] = float(peaks[index])
+
+    def _moves(  # pylint: disable=too-many-locals
+        self, states: list[tuple[int, StrategyState]], levels: list[int]
+    ) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Tabulates the transitions out of every reachable state: whether the player carries on, and
+        for each possible result of a cycle, its probability, the index of the state it leads to
+        and the index of its stake in **levels**. Results are stored in slots, one row of the tables
+        per slot.
+        """
+
+        state_index = {state: index for index, state in enumerate(states)}
+        level_index = {stake: index for index, stake in enumerate(levels)}
+        transitions = [self.transitions(stake, strategy) for stake, strategy in states]
+        slots = max((len(results or []) for results in transitions), default=0)
+        alive = np.array([results is not None for results in transitions])
+        probabilities = np.zeros((slots, len(states)))
+        targets = np.zeros((slots, len(states)), dtype=np.intp)
+        target_levels = np.zeros((slots, len(states)), dtype=np.intp)
+        for index, results in enumerate(transitions):
+            for slot, (probability, next_stake, next_strategy) in enumerate(
+                results or []
+            ):
+                probabilities[slot, index] = probability
+                targets[slot, index] = state_index.get((next_stake, next_strategy), 0)
+                target_levels[slot, index] = level_index.get(next_stake, 0)
+        return alive, (probabilities, targets, target_levels)
+
+    def _advance(
+        self,
+        matrix: np.ndarray,
+        rows: np.ndarray,
+        moves: tuple[np.ndarray, np.ndarray, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Plays one round from each of the given rows of the matrix, and returns the matrix of
+        probabilities at the end of the round.
+        """
+
+        probabilities, targets, target_levels = moves
+        current = matrix[rows]
+        advanced = np.zeros_like(matrix)
+        for slot, taken in enumerate(probabilities[:, rows] > 0):
+            used = rows[taken]
+            moved = self._move(current[taken], target_levels[slot, used])
+            moved *= probabilities[slot, used, np.newaxis]
+            np.add.at(advanced, targets[slot, used], moved)
+        return advanced
+
+    @staticmethod
+    def _move(current: np.ndarray, new_levels: np.ndarray) -> np.ndarray:
+        """
+        Moves each row of highest stake probabilities to a new stake: the probability of every
+        highest stake below the new stake is collapsed into the column of the new stake.
+        """
+
+        columns = np.arange(current.shape[1])
+        moved = np.where(columns > new_levels[:, np.newaxis], current, 0.0)
+        below = np.cumsum(current, axis=1)
+        moved[np.arange(len(new_levels)), new_levels] = below[
+            np.arange(len(new_levels)), new_levels
+        ]
+        return moved
+
+    def _end(self, duration: int, probability: float) -> None:
+        """
+        Records the probability of a session ending with the given duration.
+        """
+
+        self.durations[duration] = self.durations.get(duration, 0.0) + float(
+            probability
+        )
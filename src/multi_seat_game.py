@@ -0,0 +1,90 @@
+from typing import Optional
+from bin import Bin
+from game import Game
+from invalid_bet import InvalidBet
+from wheel import Wheel
+from players.player import Player
+
+
+class MultiSeatGame:
+    """
+    :class:`MultiSeatGame` is a game of Roulette with several seated players. Each cycle spins the
+    :class:`Wheel` once, and every seated player’s bets are resolved against that one
+    :class:`Bin`, so several strategies can be compared on the same spins without spinning the
+    wheel once for each of them.
+
+    Each player bets at their own :class:`Table`, and keeps their own stake and **roundsToGo**. A
+    player who stops playing, or places an invalid bet, leaves their seat; the others carry on.
+
+    .. attribute:: wheel
+
+       The :class:`Wheel` instance that returns a randomly selected :class:`Bin` object of
+       :class:`Outcome` instances.
+
+    .. attribute:: seats
+
+       The **list** of :class:`Player` objects still in the game, in the order they sat down.
+
+    .. attribute:: stakeValues
+
+       A **dict** mapping each player who sat down to the **list** of their stakes after each
+       cycle they played.
+    """
+
+    def __init__(self, wheel: Wheel) -> None:
+        """
+        :param wheel: The :class:`Wheel` instance which produces random events
+        """
+
+        self.wheel = wheel
+        self.seats: list[Player] = []
+        self.stakeValues: dict[Player, list[int]] = {}
+        self._games: dict[Player, Game] = {}
+
+    def sit(self, player: Player) -> None:
+        """
+        Seats a player, who bets at their own :class:`Table`.
+
+        :param player: the player.
+        """
+
+        self.seats.append(player)
+        self.stakeValues[player] = []
+        self._games[player] = Game(self.wheel, player.table)
+
+    def cycle(self, winning_bin: Optional[Bin] = None) -> None:
+        """
+        Executes a single cycle of play for every seated player:
+
+        1. Clear each player’s :class:`Table` and call **Player.placeBets()**. A player who is
+           no longer playing, is absorbed, or whose bets are invalid, leaves their seat.
+        2. If anyone is still seated, call **Wheel.choose()** once to get the winning
+           :class:`Bin`, unless one is given.
+        3. Resolve every seated player’s bets against that :class:`Bin` with **Game.settle()**,
+           record their stake and count down their **roundsToGo**.
+
+        :param winning_bin: the winning :class:`Bin`, for replaying known spins. By default the
+                            wheel is spun.
+        """
+
+        betting = []
+        for player in self.seats:
+            player.table.clear()
+            if not player.playing() or player.absorbed():
+                continue
+            try:
+                player.placeBets()
+            except InvalidBet:
+                continue
+            if not player.validBets():
+                continue
+            betting.append(player)
+        self.seats = betting
+        if not self.seats:
+            return
+        if winning_bin is None:
+            winning_bin = self.wheel.choose()
+        for player in self.seats:
+            self._games[player].settle(player, winning_bin)
+            self.stakeValues[player].append(player.stake)
+            player.roundsToGo -= 1
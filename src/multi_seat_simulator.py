@@ -0,0 +1,109 @@
+from integer_statistics import IntegerStatistics
+from multi_seat_game import MultiSeatGame
+from player_factory import player_factory
+from table import Table
+from wheel import Wheel
+
+
+class MultiSeatSimulator:
+    """
+    :class:`MultiSeatSimulator` gathers the same raw statistics as :class:`Simulator` for several
+    players at once, seated at a :class:`MultiSeatGame`, so every session spins the wheel once per
+    cycle whatever the number of players. A fresh :class:`Player` is built for every session
+    through :func:`player_factory`.
+
+    .. attribute:: playerNames
+
+       The names of the players, as accepted by :func:`player_factory`. The results are keyed by
+       name, so each player can only be seated once.
+
+    .. attribute:: wheel
+
+       The :class:`Wheel` spun for every player.
+
+    .. attribute:: initDuration
+
+       The number of rounds each session is allowed to last.
+
+    .. attribute:: initStake
+
+       The stake each session starts with.
+
+    .. attribute:: samples
+
+       The number of game sessions to simulate.
+
+    .. attribute:: durations
+
+       A **dict** mapping each player name to the :class:`IntegerStatistics` of the lengths of
+       its sessions.
+
+    .. attribute:: maxima
+
+       A **dict** mapping each player name to the :class:`IntegerStatistics` of the maximum
+       stakes of its sessions.
+    """
+
+    def __init__(self, playerNames: list[str], wheel: Wheel) -> None:
+        """
+        :param playerNames: The names of the players.
+        :param wheel: The wheel spun for every player.
+        :raises ValueError: if a name is repeated.
+        """
+
+        if len(set(playerNames)) != len(playerNames):
+            raise ValueError("Each player can only be seated once")
+        self.playerNames = playerNames
+        self.wheel = wheel
+        self.initDuration = 250
+        self.initStake = 100
+        self.samples = 50
+        self.durations = {name: IntegerStatistics() for name in playerNames}
+        self.maxima = {name: IntegerStatistics() for name in playerNames}
+
+    def seat(self) -> MultiSeatGame:
+        """
+        Returns a new :class:`MultiSeatGame` with a fresh player of each name seated, each at
+        their own :class:`Table` and with their initial stake and cycles to go.
+        """
+
+        game = MultiSeatGame(self.wheel)
+        for name in self.playerNames:
+            player = player_factory(name, Table(), self.wheel)
+            player.stake = self.initStake
+            player.roundsToGo = self.initDuration
+            game.sit(player)
+        return game
+
+    def session(self) -> dict[str, list[int]]:
+        """
+        Executes a single game session for every player. The game cycles until every player has
+        left their seat.
+
+        :return: a **dict** mapping each player name to the **list** of their stake values.
+        """
+
+        game = self.seat()
+        while game.seats:
+            game.cycle()
+        return dict(zip(self.playerNames, game.stakeValues.values()))
+
+    def record(self, stake_values: dict[str, list[int]]) -> None:
+        """
+        Appends the duration and maximum stake of every player’s session to their **durations**
+        and **maxima**.
+
+        :param stake_values: the result of a session.
+        """
+
+        for name, values in stake_values.items():
+            self.durations[name].append(len(values))
+            self.maxima[name].append(max(values, default=self.initStake))
+
+    def gather(self) -> None:
+        """
+        Executes the number of game sessions in samples and records each.
+        """
+
+        for _ in range(self.samples):
+            self.record(self.session())
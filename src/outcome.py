@@ -1,7 +1,8 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Outcome:
     """
     :class:`Outcome` contains a single outcome on which a bet can be placed.
@@ -24,10 +25,35 @@ class Outcome:
         Holds the payout odds for this Outcome. Most odds are stated as 1:1 or 17:1, we only keep
         the numerator (17) and assume the denominator is 1.
 
+    Outcomes are compared by value, so any two instances with the same name and odds are equal.
+    **Outcome.intern()** hands out one shared instance per name and odds instead, so that players
+    don’t create a new :class:`Outcome` on every spin, and a lookup in a :class:`Bin` finds the
+    very same object.
+
+    The class uses **__slots__**, so an instance holds only its name and odds, without a
+    **__dict__**.
     """
 
     name: str
     odds: int
+    _registry: ClassVar[dict[tuple[str, int], "Outcome"]] = {}
+
+    @classmethod
+    def intern(cls, name: str, odds: int) -> "Outcome":
+        """
+        Returns the shared :class:`Outcome` with the given name and odds, creating it the first
+        time it is asked for.
+
+        :param name: the name of the outcome.
+        :param odds: the payout odds of the outcome.
+        :return: the shared outcome.
+        """
+
+        key = (name, odds)
+        outcome = cls._registry.get(key)
+        if outcome is None:
+            outcome = cls._registry[key] = cls(name, odds)
+        return outcome
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,250 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, NamedTuple, Optional, Sequence
+from bin_builder import american_wheel
+from game import Game
+from integer_statistics import IntegerStatistics
+from player_factory import player_factory, player_reference
+from seed_sequence import SeedStream
+from simulator import Simulator
+from table import Table
+
+
+def run_sessions(
+    player_name: str,
+    initStake: int,
+    initDuration: int,
+    seeds: list[int],
+    limit: Optional[int] = None,
+) -> list[tuple[int, int]]:
+    """
+    Executes one game session for each of the given seeds and returns the duration and maximum
+    stake of every session, in the order of the seeds.
+
+    This is the unit of work handed to a worker process. The worker gets its own :class:`Wheel`,
+    sharing the cached American layout, and its own :class:`Table` and :class:`Game`. A fresh
+    :class:`Player` is built through :func:`player_factory` for every session, so no betting state
+    leaks from one session into the next. Each seed is the master seed of a :class:`SeedStream`,
+    from which the independent random number streams of the wheel and, if it has one, of the
+    player are spawned.
+
+    :param player_name: name or reference of the player, as accepted by :func:`player_factory`.
+    :param initStake: the stake each session starts with.
+    :param initDuration: the number of rounds each session is allowed to last.
+    :param seeds: one seed per session.
+    :param limit: the table limit. If omitted, the :class:`Table`’s own limit is kept.
+    :return: list of ``(duration, maximum)`` pairs. A session which ends before its first round
+             has a duration of zero, and its maximum is the initial stake.
+    """
+
+    wheel = american_wheel()
+    table = Table()
+    if limit is not None:
+        table.limit = limit
+    game = Game(wheel, table)
+    results = []
+    for seed in seeds:
+        player = player_factory(player_name, table, wheel)
+        SeedStream(seed).seed(wheel, player)
+        simulator = Simulator(game, player)
+        simulator.initStake = initStake
+        simulator.initDuration = initDuration
+        stake_values = simulator.session()
+        results.append((len(stake_values), max(stake_values, default=initStake)))
+    return results
+
+
+class SessionJob(NamedTuple):
+    """
+    :class:`SessionJob` is a set of sessions of one player, one per seed, with the arguments of
+    :func:`run_sessions` in the same order.
+    """
+
+    playerName: str
+    initStake: int
+    initDuration: int
+    seeds: list[int]
+    limit: Optional[int] = None
+
+
+def run_jobs(
+    jobs: Sequence[SessionJob], workers: int = 1, chunkSize: int = 64
+) -> Iterator[tuple[int, list[tuple[int, int]]]]:
+    """
+    Plays the sessions of every job, and yields each job as soon as all its sessions are over.
+
+    The seeds of all the jobs are split into chunks of at most **chunkSize** and spread over
+    **workers** processes, so a single job is parallelized as well as several. Each worker builds
+    the American wheel layout once. The workers are given the player’s :samp:`"module:Class"`
+    reference rather than its name, so players registered only in this process can be built there
+    too. The results of a job are merged back in the order of its seeds, so they don’t depend on
+    the number of workers.
+
+    :param jobs: the jobs.
+    :param workers: the number of worker processes. With a single worker, the sessions are played
+                    in the current process, and the jobs are yielded in order.
+    :param chunkSize: the largest number of sessions handed to a worker at a time.
+    :return: an iterator over the index of each job and its ``(duration, maximum)`` pairs, as
+             returned by :func:`run_sessions`.
+    """
+
+    if workers < 1:
+        raise ValueError("The number of workers must be at least 1")
+    tasks = _split(jobs, chunkSize)
+    chunks: list[dict[int, list[tuple[int, int]]]] = [{} for _ in jobs]
+    remaining = [0] * len(jobs)
+    for index, _, _ in tasks:
+        remaining[index] += 1
+    for index, count in enumerate(remaining):
+        if count == 0:
+            yield index, []
+
+    def merge(
+        index: int, position: int, results: list[tuple[int, int]]
+    ) -> Optional[list[tuple[int, int]]]:
+        chunks[index][position] = results
+        remaining[index] -= 1
+        if remaining[index]:
+            return None
+        return [
+            session
+            for position in sorted(chunks[index])
+            for session in chunks[index][position]
+        ]
+
+    if workers == 1:
+        for index, position, job in tasks:
+            merged = merge(index, position, run_sessions(*job))
+            if merged is not None:
+                yield index, merged
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=american_wheel
+    ) as executor:
+        futures = {
+            executor.submit(run_sessions, *job): (index, position)
+            for index, position, job in tasks
+        }
+        for future in as_completed(futures):
+            merged = merge(*futures[future], future.result())
+            if merged is not None:
+                yield futures[future][0], merged
+
+
+def _split(
+    jobs: Sequence[SessionJob], chunkSize: int
+) -> list[tuple[int, int, SessionJob]]:
+    """
+    Splits the jobs into chunks of at most **chunkSize** seeds, each with the index of its job and
+    its position in the job, and the player’s name replaced by its reference.
+    """
+
+    tasks = []
+    for index, job in enumerate(jobs):
+        reference = player_reference(job.playerName)
+        for position, start in enumerate(range(0, len(job.seeds), chunkSize)):
+            chunk = job._replace(
+                playerName=reference, seeds=job.seeds[start : start + chunkSize]
+            )
+            tasks.append((index, position, chunk))
+    return tasks
+
+
+class ParallelSimulator:  # pylint: disable=too-many-instance-attributes
+    """
+    :class:`ParallelSimulator` gathers the same raw statistics as :class:`Simulator`, but spreads
+    the sessions over a pool of worker processes.
+
+    Every session gets its own seed, spawned from a :class:`SeedStream` of the master seed.
+    Sessions are handed to the workers in contiguous chunks and the results are merged back in
+    session order, so for a fixed master **seed** the **durations** and **maxima** are the same
+    whatever the number of **workers**.
+
+    .. attribute:: playerName
+
+       The name of the player to simulate, as accepted by :func:`player_factory`.
+
+    .. attribute:: workers
+
+       The number of worker processes. With a single worker, the sessions are run in the current
+       process.
+
+    .. attribute:: seed
+
+       The master seed. If it is :samp:`None`, it is drawn from the operating system by
+       **sessionSeeds()** and kept here, so the run can be reproduced.
+
+    .. attribute:: chunkSize
+
+       The number of sessions handed to a worker at a time.
+
+    .. attribute:: initDuration
+
+       The duration value to use when initializing a :class:`Player` instance for a session.
+
+    .. attribute:: initStake
+
+       The stake value to use when initializing a :class:`Player` instance for a session.
+
+    .. attribute:: samples
+
+       The number of game sessions to simulate.
+
+    .. attribute:: durations
+
+       A **list** of lengths of time the :class:`Player` object remained in the game.
+
+    .. attribute:: maxima
+
+       A **list** of maximum stakes for the :class:`Player` object.
+    """
+
+    def __init__(
+        self, player_name: str, workers: int = 1, seed: Optional[int] = None
+    ) -> None:
+        """
+        Saves the player name, the number of workers and the master seed.
+
+        :param player_name: The name of the player to simulate.
+        :param workers: The number of worker processes.
+        :param seed: The master seed.
+        """
+
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        self.playerName = player_name
+        self.workers = workers
+        self.seed = seed
+        self.samples = 50
+        self.chunkSize = 64
+        self.initStake = 100
+        self.initDuration = 250
+        self.durations = IntegerStatistics()
+        self.maxima = IntegerStatistics()
+
+    def sessionSeeds(self) -> list[int]:
+        """
+        Spawns one seed for each of the **samples** sessions from the master seed, drawing the
+        master seed first if there is none.
+
+        :return: list of session seeds.
+        :rtype: list
+        """
+
+        master = SeedStream(self.seed)
+        self.seed = master.entropy
+        return master.integers(self.samples)
+
+    def gather(self) -> None:
+        """
+        Executes the number of game sessions in samples, spread over **workers** processes by
+        :func:`run_jobs`, and appends the duration and maximum stake of each session to the
+        **durations** list and the **maxima** list.
+        """
+
+        job = SessionJob(
+            self.playerName, self.initStake, self.initDuration, self.sessionSeeds()
+        )
+        for _, results in run_jobs([job], self.workers, self.chunkSize):
+            for duration, maximum in results:
+                self.durations.append(duration)
+                self.maxima.append(maximum)
@@ -1,29 +1,160 @@
+import functools
+import importlib
+from typing import Any, Callable, Union, cast
 from table import Table
 from wheel import Wheel
 from players.player import Player
-from players.martingale import Martingale
-from players.cancellation import PlayerCancellation
-from players.fibonacci import PlayerFibonacci
-from players.seven_reds import SevenReds
-from players.random import PlayerRandom
-from players.passenger57 import Passenger57
-from players.player1326.player1326 import Player1326
 
+ENTRY_POINT_GROUP = "roulette.players"
 
-def player_factory(player_name: str, table: Table, wheel: Wheel) -> Player:
+PLAYERS: dict[str, Union[str, type[Player]]] = {
+    "Martingale": "players.martingale:Martingale",
+    "Cancellation": "players.cancellation:PlayerCancellation",
+    "Fibonacci": "players.fibonacci:PlayerFibonacci",
+    "Sevenreds": "players.seven_reds:SevenReds",
+    "Random": "players.random:PlayerRandom",
+    "Passenger57": "players.passenger57:Passenger57",
+    "Player1326": "players.player1326.player1326:Player1326",
+}
+"""
+The registry of players: each name maps either to a reference of the form
+:samp:`"module:Class"`, imported the first time the player is asked for, or to the class itself.
+"""
+
+PLAYER_NAMES = tuple(PLAYERS)
+"""
+The names of the built-in players only, fixed when the module is imported. Use
+:func:`player_names` for every registered player, including those added with
+:func:`register_player` or through entry points.
+"""
+
+_discovered = False
+
+
+def register_player(name: str) -> Callable[[type[Player]], type[Player]]:
+    """
+    Returns a class decorator which adds a :class:`Player` class to the registry under the given
+    name, so :func:`player_factory` can build it without **player_factory.py** being edited::
+
+        @register_player("Labouchere")
+        class Labouchere(Player):
+            ...
+
+    :param name: the name the player is built by.
+    """
+
+    def register(player: type[Player]) -> type[Player]:
+        PLAYERS[name] = player
+        return player
+
+    return register
+
+
+def discover_players() -> None:
+    """
+    Adds the players advertised by installed packages to the registry, once. A package advertises
+    a player with an entry point in the :samp:`roulette.players` group, whose name is the player’s
+    name and whose value is a :samp:`"module:Class"` reference; the module is only imported when
+    the player is asked for. Players registered in this process take precedence.
+    """
+
+    global _discovered  # pylint: disable=global-statement
+    if _discovered:
+        return
+    _discovered = True
+    # pylint: disable-next=import-outside-toplevel
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        PLAYERS.setdefault(entry_point.name, entry_point.value)
+
+
+def player_names() -> list[str]:
+    """
+    Returns the names of every registered player, including the ones advertised by installed
+    packages.
+    """
+
+    discover_players()
+    return list(PLAYERS)
+
+
+def load_reference(reference: str) -> type[Player]:
+    """
+    Imports the class named by a :samp:`"module:Class"` reference.
     """
-    Returns an object of desired Player class.
+
+    module, _, name = reference.partition(":")
+    player: Any = importlib.import_module(module)
+    for attribute in name.split("."):
+        player = getattr(player, attribute)
+    return cast(type[Player], player)
+
+
+def player_reference(player_name: str) -> str:
     """
+    Returns the :samp:`"module:Class"` reference of a registered player. Unlike the name, the
+    reference can be handed to a worker process in which the player was never registered.
+
+    :param player_name: the name of a registered player.
+    """
+
+    player = player_class(player_name)
+    return f"{player.__module__}:{player.__qualname__}"
+
 
-    players = {
-        "Martingale": Martingale(table),
-        "Cancellation": PlayerCancellation(table),
-        "Fibonacci": PlayerFibonacci(table),
-        "Sevenreds": SevenReds(table),
-        "Random": PlayerRandom(table, wheel),
-        "Passenger57": Passenger57(table, wheel),
-        "Player1326": Player1326(table),
-    }
-    if player_name not in players:
+def player_class(player_name: str) -> type[Player]:
+    """
+    Returns the class of a player, importing its module if it hasn’t been imported yet.
+
+    :param player_name: the name of a registered player, or a :samp:`"module:Class"` reference.
+    """
+
+    if player_name not in PLAYERS:
+        discover_players()
+    if player_name not in PLAYERS:
+        if ":" in player_name:
+            return load_reference(player_name)
         raise ValueError("Player not found, enter a valid player name")
-    return players[player_name]
+    player = PLAYERS[player_name]
+    if isinstance(player, str):
+        player = PLAYERS[player_name] = load_reference(player)
+    return player
+
+
+@functools.cache
+def dependencies(player: type[Player]) -> tuple[str, ...]:
+    """
+    Reads, once per class, which of the :class:`Table` and the :class:`Wheel` the constructor of a
+    player takes, from the names of its parameters.
+
+    :param player: the player class.
+    :return: the names of the constructor’s parameters, each :samp:`"table"` or :samp:`"wheel"`.
+    """
+
+    # pylint: disable-next=import-outside-toplevel
+    import inspect
+
+    names = []
+    for name, parameter in inspect.signature(player).parameters.items():
+        if name in ("table", "wheel"):
+            names.append(name)
+        elif parameter.default is inspect.Parameter.empty and parameter.kind not in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            raise ValueError(f"{player.__name__} needs an unknown argument {name}")
+    return tuple(names)
+
+
+def player_factory(player_name: str, table: Table, wheel: Wheel) -> Player:
+    """
+    Returns an object of desired Player class. Only that player’s module is imported, and only
+    that player is built, with the dependencies its constructor takes.
+
+    :param player_name: the name of a registered player, or a :samp:`"module:Class"` reference.
+    """
+
+    player = player_class(player_name)
+    available: dict[str, Any] = {"table": table, "wheel": wheel}
+    return player(*(available[name] for name in dependencies(player)))
@@ -18,8 +18,15 @@ class PlayerCancellation(Player):
     .. attribute:: outcome
 
        This is the player’s preferred :py:class:`~outcome.Outcome` instance.
+
+    .. attribute:: bet
+
+       The :py:class:`~bet.Bet` placed in every round, whose amount is updated before each round.
     """
 
+    __slots__ = ("outcome", "sequence", "bet_amount", "bet")
+    stateAttributes = ("sequence", "bet_amount")
+
     def __init__(self, table: Table) -> None:
         """
         This uses the **PlayerCancellation.resetSequence()** method to initialize the
@@ -30,9 +37,10 @@ class PlayerCancellation(Player):
         """
 
         super().__init__(table)
-        self.outcome = Outcome("Red", 1)
+        self.outcome = Outcome.intern("Red", 1)
         self.sequence: list[int] = []
         self.bet_amount = 0
+        self.bet = Bet(self.bet_amount, self.outcome)
         self.resetSequence()
 
     def resetSequence(self) -> None:
@@ -50,7 +58,8 @@ class PlayerCancellation(Player):
         """
 
         self.bet_amount = self.sequence[0] + self.sequence[-1]
-        self.table.placeBet(Bet(self.bet_amount, self.outcome))
+        self.bet.amount = self.bet_amount
+        self.table.placeBet(self.bet)
         self.stake -= self.bet_amount
 
     def win(self, bet: Bet) -> None:
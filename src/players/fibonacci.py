@@ -16,8 +16,15 @@ class PlayerFibonacci(Player):
     .. attribute:: previous
 
        This is the bet amount previous to the most recent bet amount. Initially, this is zero.
+
+    .. attribute:: bet
+
+       The :py:class:`~bet.Bet` placed in every round, whose amount is updated before each round.
     """
 
+    __slots__ = ("outcome", "recent", "previous", "bet_amount", "bet")
+    stateAttributes = ("recent", "previous", "bet_amount")
+
     def __init__(self, table: Table) -> None:
         """
         Initialize the Fibonacci player.
@@ -26,10 +33,11 @@ class PlayerFibonacci(Player):
         """
 
         super().__init__(table)
-        self.outcome = Outcome("Black", 1)
+        self.outcome = Outcome.intern("Black", 1)
         self.recent = 1
         self.previous = 0
         self.bet_amount = self.recent + self.previous
+        self.bet = Bet(self.bet_amount, self.outcome)
 
     def win(self, bet: Bet) -> None:
         """
@@ -73,5 +81,6 @@ class PlayerFibonacci(Player):
         return True
 
     def placeBets(self) -> None:
-        self.table.placeBet(Bet(self.bet_amount, self.outcome))
+        self.bet.amount = self.bet_amount
+        self.table.placeBet(self.bet)
         self.stake -= self.bet_amount
@@ -1,7 +1,6 @@
 from table import Table
 from outcome import Outcome
 from bet import Bet
-from invalid_bet import InvalidBet
 from players.player import Player
 
 
@@ -18,8 +17,16 @@ class Martingale(Player):
 
        The the bet multiplier, based on the number of losses. This starts at 1, and is reset to 1 on
        each win. It is doubled in each loss. This is always equal to :math:`2^{lossCount}`.
+
+    .. attribute:: bet
+
+       The :class:`Bet` on “black” placed in every round. Its amount is updated before each round,
+       so no new :class:`Bet` is created per spin.
     """
 
+    __slots__ = ("losscount", "betMultiple", "bet")
+    stateAttributes: tuple[str, ...] = ("losscount", "betMultiple")
+
     def __init__(self, table: Table):
         """
         Constructs the :class:`Martingale` :class:`Player` instance with a specific :class:`Table`
@@ -31,22 +38,23 @@ class Martingale(Player):
         super().__init__(table)
         self.losscount = 0
         self.betMultiple = 1
+        self.bet = Bet(self.betMultiple, Outcome.intern("Black", 1))
 
     def placeBets(self) -> None:
         """
         Updates the :class:`Table` object with a bet on “black”. The amount bet is
         :math:`2^{lossCount}`, which is the value of **betMultiple**.
+
+        If the bet breaks the table limit, the strategy is reset and the stake is left alone; the
+        invalid bet stays on the table for **validBets()** to report.
         """
 
-        outcome = Outcome("Black", 1)
-        bet = Bet(self.betMultiple, outcome)
-        self.table.placeBet(bet)
-        try:
-            self.table.isValid()
-        except InvalidBet as exc:
+        self.bet.amount = self.betMultiple
+        self.table.placeBet(self.bet)
+        if not self.table.validate():
             self.losscount = 0
             self.betMultiple = 2**self.losscount
-            raise InvalidBet from exc
+            return
         self.stake -= self.betMultiple
 
     def playing(self) -> bool:
@@ -56,6 +64,25 @@ class Martingale(Player):
             return False
         return True
 
+    def absorbed(self) -> bool:
+        """
+        The doubled bet only grows until a win, and a bet over the table limit is invalid, so
+        once **betMultiple** exceeds the limit the session is over.
+        """
+
+        if self.betMultiple > self.table.limit:
+            self.losscount = 0
+            self.betMultiple = 2**self.losscount
+            return True
+        return False
+
+    def validBets(self) -> bool:
+        """
+        Returns whether the bet placed is within the table limit, by **Table.validate()**.
+        """
+
+        return self.table.validate()
+
     def win(self, bet: Bet) -> None:
         """
         :param bet: The bet which won
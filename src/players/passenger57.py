@@ -19,8 +19,14 @@ class Passenger57(Player):
 
        The :class:`Table` that is used to place individual :class:`Bet` instances.
 
+    .. attribute:: bet
+
+       The :class:`Bet` of 20 on **black**, placed again in every round.
     """
 
+    __slots__ = ("wheel", "black", "bet")
+    stateAttributes = ()
+
     def __init__(self, table: Table, wheel: Wheel) -> None:
         """
         Constructs the :class:`Player` instance with a specific table for placing bets. This also
@@ -35,6 +41,7 @@ class Passenger57(Player):
         self.table = table
         self.wheel = wheel
         self.black = self.wheel.getOutcome("Black")
+        self.bet = Bet(20, self.black)
 
     def placeBets(self) -> None:
         """
@@ -44,7 +51,5 @@ class Passenger57(Player):
 
         """
 
-        bet_amount = 20
-        bet = Bet(bet_amount, self.black)
-        self.table.placeBet(bet)
-        self.stake -= bet_amount
+        self.table.placeBet(self.bet)
+        self.stake -= self.bet.amount
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Set
+from typing import AbstractSet, Optional
 from outcome import Outcome
 from table import Table
 from bet import Bet
@@ -28,8 +28,21 @@ class Player(ABC):
        The :class:`Table` object used to place individual :class:`Bet` instances. The :class:`Table`
        object contains the current :class:`Wheel` object from which the player can get
        :class:`Outcome` objects used to build :class:`Bet` instances.
+
+    .. attribute:: stateAttributes
+
+       The names of the attributes which, together with **stake**, make up the whole state of the
+       betting strategy. This describes the player as a finite-state betting system, for example to
+       the :class:`MarkovEvaluator`. It is :samp:`None` for players whose bets can’t be described
+       this way, such as players who bet at random.
+
+    The class and each of its subclasses name their instance attributes in **__slots__**, so
+    players have no **__dict__** and their attributes are read and written through fixed slots.
     """
 
+    __slots__ = ("table", "stake", "roundsToGo")
+    stateAttributes: Optional[tuple[str, ...]] = None
+
     def __init__(self, table: Table) -> None:
         """
         Constructs the :class:`Player` instance with a specific :class:`Table` object for placing
@@ -79,7 +92,31 @@ class Player(ABC):
         """
         return self.roundsToGo > 0
 
-    def winners(self, outcomes: Set[Outcome]) -> None:
+    def absorbed(self) -> bool:
+        """
+        Returns :samp:`True` if the player, though still playing, can never place a valid bet
+        again, so the rest of the session is already known: it ends before the next spin. The
+        :class:`Simulator` checks this before each cycle instead of letting **placeBets()** place
+        an invalid bet. A player who is absorbed resets their betting state, as when they
+        stop playing.
+
+        This player is never absorbed.
+        """
+
+        return False
+
+    def validBets(self) -> bool:
+        """
+        Returns :samp:`False` if the bets just placed by **placeBets()** are invalid, so the
+        :class:`Game` ends the session without spinning. This is how a player who checks the table
+        limit reports a broken limit, as a status rather than an exception.
+
+        This player doesn’t check the table limit, so their bets are always valid.
+        """
+
+        return True
+
+    def winners(self, outcomes: AbstractSet[Outcome]) -> None:
         """
         :param outcomes: The set of :py:class:`~outcome.Outcome` instances that are part of the
         current win.
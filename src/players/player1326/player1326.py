@@ -18,6 +18,9 @@ class Player1326(Player):
        one of the four states: No Wins, One Win, Two Wins or Three Wins.
     """
 
+    __slots__ = ("state",)
+    stateAttributes = ("state",)
+
     def __init__(self, table: Table) -> None:
         """
         Initializes the state. The state is set to the initial state of an instance of
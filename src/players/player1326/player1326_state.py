@@ -6,6 +6,12 @@ from outcome import Outcome
 class Player1326State:
     """
     :class:`Player1326State` is the superclass for all of the states in the 1-3-2-6 betting system.
+
+    .. attribute:: bet
+
+       The :py:class:`~bet.Bet` handed out by **currentBet()**. Each state is a single shared
+       instance, and so is its bet: its amount is brought up to date with **betAmount** on each
+       call instead of a new :py:class:`~bet.Bet` being made per spin.
     """
 
     def __init__(self) -> None:
@@ -15,7 +21,9 @@ class Player1326State:
         """
 
         self.betAmount: int = 0
-        self.outcome = Outcome("Red", 1)
+        self.outcome = Outcome.intern("Red", 1)
+        if not hasattr(self, "bet"):
+            self.bet = Bet(self.betAmount, self.outcome)
 
     @abstractmethod
     def currentBet(self) -> Bet:
@@ -76,11 +84,12 @@ class Player1326NoWins(Player1326State):
 
     def currentBet(self) -> Bet:
         """
-        Constructs a new :py:class:`~bet.Bet` from the player’s :py:class:`~outcome.Outcome`
-        information. The bet multiplier is 1.
+        Returns the :py:class:`~bet.Bet` of this state, on the player’s
+        :py:class:`~outcome.Outcome`. The bet multiplier is 1.
         """
 
-        return Bet(self.betAmount, self.outcome)
+        self.bet.amount = self.betAmount
+        return self.bet
 
     def nextWon(self) -> Player1326State:
         """
@@ -109,11 +118,12 @@ class Player1326OneWin(Player1326State):
 
     def currentBet(self) -> Bet:
         """
-        Constructs a new :py:class:`~bet.Bet` from the player’s :py:class:`~outcome.Outcome`
-        information. The bet multiplier is 3.
+        Returns the :py:class:`~bet.Bet` of this state, on the player’s
+        :py:class:`~outcome.Outcome`. The bet multiplier is 3.
         """
 
-        return Bet(self.betAmount, self.outcome)
+        self.bet.amount = self.betAmount
+        return self.bet
 
     def nextWon(self) -> Player1326State:
         """
@@ -142,11 +152,12 @@ class Player1326TwoWins(Player1326State):
 
     def currentBet(self) -> Bet:
         """
-        Constructs a new :py:class:`~bet.Bet` from the player’s :py:class:`~outcome.Outcome`
-        information. The bet multiplier is 2.
+        Returns the :py:class:`~bet.Bet` of this state, on the player’s
+        :py:class:`~outcome.Outcome`. The bet multiplier is 2.
         """
 
-        return Bet(self.betAmount, self.outcome)
+        self.bet.amount = self.betAmount
+        return self.bet
 
     def nextWon(self) -> Player1326State:
         """
@@ -176,11 +187,12 @@ class Player1326ThreeWins(Player1326State):
 
     def currentBet(self) -> Bet:
         """
-        Constructs a new :py:class:`~bet.Bet` from the player’s :py:class:`~outcome.Outcome`
-        information. The bet multiplier is 6.
+        Returns the :py:class:`~bet.Bet` of this state, on the player’s
+        :py:class:`~outcome.Outcome`. The bet multiplier is 6.
         """
 
-        return Bet(self.betAmount, self.outcome)
+        self.bet.amount = self.betAmount
+        return self.bet
 
     def nextWon(self) -> Player1326NoWins:
         """
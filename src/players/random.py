@@ -18,8 +18,17 @@ class PlayerRandom(Player):
     .. attribute:: all_OC
 
        **Set** of all known :py:class:`~outcome.Outcome` instances.
+
+    .. attribute:: choices
+
+       The outcomes of **all_OC** in a **tuple** sorted by name, which is made once so that a
+       random choice doesn’t copy the set on every spin. The order of a set of strings changes
+       with the hash seed of each process, so without sorting a seeded **rng** would still choose
+       different bets in different processes.
     """
 
+    __slots__ = ("rng", "all_OC", "choices")
+
     def __init__(self, table, wheel) -> None:
         """
         This uses the **super()** construct to invoke the superclass constructor using the Table
@@ -34,6 +43,7 @@ class PlayerRandom(Player):
         self.rng = random.Random()
         bin_iterator = wheel.binIterator()
         self.all_OC = set(outcome for bin in bin_iterator for outcome in bin)
+        self.choices = tuple(sorted(self.all_OC, key=lambda outcome: outcome.name))
 
     def placeBets(self) -> None:
         """
@@ -41,7 +51,7 @@ class PlayerRandom(Player):
         instance.
         """
         bet_amount = 1
-        self.table.placeBet(Bet(bet_amount, self.rng.choice(list(self.all_OC))))
+        self.table.placeBet(Bet(bet_amount, self.rng.choice(self.choices)))
         self.stake -= bet_amount
 
     def playing(self) -> bool:
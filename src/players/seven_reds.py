@@ -1,4 +1,4 @@
-from typing import Set
+from typing import AbstractSet
 from outcome import Outcome
 from players.martingale import Martingale
 
@@ -14,13 +14,33 @@ class SevenReds(Martingale):
        The number of reds yet to go. This starts at 7 , is reset to 7 on each non-red outcome, and
        decrements by 1 on each red outcome.
 
+    .. attribute:: red
+
+       The shared “red” :py:class:`~outcome.Outcome` looked for in the winning outcomes.
+
     **Note:** that this class inherits betMultiple. This is initially 1, doubles with each loss
     and is reset to one on each win.
     """
 
+    __slots__ = ("redCount", "red")
+    stateAttributes = Martingale.stateAttributes + ("redCount",)
+
     def __init__(self, table):
         super().__init__(table)
         self.redCount = 7
+        self.red = Outcome.intern("Red", 1)
+
+    def absorbed(self) -> bool:
+        """
+        This player only bets after seven reds, so they are absorbed only when their next spin is a
+        bet over the table limit. **redCount** is then reset to 7, as **placeBets()** would have
+        done before placing the invalid bet, so the next session starts in the same state.
+        """
+
+        if self.redCount == 0 and super().absorbed():
+            self.redCount = 7
+            return True
+        return False
 
     def placeBets(self) -> None:
         """
@@ -31,7 +51,7 @@ class SevenReds(Martingale):
             self.redCount = 7
             super().placeBets()
 
-    def winners(self, outcomes: Set[Outcome]) -> None:
+    def winners(self, outcomes: AbstractSet[Outcome]) -> None:
         """
         :param outcomes: The :py:class:`~outcome.Outcome` set from a Bin.
 
@@ -39,8 +59,7 @@ class SevenReds(Martingale):
         this vector includes red, redCount is decremented. Otherwise, redCount is reset to 7.
         """
 
-        red_outcome = Outcome("Red", 1)
-        if red_outcome in outcomes:
+        if self.red in outcomes:
             self.redCount -= 1
         else:
             self.redCount = 7
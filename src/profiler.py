@@ -0,0 +1,210 @@
+import time
+from collections import defaultdict
+from typing import Any, Callable, TypeVar
+import click
+from bin import Bin
+from bin_builder import american_wheel
+from game import Game
+from player_factory import player_factory, player_names as registered_player_names
+from simulator import Simulator
+from table import Table
+from wheel import Wheel
+from players.player import Player
+
+Stack = tuple[str, ...]
+
+T = TypeVar("T")
+
+
+class Profile:
+    """
+    :class:`Profile` accumulates the time spent in each phase of play, for each class of
+    :class:`Player`. A phase is identified by its stack: the name of the player class, then the
+    enclosing phases, such as ``("Martingale", "session", "cycle", "choose")``. Only a call count
+    and a total of nanoseconds are kept per stack, so recording costs two dictionary updates.
+
+    .. attribute:: calls
+
+       A **dict** mapping each stack to the number of times the phase was timed.
+
+    .. attribute:: nanoseconds
+
+       A **dict** mapping each stack to the total time spent in the phase, in nanoseconds,
+       including its nested phases.
+    """
+
+    def __init__(self) -> None:
+        self.calls: dict[Stack, int] = defaultdict(int)
+        self.nanoseconds: dict[Stack, int] = defaultdict(int)
+
+    def add(self, stack: Stack, nanoseconds: int) -> None:
+        """
+        Records one timing of a phase.
+
+        :param stack: the stack of the phase.
+        :param nanoseconds: the time spent.
+        """
+
+        self.calls[stack] += 1
+        self.nanoseconds[stack] += nanoseconds
+
+    def selfTime(self, stack: Stack) -> int:
+        """
+        Returns the time spent in a phase outside the phases nested directly within it.
+
+        :param stack: the stack of the phase.
+        :return: the time in nanoseconds, at least zero.
+        """
+
+        nested = sum(
+            nanoseconds
+            for other, nanoseconds in self.nanoseconds.items()
+            if len(other) == len(stack) + 1 and other[:-1] == stack
+        )
+        return max(self.nanoseconds[stack] - nested, 0)
+
+    def summary(self) -> str:
+        """
+        Returns a table with a row per phase: the calls, the total and mean time, and the share
+        of the time of the outermost phase of the same player class.
+        """
+
+        lines = [
+            f"{'phase':40} {'calls':>10} {'total ms':>10} {'mean µs':>10} {'share':>7}"
+        ]
+        for stack in sorted(self.nanoseconds):
+            total = self.nanoseconds[stack]
+            outermost = self.nanoseconds.get(stack[:2], total) or 1
+            lines.append(
+                f"{';'.join(stack):40} {self.calls[stack]:>10,} "
+                f"{total / 1e6:>10.1f} {total / self.calls[stack] / 1e3:>10.2f} "
+                f"{total / outermost:>7.1%}"
+            )
+        return "\n".join(lines)
+
+    def folded(self) -> str:
+        """
+        Returns the profile in the folded stacks format read by flame graph tools: a line per
+        phase with its stack, separated by semicolons, and its own time in microseconds.
+        """
+
+        return "\n".join(
+            f"{';'.join(stack)} {self.selfTime(stack) // 1000}"
+            for stack in sorted(self.nanoseconds)
+        )
+
+
+class ProfiledGame(Game):
+    """
+    :class:`ProfiledGame` is a :class:`Game` which times each phase of **cycle()** into a
+    :class:`Profile`: **Player.placeBets()**, **Wheel.choose()**, **Player.winners()** and the
+    resolution of the bets. It wraps the steps of **Game.cycle()** rather than repeating it, so
+    the profiled cycle is always the one actually played. Profiling is opt-in: a plain
+    :class:`Game` has no timing code at all.
+
+    .. attribute:: profile
+
+       The :class:`Profile` the phases are recorded in.
+    """
+
+    def __init__(self, wheel: Wheel, table: Table, profile: Profile) -> None:
+        """
+        :param wheel: The :class:`Wheel` instance which produces random events
+        :param table: The :class:`Table` instance which holds bets to be resolved.
+        :param profile: The :class:`Profile` to record in.
+        """
+
+        super().__init__(wheel, table)
+        self.profile = profile
+        self._stack: Stack = ()
+
+    def timed(self, stack: Stack, action: Callable[..., T], *args: Any) -> T:
+        """
+        Calls the action with the given arguments, and records its time under the stack.
+        """
+
+        start = time.perf_counter_ns()
+        result = action(*args)
+        self.profile.add(stack, time.perf_counter_ns() - start)
+        return result
+
+    def cycle(self, player: Player) -> bool:
+        """
+        Executes a single cycle of play with **Game.cycle()**, timing the whole cycle. The phases
+        are timed by the steps it calls.
+        """
+
+        self._stack = (type(player).__name__, "session", "cycle")
+        return self.timed(self._stack, super().cycle, player)
+
+    def placeBets(self, player: Player) -> bool:
+        return self.timed(self._stack + ("placeBets",), super().placeBets, player)
+
+    def spin(self) -> Bin:
+        return self.timed(self._stack + ("choose",), super().spin)
+
+    def notify(self, player: Player, winning_bin: Bin) -> None:
+        self.timed(self._stack + ("winners",), super().notify, player, winning_bin)
+
+    def resolve(self, player: Player, winning_bin: Bin) -> None:
+        self.timed(self._stack + ("resolve",), super().resolve, player, winning_bin)
+
+
+class ProfiledSimulator(Simulator):
+    """
+    :class:`ProfiledSimulator` is a :class:`Simulator` playing a :class:`ProfiledGame`, which also
+    times each whole session into the game’s :class:`Profile`. The time of a session outside its
+    cycles is the cost of the session loop itself.
+    """
+
+    game: ProfiledGame
+
+    def session(self) -> list[int]:
+        start = time.perf_counter_ns()
+        stake_values = super().session()
+        self.game.profile.add(
+            (type(self.player).__name__, "session"), time.perf_counter_ns() - start
+        )
+        return stake_values
+
+
+def profile_players(player_names: list[str], samples: int = 50) -> Profile:
+    """
+    Plays **samples** sessions of each of the given strategies with profiling on.
+
+    :param player_names: names of players, as accepted by :func:`player_factory`.
+    :param samples: the number of sessions per player.
+    :return: the profile of every player.
+    """
+
+    profile = Profile()
+    for player_name in player_names:
+        wheel = american_wheel()
+        table = Table()
+        simulator = ProfiledSimulator(
+            ProfiledGame(wheel, table, profile),
+            player_factory(player_name, table, wheel),
+        )
+        simulator.samples = samples
+        simulator.gather()
+    return profile
+
+
+@click.command()
+@click.option("--player", "players", multiple=True, help="Strategy to profile.")
+@click.option("--samples", default=50, help="Number of sessions per strategy.")
+@click.option("--folded", default=None, help="File to write folded stacks to.")
+def main(players, samples, folded) -> None:  # pragma: no cover
+    """
+    Profiles the phases of play of the given strategies, or of all of them, prints a summary table
+    and optionally writes folded stacks for a flame graph.
+    """
+    profile = profile_players(list(players) or registered_player_names(), samples)
+    print(profile.summary())
+    if folded is not None:
+        with open(folded, "w", encoding="utf-8") as file:
+            file.write(profile.folded() + "\n")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()  # pylint: disable=no-value-for-parameter
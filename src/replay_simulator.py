@@ -0,0 +1,78 @@
+from typing import Optional
+import numpy as np
+from bin_builder import american_wheel
+from multi_seat_simulator import MultiSeatSimulator
+from wheel import Wheel
+
+
+class ReplaySimulator(MultiSeatSimulator):
+    """
+    :class:`ReplaySimulator` replays a spin log, written by :func:`write_spin_log`, for several
+    players at once. Every player sees exactly the same winning bins, so the differences between
+    their statistics come from their betting strategies alone and not from the luck of the wheel:
+    the common random numbers technique.
+
+    The log is memory-mapped and read once. Session *s* replays the spins from
+    *s* × **initDuration** up to (*s* + 1) × **initDuration**, each spin being resolved by a
+    :class:`MultiSeatGame` for every player still seated.
+
+    .. attribute:: log
+
+       The memory-mapped array of bin indices.
+
+    .. attribute:: samples
+
+       The number of sessions to replay. If it is zero, every whole session in the log is
+       replayed.
+    """
+
+    def __init__(
+        self, playerNames: list[str], path: str, wheel: Optional[Wheel] = None
+    ) -> None:
+        """
+        :param playerNames: The names of the players.
+        :param path: The name of the spin log file.
+        :param wheel: The wheel the log was drawn for. The American wheel by default.
+        :raises ValueError: if a name is repeated.
+        """
+
+        super().__init__(playerNames, wheel if wheel is not None else american_wheel())
+        self.log = np.load(path, mmap_mode="r")
+        self.samples = 0
+
+    def sessions(self) -> int:
+        """
+        Returns the number of sessions which will be replayed.
+        """
+
+        available = len(self.log) // self.initDuration
+        if self.samples == 0:
+            return available
+        if self.samples > available:
+            raise ValueError("The spin log is too short for the number of samples")
+        return self.samples
+
+    def session(self, index: int = 0) -> dict[str, list[int]]:
+        """
+        Replays one session for every player, cycling a :class:`MultiSeatGame` once for each
+        spin of the session’s slice of the log, until every player has left their seat.
+
+        :param index: the index of the session.
+        :return: a **dict** mapping each player name to the **list** of their stake values.
+        """
+
+        start = index * self.initDuration
+        game = self.seat()
+        for bin_index in self.log[start : start + self.initDuration].tolist():
+            if not game.seats:
+                break
+            game.cycle(self.wheel.get(bin_index))
+        return dict(zip(self.playerNames, game.stakeValues.values()))
+
+    def gather(self) -> None:
+        """
+        Replays the sessions and records each.
+        """
+
+        for index in range(self.sessions()):
+            self.record(self.session(index))
@@ -0,0 +1,236 @@
+import functools
+import hashlib
+import json
+import os
+import random
+from typing import Any, NamedTuple, Optional
+from integer_statistics import IntegerStatistics
+from parallel_simulator import SessionJob, run_sessions
+from seed_sequence import SeedStream
+
+
+class SimulationConfig(NamedTuple):
+    """
+    :class:`SimulationConfig` is everything which decides the result of a simulation: the strategy,
+    the initial stake and duration, the table limit, the number of sessions and the seed.
+    """
+
+    playerName: str
+    initStake: int = 100
+    initDuration: int = 250
+    limit: int = 300
+    samples: int = 50
+    seed: int = 0
+
+    def seeds(self) -> list[int]:
+        """
+        Returns the seed of every session, spawned from **seed**, so any single session can be
+        played again on its own.
+        """
+
+        return SeedStream(self.seed).integers(self.samples)
+
+    def job(self) -> SessionJob:
+        """
+        Returns the sessions of the configuration, as played by :func:`run_sessions`.
+        """
+
+        return SessionJob(
+            self.playerName, self.initStake, self.initDuration, self.seeds(), self.limit
+        )
+
+
+@functools.cache
+def code_version() -> str:
+    """
+    Returns a hash of the source of the simulator, so cached results are not used once the code
+    which produced them has changed.
+    """
+
+    digest = hashlib.sha256()
+    root = os.path.dirname(os.path.abspath(__file__))
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(directory, name)
+                digest.update(os.path.relpath(path, root).encode())
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+def cache_key(config: SimulationConfig) -> str:
+    """
+    Returns the canonical hash of a configuration and the code version.
+
+    :param config: the configuration.
+    :return: a hex digest.
+    """
+
+    canonical = json.dumps(
+        {"config": config._asdict(), "code": code_version()}, sort_keys=True
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def simulate(config: SimulationConfig) -> dict[str, Any]:
+    """
+    Plays the sessions of a configuration and returns their durations and maxima, and their
+    summary statistics.
+
+    :param config: the configuration.
+    :return: a **dict** with the configuration, **durations**, **maxima** and **summary**.
+    """
+
+    results = run_sessions(*config.job())
+    durations = IntegerStatistics(duration for duration, _ in results)
+    maxima = IntegerStatistics(maximum for _, maximum in results)
+    return {
+        "config": config._asdict(),
+        "durations": durations,
+        "maxima": maxima,
+        "summary": {
+            "durations": {"mean": durations.mean(), "stdev": durations.stdev()},
+            "maxima": {"mean": maxima.mean(), "stdev": maxima.stdev()},
+        },
+    }
+
+
+class ResultCache:
+    """
+    :class:`ResultCache` keeps the results of simulations on disk, one JSON file per
+    configuration, named by :func:`cache_key`, so a configuration already simulated, by any run,
+    is read back instead of simulated again.
+
+    The cache holds at most **maxEntries** results. Each hit touches its file, and when the cache
+    is full the least recently used files are removed.
+
+    .. attribute:: directory
+
+       The directory holding the cached results.
+
+    .. attribute:: maxEntries
+
+       The largest number of results kept.
+
+    .. attribute:: rng
+
+       The random number generator choosing the sessions to verify.
+    """
+
+    def __init__(self, directory: str, maxEntries: int = 256) -> None:
+        """
+        :param directory: The directory holding the cached results; it is created if needed.
+        :param maxEntries: The largest number of results kept.
+        """
+
+        if maxEntries < 1:
+            raise ValueError("The cache must hold at least one entry")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.maxEntries = maxEntries
+        self.rng = random.Random()
+
+    def path(self, config: SimulationConfig) -> str:
+        """
+        Returns the name of the file holding the result of a configuration.
+        """
+
+        return os.path.join(self.directory, f"{cache_key(config)}.json")
+
+    def get(self, config: SimulationConfig) -> Optional[dict[str, Any]]:
+        """
+        Reads the cached result of a configuration, and marks it as recently used.
+
+        :param config: the configuration.
+        :return: the result, or :samp:`None` if it isn’t cached.
+        """
+
+        path = self.path(config)
+        try:
+            with open(path, encoding="utf-8") as file:
+                result: dict[str, Any] = json.load(file)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        result["durations"] = IntegerStatistics(result["durations"])
+        result["maxima"] = IntegerStatistics(result["maxima"])
+        return result
+
+    def put(self, config: SimulationConfig, result: dict[str, Any]) -> None:
+        """
+        Stores the result of a configuration, then evicts the least recently used results
+        beyond **maxEntries**. The file is written under a temporary name and renamed, so a
+        reader never sees it half written.
+
+        :param config: the configuration.
+        :param result: the result, as returned by :func:`simulate`.
+        """
+
+        path = self.path(config)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(result, file)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used results beyond **maxEntries**.
+        """
+
+        entries = [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".json")
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[: max(len(entries) - self.maxEntries, 0)]:
+            os.remove(entry.path)
+
+    def verify(
+        self, config: SimulationConfig, result: dict[str, Any], fraction: float
+    ) -> bool:
+        """
+        Plays a random **fraction** of the sessions of a cached result again, at least one, and
+        checks that they give the same durations and maxima.
+
+        :param config: the configuration.
+        :param result: the cached result.
+        :param fraction: the fraction of sessions to play again.
+        :return: :samp:`True` if every session played again agrees.
+        """
+
+        seeds = config.seeds()
+        count = min(max(round(len(seeds) * fraction), 1), len(seeds))
+        indices = self.rng.sample(range(len(seeds)), count)
+        replayed = run_sessions(
+            config.playerName,
+            config.initStake,
+            config.initDuration,
+            [seeds[index] for index in indices],
+            config.limit,
+        )
+        return all(
+            (result["durations"][index], result["maxima"][index]) == session
+            for index, session in zip(indices, replayed)
+        )
+
+    def simulate(self, config: SimulationConfig, verify: float = 0.0) -> dict[str, Any]:
+        """
+        Returns the result of a configuration, from the cache if it is there and otherwise by
+        simulating it and caching the result.
+
+        :param config: the configuration.
+        :param verify: the fraction of the sessions of a cached result to play again before it
+                       is used. A result which fails verification is simulated again.
+        :return: the result, as returned by :func:`simulate`.
+        """
+
+        result = self.get(config)
+        if result is not None and (verify <= 0 or self.verify(config, result, verify)):
+            return result
+        result = simulate(config)
+        self.put(config, result)
+        return result
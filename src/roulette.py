@@ -1,6 +1,5 @@
 import click
-from wheel import Wheel
-from bin_builder import BinBuilder
+from bin_builder import american_wheel
 from table import Table
 from game import Game
 from simulator import Simulator
@@ -9,28 +8,93 @@ from player_factory import player_factory
 
 @click.command()
 @click.option("--player_name", prompt="Enter a player")
-def main(player_name) -> None:  # pragma: no cover
+@click.option(
+    "--precision",
+    type=float,
+    default=None,
+    help="Gather until the confidence intervals are this fraction of the means.",
+)
+@click.option(
+    "--cache",
+    default=None,
+    help="Directory of cached results; a seeded run found there is not simulated again.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=None,
+    help="Seed of the run; a run without one is seeded from fresh entropy, or 0 with --cache.",
+)
+@click.option(
+    "--verify",
+    default=0.0,
+    help="Fraction of the sessions of a cached result to play again before using it.",
+)
+def main(  # pylint: disable=too-many-arguments
+    player_name, precision, cache, seed, verify
+) -> None:  # pragma: no cover
     """
     A main application function that creates the necessary objects, runs the Simulator’s gather()
     method, and writes the available outputs to sys.stdout
     """
-    wheel = Wheel()
-    bin_builder = BinBuilder()
+    if verify and cache is None:
+        raise click.UsageError("--verify needs --cache")
+    if precision is not None:
+        if cache is not None:
+            raise click.UsageError("--precision can't be combined with --cache")
+        adaptive(player_name, precision, seed)
+        return
+    # pylint: disable-next=import-outside-toplevel
+    from result_cache import ResultCache, SimulationConfig, simulate
+
+    # pylint: disable-next=import-outside-toplevel
+    from seed_sequence import SeedStream
+
+    if seed is None:
+        seed = 0 if cache is not None else SeedStream().entropy
+    config = SimulationConfig(player_name.capitalize(), seed=seed)
+    if cache is not None:
+        result = ResultCache(cache).simulate(config, verify)
+    else:
+        result = simulate(config)
+    print("Seed:", seed)
+    report(player_name, result["maxima"], result["durations"])
+
+
+def adaptive(player_name, precision, seed) -> None:  # pragma: no cover
+    """
+    Gathers sessions until the confidence intervals reach the given precision, seeding the wheel
+    and the player from the seed if one is given, and writes the outputs to sys.stdout
+    """
+    wheel = american_wheel()
     table = Table()
     game = Game(wheel, table)
-    bin_builder.buildBins(wheel)
     player = player_factory(player_name.capitalize(), table, wheel)
+    if seed is not None:
+        # pylint: disable-next=import-outside-toplevel
+        from seed_sequence import SeedStream
+
+        SeedStream(seed).seed(wheel, player)
     simulator = Simulator(game, player)
-    simulator.gather()
+    achieved = simulator.gatherAdaptive(precision)
+    print(f"Sessions: {achieved.samples} (converged: {achieved.converged})")
+    print("95% half-width of mean maxima:", round(achieved.maxima, 3))
+    print("95% half-width of mean duration:", round(achieved.durations, 3))
+    report(player_name, simulator.maxima, simulator.durations)
+
 
+def report(player_name, maxima, durations) -> None:  # pragma: no cover
+    """
+    Writes the maxima and durations of the sessions, and their statistics, to sys.stdout
+    """
     print(f" \nSimulating {player_name} strategy \n")
-    print("maxima: ", simulator.maxima)
-    print("Mean of maxima:", simulator.maxima.mean())
-    print("Standard deviation of maxima:", simulator.maxima.stdev(), "\n")
+    print("maxima: ", maxima)
+    print("Mean of maxima:", maxima.mean())
+    print("Standard deviation of maxima:", maxima.stdev(), "\n")
 
-    print("duration: ", simulator.durations)
-    print("Mean of duration:", simulator.durations.mean())
-    print("Standard deviation of duration:", simulator.durations.stdev())
+    print("duration: ", durations)
+    print("Mean of duration:", durations.mean())
+    print("Standard deviation of duration:", durations.stdev())
 
 
 if __name__ == "__main__":  # pragma: no cover
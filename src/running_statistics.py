@@ -0,0 +1,164 @@
+import math
+from collections import Counter
+from typing import Iterable
+
+
+class RunningStatistics:
+    """
+    :class:`RunningStatistics` computes the same descriptive statistics as
+    :class:`IntegerStatistics`, but without keeping every value. Values are folded into running
+    totals as they are appended, so the memory used grows with the number of distinct values, not
+    with the number of values.
+
+    The mean and variance are updated with Welford’s method. Since the values are ints, the
+    quantiles are taken from a count of each distinct value, which gives exact quantiles. The
+    count is bounded by the range of the values: a duration is at most the initial duration, and a
+    maximum stake is at most the largest stake a session can reach, so it stays small however many
+    sessions are gathered. Two accumulators can be merged exactly, so partial results from several
+    workers or shards can be combined.
+
+    .. attribute:: count
+
+       The number of values appended.
+
+    .. attribute:: minimum
+
+       The smallest value appended.
+
+    .. attribute:: maximum
+
+       The largest value appended.
+
+    .. attribute:: sumOfSquares
+
+       The sum of the squared differences between each value and the running mean.
+
+    .. attribute:: frequencies
+
+       A **Counter** of the number of times each distinct value was appended.
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """
+        Creates an empty accumulator.
+
+        :param values: Optional initial values.
+        """
+
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.frequencies: Counter[int] = Counter()
+        self._mean = 0.0
+        self.sumOfSquares = 0.0
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value: int) -> None:
+        """
+        Folds a value into the running statistics.
+
+        :param value: the value to add.
+        """
+
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self.sumOfSquares += delta * (value - self._mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.frequencies[value] += 1
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Folds each of the values into the running statistics.
+
+        :param values: the values to add.
+        """
+
+        for value in values:
+            self.append(value)
+
+    def merge(self, other: "RunningStatistics") -> None:
+        """
+        Combines the statistics of another accumulator into this one. The result is the same as if
+        all of the other accumulator’s values had been appended to this one.
+
+        :param other: the accumulator to merge.
+        """
+
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean() - self._mean
+        self._mean += delta * other.count / count
+        self.sumOfSquares += (
+            other.sumOfSquares + delta**2 * self.count * other.count / count
+        )
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.frequencies.update(other.frequencies)
+
+    def mean(self) -> float:
+        """
+        Computes the mean of the values.
+        """
+
+        if self.count == 0:
+            raise ZeroDivisionError("mean of no values")
+        return self._mean
+
+    def variance(self) -> float:
+        """
+        Computes the sample variance of the values.
+        """
+
+        return self.sumOfSquares / (self.count - 1)
+
+    def stdev(self) -> float:
+        """
+        Computes the standard deviation of the values, rounded like **IntegerStatistics.stdev()**.
+        """
+
+        return round(math.sqrt(self.variance()), 3)
+
+    def halfWidth(self, confidence: float = 0.95) -> float:
+        """
+        Computes the half-width of the confidence interval on the mean, like
+        **IntegerStatistics.halfWidth()**.
+
+        :param confidence: the confidence level, between zero and one.
+        """
+
+        if self.count < 2:
+            return math.inf
+        # pylint: disable-next=import-outside-toplevel
+        from statistics import NormalDist
+
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        return z * self.stdev() / math.sqrt(self.count)
+
+    def quantile(self, q: float) -> int:
+        """
+        Returns the smallest value such that at least a fraction **q** of the values are less than
+        or equal to it.
+
+        :param q: the fraction, between zero and one.
+        :return: the quantile.
+        :rtype: int
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError("The quantile must be between 0 and 1")
+        if self.count == 0:
+            raise ValueError("quantile of no values")
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for value in sorted(self.frequencies):
+            seen += self.frequencies[value]
+            if seen >= rank:
+                return value
+        return int(self.maximum)
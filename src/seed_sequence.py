@@ -0,0 +1,121 @@
+import hashlib
+import random
+from typing import Any, Optional, Union, cast
+import numpy as np
+
+
+class SeedStream:
+    """
+    :class:`SeedStream` is the one place seeds are made. It wraps a NumPy
+    **numpy.random.SeedSequence**, which hashes a master seed together with a spawn key, the path
+    of child indices leading to it, so that every stream derived from one master seed is
+    independent of, and doesn’t overlap with, every other.
+
+    A run seeds a single stream, then derives a child for each worker shard, each session, each
+    :class:`Wheel` and each random :class:`Player` with **spawn()**, or with **child()** when the
+    child is better identified by a name than by its position. The same master seed then gives
+    the same streams whichever process derives them and in whatever order.
+
+    .. attribute:: sequence
+
+       The **numpy.random.SeedSequence** instance.
+    """
+
+    def __init__(self, seed: Union[int, np.random.SeedSequence, None] = None) -> None:
+        """
+        :param seed: The master seed, or the sequence to wrap. If omitted, fresh entropy is read
+                     from the operating system; it is kept in **entropy**, so the run can still be
+                     reproduced.
+        """
+
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.sequence = seed
+
+    @property
+    def entropy(self) -> int:
+        """
+        The master seed of the stream, drawn from the operating system if none was given.
+        """
+
+        return cast(int, self.sequence.entropy)
+
+    def spawn(self, count: int) -> list["SeedStream"]:
+        """
+        Derives the next **count** children of the stream. Like **SeedSequence.spawn()**, every
+        call derives new children, so spawning twice never gives the same stream twice.
+
+        :param count: the number of children.
+        :return: list of child streams.
+        """
+
+        return [SeedStream(child) for child in self.sequence.spawn(count)]
+
+    def child(self, name: str) -> "SeedStream":
+        """
+        Derives the child of the stream identified by a name, such as the key of a sweep cell. The
+        same name always gives the same child, and it is independent of the spawned children.
+
+        :param name: the name of the child.
+        :return: the child stream.
+        """
+
+        digest = hashlib.sha256(name.encode()).digest()
+        words = tuple(
+            int.from_bytes(digest[start : start + 4], "little")
+            for start in range(0, len(digest), 4)
+        )
+        return SeedStream(
+            np.random.SeedSequence(
+                self.sequence.entropy,
+                spawn_key=tuple(self.sequence.spawn_key) + words,
+            )
+        )
+
+    def integer(self) -> int:
+        """
+        Returns a 64 bit seed drawn from the stream, to seed a generator which takes an integer.
+        """
+
+        low, high = self.sequence.generate_state(2)
+        return int(high) << 32 | int(low)
+
+    def integers(self, count: int) -> list[int]:
+        """
+        Returns the 64 bit seeds of the next **count** children of the stream, one for each
+        session of a run.
+
+        :param count: the number of seeds.
+        :return: list of seeds.
+        """
+
+        return [child.integer() for child in self.spawn(count)]
+
+    def random(self) -> random.Random:
+        """
+        Returns a new **random.Random** instance seeded from the stream.
+        """
+
+        return random.Random(self.integer())
+
+    def generator(self) -> np.random.Generator:
+        """
+        Returns a new **numpy.random.Generator** instance seeded from the stream.
+        """
+
+        return np.random.default_rng(self.sequence)
+
+    def seed(self, *consumers: Optional[Any]) -> None:
+        """
+        Spawns one child per consumer, and seeds the **rng** of each consumer which has a
+        **random.Random** one, such as a :class:`Wheel` or a :class:`PlayerRandom`, from its own
+        child. A consumer without one still takes its child, so the streams of the others don’t
+        depend on which players use random numbers.
+
+        :param consumers: the objects to seed, in a fixed order.
+        """
+
+        for consumer, child in zip(consumers, self.spawn(len(consumers))):
+            rng = getattr(consumer, "rng", None)
+            if isinstance(rng, random.Random):
+                rng.seed(child.integer())
@@ -1,10 +1,31 @@
+import time
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, Union
 from game import Game
 from invalid_bet import InvalidBet
 from integer_statistics import IntegerStatistics
 from players.player import Player
 
+if TYPE_CHECKING:
+    from running_statistics import RunningStatistics
+    from trace_writer import TraceWriter
 
-class Simulator:
+Statistics = Union[IntegerStatistics, "RunningStatistics"]
+
+
+class Precision(NamedTuple):
+    """
+    :class:`Precision` is the precision achieved by **Simulator.gatherAdaptive()**: the number of
+    sessions gathered, the half-widths of the confidence intervals on the mean duration and mean
+    maximum, and whether both reached the target.
+    """
+
+    samples: int
+    durations: float
+    maxima: float
+    converged: bool
+
+
+class Simulator:  # pylint: disable=too-many-instance-attributes
     """
     :class:`Simulator` exercises the Roulette simulation with a given :class:`Player` placing bets.
     It reports raw statistics on a number of sessions of play.
@@ -27,12 +48,20 @@ class Simulator:
     .. attribute:: durations
 
        A **list** of lengths of time the :class:`Player` object remained in the game. Each session
-       of play produces a duration metric, which are collected into this list.
+       of play produces a duration metric, which are collected into this list. With a
+       :class:`RunningStatistics` accumulator, only the running statistics are kept.
 
     .. attribute:: maxima
 
        A **list** of maximum stakes for the :class:`Player` object. Each session of play produces a
-       maximum stake metric, which are collected into this list.
+       maximum stake metric, which are collected into this list. With a
+       :class:`RunningStatistics` accumulator, only the running statistics are kept.
+
+    .. attribute:: trace
+
+       An optional :class:`TraceWriter`. When it is set, every spin of every session is recorded
+       in it: the stake after the spin, the total amount bet, and whether any bet won. It is
+       :samp:`None` by default, and tracing costs nothing then.
 
     .. attribute:: player
 
@@ -44,13 +73,22 @@ class Simulator:
        which embodies the various rules, the :class:`Table` object and the :class:`Wheel` instance.
     """
 
-    def __init__(self, game: Game, player: Player) -> None:
+    def __init__(
+        self,
+        game: Game,
+        player: Player,
+        statistics: Callable[[], Statistics] = IntegerStatistics,
+    ) -> None:
         """
         Saves the Player and :class:`Game` instances so we can gather statistics on the performance
         of the player’s betting strategy.
 
         :param game: The game we’re simulating. This includes the :class:`Table` and :class:`Wheel`.
         :param player: The player. This encapsulates the betting strategy.
+        :param statistics: The class used to collect **durations** and **maxima**. This is
+                           :class:`IntegerStatistics` by default; :class:`RunningStatistics` only
+                           keeps a count of each distinct value, for very large numbers of
+                           samples.
         """
 
         self.game = game
@@ -58,8 +96,9 @@ class Simulator:
         self.initDuration = 250
         self.initStake = 100
         self.samples = 50
-        self.durations = IntegerStatistics()
-        self.maxima = IntegerStatistics()
+        self.durations = statistics()
+        self.maxima = statistics()
+        self.trace: Optional["TraceWriter"] = None
 
     def session(self) -> list[int]:
         """
@@ -69,20 +108,36 @@ class Simulator:
         Executes a single game session. The :class:`Player` instance is initialized with their
         initial stake and initial cycles to go. An empty **list** of stake values is created.
         The session loop executes until the **Player.playing()** method returns false. This loop
-        executes the **Game.cycle()** method; then it gets the stake from the :class:`Player` and
-        appends this amount to the **list** of stake values. The **list** of individual stake
-        values is returned as the result of the session of play.
+        clears the :class:`Table` and executes the **Game.cycle()** method; then it gets the stake
+        from the :class:`Player` and appends this amount to the **list** of stake values. The
+        **list** of individual stake values is returned as the result of the session of play.
+
+        The session also ends when **Game.cycle()** reports that the player’s bets broke the table
+        limit, or as soon as **Player.absorbed()** reports that the player can never place a valid
+        bet again, without placing the bet at all. Neither goes through an exception; an
+        :class:`InvalidBet` raised by a player still ends the session.
+
+        If **trace** is set, a new session is started in it and each spin is recorded.
         """
 
         self.player.stake = self.initStake
         self.player.roundsToGo = self.initDuration
         stake_values = []
+        if self.trace is not None:
+            self.trace.startSession()
         try:
-            while self.player.playing():
-                self.player.table.bets = []
-                self.game.cycle(self.player)
+            while self.player.playing() and not self.player.absorbed():
+                self.player.table.clear()
+                stake = self.player.stake
+                if not self.game.cycle(self.player):
+                    break
                 stake_values.append(self.player.stake)
                 self.player.roundsToGo -= 1
+                if self.trace is not None:
+                    bet = self.player.table.total
+                    self.trace.record(
+                        self.player.stake, bet, self.player.stake > stake - bet
+                    )
         except InvalidBet:
             pass
         return stake_values
@@ -93,7 +148,8 @@ class Simulator:
         stake values. When the session is over (either the play reached their time limit or their
         stake was spent), then the length of the session **list** and the maximum value in the
         session **list** are the resulting duration and maximum metrics. These two metrics are
-        appended to the **durations** list and the **maxima** list.
+        appended to the **durations** list and the **maxima** list. A session which ends before its
+        first round has a duration of zero, and its maximum is the initial stake.
 
         A client class will either display the durations and maxima raw metrics or produce
         statistical summaries.
@@ -101,5 +157,53 @@ class Simulator:
 
         for _ in range(self.samples):
             stake_values: list[int] = self.session()
-            self.maxima.append(max(stake_values))
+            self.maxima.append(max(stake_values, default=self.initStake))
             self.durations.append(len(stake_values))
+
+    def gatherAdaptive(  # pylint: disable=too-many-arguments
+        self,
+        precision: float = 0.05,
+        confidence: float = 0.95,
+        batchSize: int = 50,
+        maxSamples: int = 100_000,
+        maxSeconds: Optional[float] = None,
+    ) -> Precision:
+        """
+        Executes game sessions in batches of **batchSize**, like **gather()**, until the confidence
+        intervals on both the mean duration and the mean maximum are narrow enough: their
+        half-widths are at most **precision** times the means. A volatile strategy gets more
+        sessions and a stable one fewer than the fixed **samples**. Gathering also stops, whether
+        or not the target is reached, after **maxSamples** sessions or, if it is given, once
+        **maxSeconds** have passed at the end of a batch. **samples** is set to the number of
+        sessions gathered.
+
+        :param precision: the target half-width, relative to the mean.
+        :param confidence: the confidence level of the intervals.
+        :param batchSize: the number of sessions between checks.
+        :param maxSamples: the largest number of sessions to gather.
+        :param maxSeconds: the time budget in seconds, or :samp:`None` for no limit.
+        :return: the precision achieved.
+        """
+
+        if batchSize < 1 or maxSamples < 1:
+            raise ValueError("The batch size and the sample budget must be at least 1")
+        start = time.perf_counter()
+        while True:
+            for _ in range(min(batchSize, maxSamples - len(self.durations))):
+                stake_values: list[int] = self.session()
+                self.maxima.append(max(stake_values, default=self.initStake))
+                self.durations.append(len(stake_values))
+            durations = self.durations.halfWidth(confidence)
+            maxima = self.maxima.halfWidth(confidence)
+            converged = durations <= precision * abs(
+                self.durations.mean()
+            ) and maxima <= precision * abs(self.maxima.mean())
+            self.samples = len(self.durations)
+            if (
+                converged
+                or self.samples >= maxSamples
+                or (
+                    maxSeconds is not None and time.perf_counter() - start >= maxSeconds
+                )
+            ):
+                return Precision(self.samples, durations, maxima, converged)
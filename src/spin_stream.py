@@ -0,0 +1,242 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+
+class SpinGenerator(ABC):
+    """
+    :class:`SpinGenerator` is the superclass of the random number generators which can feed a
+    :class:`SpinStream`. Each draws blocks of bin indices.
+
+    A generator must consume its underlying random numbers one spin at a time, so that a given seed
+    gives the same sequence of bin indices whatever the size of the blocks.
+
+    .. attribute:: bins
+
+       The number of bins on the wheel. Drawn indices are in the range zero to **bins** - 1.
+    """
+
+    def __init__(self, bins: int = 38) -> None:
+        """
+        :param bins: The number of bins on the wheel.
+        """
+
+        self.bins = bins
+
+    @abstractmethod
+    def draw(self, size: int) -> list[int]:
+        """
+        Draws the next **size** bin indices.
+
+        :param size: the number of bin indices to draw.
+        :return: list of bin indices.
+        """
+
+
+class MersenneTwisterGenerator(SpinGenerator):
+    """
+    :class:`MersenneTwisterGenerator` draws bin indices from the standard library’s Mersenne
+    Twister, **random.Random**.
+
+    .. attribute:: rng
+
+       The **random.Random** instance.
+    """
+
+    def __init__(self, seed: Optional[int] = None, bins: int = 38) -> None:
+        """
+        :param seed: The seed of the generator. If omitted, it is seeded from the operating system.
+        :param bins: The number of bins on the wheel.
+        """
+
+        super().__init__(bins)
+        self.rng = random.Random(seed)
+
+    def draw(self, size: int) -> list[int]:
+        return self.rng.choices(range(self.bins), k=size)
+
+
+class PCG64Generator(SpinGenerator):
+    """
+    :class:`PCG64Generator` draws bin indices from a NumPy generator driven by a PCG64 bit
+    generator.
+
+    Each index is taken from one double precision random number, which consumes exactly one 64 bit
+    output of the bit generator.
+
+    .. attribute:: generator
+
+       The **numpy.random.Generator** instance.
+    """
+
+    def __init__(self, seed: Optional[int] = None, bins: int = 38) -> None:
+        """
+        :param seed: The seed of the generator. If omitted, it is seeded from the operating system.
+        :param bins: The number of bins on the wheel.
+        """
+
+        super().__init__(bins)
+        # pylint: disable-next=import-outside-toplevel
+        import numpy as np
+
+        self.generator = np.random.Generator(np.random.PCG64(seed))
+
+    def draw(self, size: int) -> list[int]:
+        indices = (self.generator.random(size) * self.bins).astype("intp")
+        return indices.tolist()
+
+
+class SequenceGenerator(SpinGenerator):
+    """
+    :class:`SequenceGenerator` hands out a given sequence of bin indices, in order, instead of
+    drawing random numbers, so that a session can be played on known spins.
+
+    .. attribute:: indices
+
+       The sequence of bin indices: a **list**, or an array such as a memory-mapped spin log.
+
+    .. attribute:: position
+
+       The index in **indices** of the next bin index to hand out.
+    """
+
+    def __init__(
+        self, indices: Sequence[int], position: int = 0, bins: int = 38
+    ) -> None:
+        """
+        :param indices: The bin indices to hand out.
+        :param position: The index of the first bin index to hand out.
+        :param bins: The number of bins on the wheel.
+        """
+
+        super().__init__(bins)
+        self.indices = indices
+        self.position = position
+
+    def draw(self, size: int) -> list[int]:
+        """
+        Reads the next **size** bin indices. Near the end of the sequence, fewer indices are
+        returned.
+
+        :param size: the number of bin indices to read.
+        :return: list of bin indices.
+        """
+
+        indices = self.indices[self.position : self.position + size]
+        if len(indices) == 0:
+            raise ValueError("The spin sequence is exhausted")
+        self.position += len(indices)
+        tolist = getattr(indices, "tolist", None)
+        if tolist is not None:
+            return tolist()
+        return list(indices)
+
+
+class SpinLogGenerator(SequenceGenerator):
+    """
+    :class:`SpinLogGenerator` replays the bin indices of a spin log, a NumPy ``.npy`` file written
+    by :func:`write_spin_log`, instead of drawing random numbers. The log is memory-mapped, so only
+    the blocks actually read are loaded. Every run which replays the same log sees exactly the same
+    spins.
+
+    .. attribute:: log
+
+       The memory-mapped array of bin indices.
+    """
+
+    def __init__(self, path: str, position: int = 0, bins: int = 38) -> None:
+        """
+        :param path: The name of the spin log file.
+        :param position: The index of the first bin index to replay.
+        :param bins: The number of bins on the wheel.
+        """
+
+        # pylint: disable-next=import-outside-toplevel
+        import numpy as np
+
+        self.log = np.load(path, mmap_mode="r")
+        super().__init__(self.log, position, bins)
+
+
+def write_spin_log(
+    path: str, spins: int, seed: Optional[int] = None, bins: int = 38
+) -> None:
+    """
+    Draws bin indices with a :class:`PCG64Generator` and writes them to a NumPy ``.npy`` spin log,
+    one byte per spin. The indices are drawn and written one block at a time, so the log can be
+    larger than memory.
+
+    :param path: The name of the spin log file.
+    :param spins: The number of spins in the log.
+    :param seed: The seed of the generator.
+    :param bins: The number of bins on the wheel.
+    """
+
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    generator = PCG64Generator(seed, bins)
+    log = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(spins,))
+    block = 1_048_576
+    for start in range(0, spins, block):
+        count = min(block, spins - start)
+        log[start : start + count] = generator.draw(count)
+    log.flush()
+    del log
+
+
+class SpinStream:
+    """
+    :class:`SpinStream` hands out bin indices one at a time from a buffer, which is refilled with a
+    whole block of indices from its :class:`SpinGenerator` when it runs out.
+
+    .. attribute:: generator
+
+       The :class:`SpinGenerator` which draws the bin indices.
+
+    .. attribute:: blockSize
+
+       The number of bin indices drawn at a time.
+    """
+
+    def __init__(self, generator: SpinGenerator, blockSize: int = 4096) -> None:
+        """
+        :param generator: The generator which draws the bin indices.
+        :param blockSize: The number of bin indices drawn at a time.
+        """
+
+        if blockSize < 1:
+            raise ValueError("The block size must be at least 1")
+        self.generator = generator
+        self.blockSize = blockSize
+        self._buffer: list[int] = []
+        self._position = 0
+
+    def next(self) -> int:
+        """
+        Returns the next bin index, drawing a new block if the buffer is exhausted.
+
+        :return: a bin index.
+        :rtype: int
+        """
+
+        if self._position == len(self._buffer):
+            self._buffer = self.generator.draw(self.blockSize)
+            self._position = 0
+        index = self._buffer[self._position]
+        self._position += 1
+        return index
+
+    def take(self, count: int) -> list[int]:
+        """
+        Returns the next **count** bin indices at once.
+
+        :param count: the number of bin indices.
+        :return: list of bin indices.
+        """
+
+        indices = self._buffer[self._position : self._position + count]
+        self._position += len(indices)
+        if len(indices) < count:
+            indices.extend(self.generator.draw(count - len(indices)))
+        return indices
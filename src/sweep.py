@@ -0,0 +1,280 @@
+import json
+import os
+from itertools import product
+from typing import Any, Iterator, NamedTuple
+import click
+from parallel_simulator import SessionJob, run_jobs, run_sessions
+from running_statistics import RunningStatistics
+from seed_sequence import SeedStream
+
+
+class SweepCell(NamedTuple):
+    """
+    :class:`SweepCell` is one point of a parameter grid: a strategy played with a given initial
+    stake, duration and table limit.
+    """
+
+    playerName: str
+    initStake: int
+    initDuration: int
+    limit: int
+
+    def key(self) -> str:
+        """
+        Returns a string which identifies the cell, used to recognise cells already written to the
+        output file.
+        """
+
+        return f"{self.playerName}/{self.initStake}/{self.initDuration}/{self.limit}"
+
+    def job(self, samples: int, seed: int) -> SessionJob:
+        """
+        Returns the sessions of the cell. Their seeds are spawned from the child of the master
+        **seed** named by the cell’s key, so a cell gives the same result whichever worker runs it
+        and in whatever order.
+
+        :param samples: the number of sessions.
+        :param seed: the master seed of the sweep.
+        """
+
+        seeds = SeedStream(seed).child(self.key()).integers(samples)
+        return SessionJob(
+            self.playerName, self.initStake, self.initDuration, seeds, self.limit
+        )
+
+
+def summarize(statistics: RunningStatistics) -> dict[str, float]:
+    """
+    Returns the summary of a set of values written for each cell.
+
+    :param statistics: the values.
+    :return: a **dict** with the mean, standard deviation, minimum, median and maximum.
+    """
+
+    return {
+        "mean": statistics.mean(),
+        "stdev": statistics.stdev() if statistics.count > 1 else 0.0,
+        "min": statistics.minimum,
+        "median": statistics.quantile(0.5),
+        "max": statistics.maximum,
+    }
+
+
+def run_cell(cell: SweepCell, samples: int, seed: int) -> dict[str, Any]:
+    """
+    Plays the sessions of one cell, as given by **SweepCell.job()**, and returns its summary.
+
+    :param cell: the cell to run.
+    :param samples: the number of sessions.
+    :param seed: the master seed of the sweep.
+    :return: the summary, as returned by :func:`cell_summary`.
+    """
+
+    return cell_summary(cell, samples, seed, run_sessions(*cell.job(samples, seed)))
+
+
+def cell_summary(
+    cell: SweepCell, samples: int, seed: int, results: list[tuple[int, int]]
+) -> dict[str, Any]:
+    """
+    Returns the summary of a cell written to the output file.
+
+    :param cell: the cell.
+    :param samples: the number of sessions.
+    :param seed: the master seed of the sweep.
+    :param results: the duration and maximum of every session of the cell.
+    :return: a **dict** with the cell’s parameters, and summaries of its durations and maxima.
+    """
+
+    durations = RunningStatistics(duration for duration, _ in results)
+    maxima = RunningStatistics(maximum for _, maximum in results)
+    return {
+        "key": cell.key(),
+        "player": cell.playerName,
+        "stake": cell.initStake,
+        "duration": cell.initDuration,
+        "limit": cell.limit,
+        "samples": samples,
+        "seed": seed,
+        "durations": summarize(durations),
+        "maxima": summarize(maxima),
+    }
+
+
+class Sweep:  # pylint: disable=too-many-instance-attributes
+    """
+    :class:`Sweep` runs every cell of a grid of strategies, initial stakes, durations and table
+    limits, and writes one summary per cell to a JSON Lines file.
+
+    The sessions of the cells are played by :func:`run_jobs`, in chunks scheduled on a pool of
+    worker processes. Each worker builds the American wheel layout once and shares it between all
+    the chunks it runs. A cell’s summary is appended to the file, and
+    flushed, as soon as the cell finishes, so an interrupted sweep loses at most the cells which
+    were running. Running the sweep again with the same output file resumes it: the cells whose
+    summaries are already in the file are skipped. A file written with another number of samples
+    or another seed can’t be resumed, since its cells would not match the ones run now.
+
+    .. attribute:: players
+
+       The names of the players, as accepted by :func:`player_factory`.
+
+    .. attribute:: stakes
+
+       The initial stakes.
+
+    .. attribute:: durations
+
+       The initial durations.
+
+    .. attribute:: limits
+
+       The table limits.
+
+    .. attribute:: samples
+
+       The number of game sessions to simulate in each cell.
+
+    .. attribute:: path
+
+       The name of the JSON Lines output file.
+
+    .. attribute:: workers
+
+       The number of worker processes. With a single worker, the cells are run in the current
+       process.
+
+    .. attribute:: seed
+
+       The master seed from which the seeds of every cell are derived.
+
+    .. attribute:: chunkSize
+
+       The largest number of sessions handed to a worker at a time.
+    """
+
+    def __init__(
+        self, grid: dict[str, Any], path: str, workers: int = 1, seed: int = 0
+    ) -> None:
+        """
+        :param grid: The grid spec: a **dict** with the lists **players**, **stakes**,
+                     **durations** and **limits**, and the int **samples**. Any missing entry takes
+                     the same default as :class:`Simulator` and :class:`Table`.
+        :param path: The name of the output file.
+        :param workers: The number of worker processes.
+        :param seed: The master seed.
+        """
+
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        self.players: list[str] = grid["players"]
+        self.stakes: list[int] = grid.get("stakes", [100])
+        self.durations: list[int] = grid.get("durations", [250])
+        self.limits: list[int] = grid.get("limits", [300])
+        self.samples: int = grid.get("samples", 50)
+        self.path = path
+        self.workers = workers
+        self.seed = seed
+        self.chunkSize = 64
+
+    def cells(self) -> Iterator[SweepCell]:
+        """
+        Returns an iterator over every cell of the grid.
+        """
+
+        for cell in product(self.players, self.stakes, self.durations, self.limits):
+            yield SweepCell(*cell)
+
+    def completed(self) -> set[str]:
+        """
+        Reads the keys of the cells already written to the output file. A last line left
+        incomplete by an interrupted sweep is ignored, so that cell is run again.
+
+        :return: set of cell keys.
+        :raises ValueError: if a cell in the file was run with another **samples** or **seed**.
+        """
+
+        if not os.path.exists(self.path):
+            return set()
+        keys = set()
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    summary = json.loads(line)
+                    key = summary["key"]
+                except (ValueError, KeyError):
+                    continue
+                settings = (summary.get("samples"), summary.get("seed"))
+                if settings != (self.samples, self.seed):
+                    raise ValueError(
+                        f"{self.path} holds cell {key} run with samples={settings[0]} and "
+                        f"seed={settings[1]}, not samples={self.samples} and seed={self.seed}; "
+                        "use another output file"
+                    )
+                keys.add(key)
+        return keys
+
+    def pending(self) -> list[SweepCell]:
+        """
+        Returns the cells which are not in the output file yet.
+        """
+
+        completed = self.completed()
+        return [cell for cell in self.cells() if cell.key() not in completed]
+
+    def run(self) -> int:
+        """
+        Runs every pending cell, appending the summary of each to the output file as soon as it
+        finishes.
+
+        :return: the number of cells run.
+        """
+
+        self._truncateIncompleteLine()
+        pending = self.pending()
+        jobs = [cell.job(self.samples, self.seed) for cell in pending]
+        with open(self.path, "a", encoding="utf-8") as file:
+            for index, results in run_jobs(jobs, self.workers, self.chunkSize):
+                summary = cell_summary(pending[index], self.samples, self.seed, results)
+                self._write(file, summary)
+        return len(pending)
+
+    @staticmethod
+    def _write(file: Any, summary: dict[str, Any]) -> None:
+        file.write(json.dumps(summary) + "\n")
+        file.flush()
+
+    def _truncateIncompleteLine(self) -> None:
+        """
+        Removes a last line left without its newline by an interrupted sweep, so the next summary
+        starts on a line of its own.
+        """
+
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as file:
+            content = file.read()
+            if content and not content.endswith(b"\n"):
+                file.truncate(content.rfind(b"\n") + 1)
+
+
+@click.command()
+@click.argument("grid_path")
+@click.option("--output", default="sweep.jsonl", help="JSON Lines file to append to.")
+@click.option("--workers", default=1, help="Number of worker processes.")
+@click.option("--seed", default=0, help="Master seed of the sweep.")
+def main(grid_path, output, workers, seed) -> None:  # pragma: no cover
+    """
+    Runs the sweep described by the JSON grid spec in GRID_PATH, resuming it if the output file
+    already holds some of its cells.
+    """
+    with open(grid_path, encoding="utf-8") as file:
+        grid = json.load(file)
+    sweep = Sweep(grid, output, workers, seed)
+    try:
+        print(f"Running {sweep.run()} cells into {output}")
+    except ValueError as error:
+        raise click.ClickException(str(error)) from error
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()  # pylint: disable=no-value-for-parameter
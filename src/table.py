@@ -1,8 +1,46 @@
-from typing import Iterator
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator
 from bet import Bet
 from invalid_bet import InvalidBet
 
 
+class BetsView(Sequence[Bet]):
+    """
+    :class:`BetsView` is a read-only view of the **list** of :class:`Bet` instances on a
+    :class:`Table`. It follows the list as bets are placed and cleared, but has no methods to
+    change it, so every bet goes through **Table.placeBet()**, which keeps the running total in
+    step. It compares equal to any sequence of the same bets.
+    """
+
+    __slots__ = ("_bets",)
+
+    def __init__(self, bets: list[Bet]) -> None:
+        """
+        :param bets: The list to view.
+        """
+
+        self._bets = bets
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._bets[index]
+
+    def __len__(self) -> int:
+        return len(self._bets)
+
+    def __iter__(self) -> Iterator[Bet]:
+        return iter(self._bets)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BetsView):
+            return self._bets == other._bets
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return self._bets == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BetsView({self._bets!r})"
+
+
 class Table:
     """
     :class:`Table` contains all the :class:`Bet` instances created by a :class:`Player` object. A
@@ -21,9 +59,14 @@ class Table:
 
     .. attribute:: bets
 
-       This is a **list** of the :class:`Bet` instances currently active. These will result in
-       either wins or losses to the :class:`Player` object.
+       This is a read-only :class:`BetsView` of the :class:`Bet` instances currently active. These
+       will result in either wins or losses to the :class:`Player` object. Bets are added with
+       **placeBet()**; assigning a sequence of bets to it places each of them in turn.
 
+    .. attribute:: total
+
+       The sum of the amounts of the bets, as they were when placed, kept up to date as bets are
+       placed and cleared, so the table limit is checked without adding up the bets again.
     """
 
     def __init__(self, *bets) -> None:
@@ -34,8 +77,26 @@ class Table:
                     an empty **list** will be used.
         """
 
-        self.bets = list(bets) if bets else []
+        self._bets: list[Bet] = []
+        self._view = BetsView(self._bets)
+        self.total = 0
         self.limit = 300
+        for bet in bets:
+            self.placeBet(bet)
+
+    @property
+    def bets(self) -> BetsView:
+        """
+        Returns a read-only view of the current :class:`Bet` instances.
+        """
+
+        return self._view
+
+    @bets.setter
+    def bets(self, bets: Iterable[Bet]) -> None:
+        self.clear()
+        for bet in bets:
+            self.placeBet(bet)
 
     def placeBet(self, bet: Bet) -> None:
         """
@@ -44,7 +105,17 @@ class Table:
         :param bet: A :class:`Bet` instance to be added to the table.
         """
 
-        self.bets.append(bet)
+        self._bets.append(bet)
+        self.total += bet.amount
+
+    def clear(self) -> None:
+        """
+        Removes all of the :class:`Bet` instances, ready for the next round. The **list** is
+        emptied in place rather than replaced, so nothing new is made on every spin.
+        """
+
+        self._bets.clear()
+        self.total = 0
 
     def __iter__(self) -> Iterator[Bet]:
         """
@@ -54,26 +125,30 @@ class Table:
         :return: iterator over all bets.
         """
 
-        return iter(self.bets)
+        return iter(self._bets)
 
-    def isValid(self) -> None:
+    def validate(self) -> bool:
         """
-        **Raises:** :class:`InvalidBet` if the bets don’t pass the table limit rules.
-
         Applies the table-limit rules:
 
             - The sum of all bets is less than or equal to the table limit.
 
             - All bet amounts are greater than or equal to the table minimum.
 
-        If there’s a problem an :class:`InvalidBet` exception is raised.
+        :return: :samp:`True` if the bets pass the rules, :samp:`False` otherwise.
+        """
+
+        return self.total <= self.limit
+
+    def isValid(self) -> None:
+        """
+        **Raises:** :class:`InvalidBet` if the bets don’t pass the table limit rules.
+
+        This is **validate()** for callers which prefer an exception to a status.
         """
 
-        bets_sum = 0
-        for bet in self.bets:
-            bets_sum += bet.amount
-            if bets_sum > self.limit:
-                raise InvalidBet
+        if not self.validate():
+            raise InvalidBet
 
     def __str__(self) -> str:
         """
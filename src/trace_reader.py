@@ -0,0 +1,189 @@
+import os
+from typing import Callable, Iterator
+import numpy as np
+from running_statistics import RunningStatistics
+from trace_writer import TRACE_COLUMNS
+
+
+def drawdown(stakes: np.ndarray) -> int:
+    """
+    Returns the largest fall of the stake from a previous peak during a session.
+
+    :param stakes: the stakes of a session, one per spin.
+    :return: the maximum drawdown.
+    """
+
+    return int((np.maximum.accumulate(stakes) - stakes).max())
+
+
+def time_to_peak(stakes: np.ndarray) -> int:
+    """
+    Returns the number of spins played when the stake first reached its maximum.
+
+    :param stakes: the stakes of a session, one per spin.
+    :return: the spin count, starting at one.
+    """
+
+    return int(np.argmax(stakes)) + 1
+
+
+class TraceReader:
+    """
+    :class:`TraceReader` reads the session traces written by a :class:`TraceWriter`, without
+    loading them into memory.
+
+    Each column file is memory-mapped, and the stakes, bets or results of a session are returned
+    as a view into the mapping, so nothing is copied until the values are used. The summaries are
+    computed by streaming over the trace one block of whole sessions at a time, with at most
+    **chunkSize** rows in memory, into :class:`RunningStatistics` accumulators, so traces larger
+    than the memory of the machine can be summarized. The accumulators have the same **mean()**
+    and **stdev()** as :class:`IntegerStatistics`.
+
+    Sessions which ended before their first spin have no rows in the trace, so they are not
+    counted.
+
+    .. attribute:: directory
+
+       The directory holding the column files.
+
+    .. attribute:: columns
+
+       A **dict** mapping the name of each column to its memory-mapped array.
+
+    .. attribute:: starts
+
+       The row at which each session starts, followed by the total number of rows.
+
+    .. attribute:: chunkSize
+
+       The largest number of rows read at a time when streaming.
+    """
+
+    def __init__(self, directory: str, chunkSize: int = 1_048_576) -> None:
+        """
+        Maps the column files and finds where each session starts.
+
+        :param directory: The directory holding the column files.
+        :param chunkSize: The largest number of rows read at a time.
+        """
+
+        self.directory = directory
+        self.chunkSize = chunkSize
+        self.columns: dict[str, np.ndarray] = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+            for name in TRACE_COLUMNS
+        }
+        self.starts = self._findStarts()
+
+    def _findStarts(self) -> np.ndarray:
+        spins = self.columns["spin"]
+        starts = [
+            np.flatnonzero(spins[offset : offset + self.chunkSize] == 0) + offset
+            for offset in range(0, len(spins), self.chunkSize)
+        ]
+        starts.append(np.array([len(spins)]))
+        return np.concatenate(starts).astype(np.int64)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of sessions in the trace.
+        """
+
+        return len(self.starts) - 1
+
+    def column(self, name: str, session: int) -> np.ndarray:
+        """
+        Returns a view of one column of a session, without copying it.
+
+        :param name: the name of the column, one of **TRACE_COLUMNS**.
+        :param session: the index of the session.
+        :return: the values of the column, one per spin.
+        """
+
+        if not 0 <= session < len(self):
+            raise IndexError("session index out of range")
+        return self.columns[name][self.starts[session] : self.starts[session + 1]]
+
+    def stakes(self, session: int) -> np.ndarray:
+        """
+        Returns a view of the stakes of a session, without copying them.
+
+        :param session: the index of the session.
+        :return: the stake after each spin.
+        """
+
+        return self.column("stake", session)
+
+    def blocks(self) -> Iterator[tuple[int, int]]:
+        """
+        Splits the sessions into blocks of consecutive sessions with at most **chunkSize** rows,
+        except that a single session longer than that makes a block of its own.
+
+        :return: iterator over ``(first session, end session)`` pairs.
+        """
+
+        first = 0
+        while first < len(self):
+            limit = self.starts[first] + self.chunkSize
+            end = int(np.searchsorted(self.starts, limit, side="right")) - 1
+            end = min(max(end, first + 1), len(self))
+            yield first, end
+            first = end
+
+    def durations(self) -> RunningStatistics:
+        """
+        Streams the durations of the sessions into a :class:`RunningStatistics`.
+        """
+
+        statistics = RunningStatistics()
+        statistics.extend(np.diff(self.starts).tolist())
+        return statistics
+
+    def maxima(self) -> RunningStatistics:
+        """
+        Streams the maximum stakes of the sessions into a :class:`RunningStatistics`.
+        """
+
+        statistics = RunningStatistics()
+        stakes = self.columns["stake"]
+        for first, end in self.blocks():
+            rows = stakes[self.starts[first] : self.starts[end]]
+            offsets = self.starts[first:end] - self.starts[first]
+            statistics.extend(np.maximum.reduceat(rows, offsets).tolist())
+        return statistics
+
+    def reduce(self, reducer: Callable[[np.ndarray], int]) -> RunningStatistics:
+        """
+        Streams a metric of each session into a :class:`RunningStatistics`.
+
+        :param reducer: a function of the stakes of a session, such as :func:`drawdown` or
+                        :func:`time_to_peak`.
+        :return: the statistics of the metric.
+        """
+
+        statistics = RunningStatistics()
+        for first, end in self.blocks():
+            rows = np.asarray(
+                self.columns["stake"][self.starts[first] : self.starts[end]]
+            )
+            offsets = self.starts[first : end + 1] - self.starts[first]
+            for start, stop in zip(offsets[:-1], offsets[1:]):
+                statistics.append(reducer(rows[start:stop]))
+        return statistics
+
+    def ruinProbability(self, initDuration: int) -> np.ndarray:
+        """
+        Computes, for each spin, the probability that a session has ended by that spin. A session
+        shorter than **initDuration** ended because the player stopped playing, rather than
+        because the rounds ran out.
+
+        :param initDuration: the duration the sessions were allowed to last.
+        :return: an array of **initDuration** probabilities; the value at index *k* is the
+                 fraction of sessions which ended within *k* + 1 spins.
+        """
+
+        lengths = np.diff(self.starts)
+        ended = np.bincount(
+            lengths[lengths < initDuration], minlength=initDuration + 1
+        )[1 : initDuration + 1]
+        return np.cumsum(ended) / max(len(self), 1)
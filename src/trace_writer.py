@@ -0,0 +1,163 @@
+import os
+from types import TracebackType
+from typing import BinaryIO, Optional
+import numpy as np
+
+TRACE_COLUMNS: dict[str, np.dtype] = {
+    "session": np.dtype("<i8"),
+    "spin": np.dtype("<i4"),
+    "stake": np.dtype("<i8"),
+    "bet": np.dtype("<i8"),
+    "won": np.dtype("|b1"),
+}
+
+_MAGIC = b"\x93NUMPY\x01\x00"
+_HEADER_SIZE = 128
+
+
+def npy_header(dtype: np.dtype, rows: int) -> bytes:
+    """
+    Returns a version 1.0 ``.npy`` header for a one-dimensional array, padded with spaces to a
+    fixed size, so that the header can be rewritten in place once the number of rows is known.
+
+    :param dtype: the type of the array.
+    :param rows: the length of the array.
+    :return: the header, **_HEADER_SIZE** bytes long.
+    """
+
+    description = {"descr": dtype.str, "fortran_order": False, "shape": (rows,)}
+    text = repr(description).encode("latin1")
+    padding = _HEADER_SIZE - len(_MAGIC) - 2 - len(text) - 1
+    if padding < 0:
+        raise ValueError("The .npy header does not fit")
+    length = (len(text) + padding + 1).to_bytes(2, "little")
+    return _MAGIC + length + text + b" " * padding + b"\n"
+
+
+class TraceWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    :class:`TraceWriter` streams the stake trajectories of game sessions to disk, one row per spin,
+    in a columnar layout: a directory with one NumPy ``.npy`` file per column of
+    **TRACE_COLUMNS**, the session id, the spin index within the session, the stake after the
+    spin, the total amount bet and whether any bet won.
+
+    Rows are written into fixed-size NumPy buffers, one per column, and each full buffer is
+    appended to its file as a single block, so memory use is bounded by **bufferSize** whatever
+    the length of the run, and no Python object is kept per spin. Each file starts with a
+    fixed-size header which is rewritten with the final number of rows when the writer is
+    closed, so the files can be read back, or memory-mapped, with **numpy.load()**.
+
+    A writer is a context manager; leaving the **with** block closes it.
+
+    .. attribute:: directory
+
+       The directory holding the column files.
+
+    .. attribute:: bufferSize
+
+       The number of rows buffered in memory before they are written out.
+
+    .. attribute:: rows
+
+       The number of rows recorded so far.
+
+    .. attribute:: sessions
+
+       The number of sessions started so far. The id of the current session is **sessions** - 1.
+    """
+
+    def __init__(self, directory: str, bufferSize: int = 65_536) -> None:
+        """
+        Creates the directory if needed and opens an empty file for each column.
+
+        :param directory: The directory holding the column files.
+        :param bufferSize: The number of rows buffered in memory.
+        """
+
+        if bufferSize < 1:
+            raise ValueError("The buffer size must be at least 1")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.bufferSize = bufferSize
+        self.rows = 0
+        self.sessions = 0
+        self._spin = 0
+        self._filled = 0
+        self._buffers = {
+            name: np.zeros(bufferSize, dtype=dtype)
+            for name, dtype in TRACE_COLUMNS.items()
+        }
+        self._files: dict[str, BinaryIO] = {}
+        for name, dtype in TRACE_COLUMNS.items():
+            file = open(  # pylint: disable=consider-using-with
+                os.path.join(directory, f"{name}.npy"), "wb"
+            )
+            file.write(npy_header(dtype, 0))
+            self._files[name] = file
+
+    def startSession(self) -> int:
+        """
+        Starts a new session, whose spins are numbered from zero.
+
+        :return: the id of the new session.
+        """
+
+        self.sessions += 1
+        self._spin = 0
+        return self.sessions - 1
+
+    def record(self, stake: int, bet: int, won: bool) -> None:
+        """
+        Records one spin of the current session.
+
+        :param stake: the stake after the spin.
+        :param bet: the total amount bet on the spin.
+        :param won: whether any bet won.
+        """
+
+        row = self._filled
+        self._buffers["session"][row] = self.sessions - 1
+        self._buffers["spin"][row] = self._spin
+        self._buffers["stake"][row] = stake
+        self._buffers["bet"][row] = bet
+        self._buffers["won"][row] = won
+        self._spin += 1
+        self._filled += 1
+        self.rows += 1
+        if self._filled == self.bufferSize:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Appends the buffered rows to the column files.
+        """
+
+        for name, file in self._files.items():
+            file.write(self._buffers[name][: self._filled].tobytes())
+        self._filled = 0
+
+    def close(self) -> None:
+        """
+        Writes out the buffered rows, rewrites each header with the final number of rows and
+        closes the files.
+        """
+
+        if not self._files:
+            return
+        self.flush()
+        for name, file in self._files.items():
+            file.seek(0)
+            file.write(npy_header(TRACE_COLUMNS[name], self.rows))
+            file.close()
+        self._files = {}
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
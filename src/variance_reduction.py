@@ -0,0 +1,308 @@
+import math
+import statistics
+from itertools import product
+from typing import NamedTuple
+from bin import Bin
+from game import Game
+from outcome import Outcome
+from simulator import Simulator
+from spin_stream import SequenceGenerator, SpinStream
+from table import Table
+from wheel import Wheel
+from players.player import Player
+
+
+class Estimate(NamedTuple):
+    """
+    :class:`Estimate` is the result of one of the variance-reduced gathers of
+    :class:`VarianceReducedSimulator`: the number of sessions played, the estimated mean duration
+    and mean maximum, and, for each, the variance reduction factor. This is the variance of the
+    plain Monte Carlo mean over the same number of sessions divided by the variance of the
+    estimate, so a factor of 2 means plain sampling would need twice as many sessions for the same
+    precision.
+    """
+
+    samples: int
+    durations: float
+    maxima: float
+    durationsReduction: float
+    maximaReduction: float
+
+
+def mirror_bins(wheel: Wheel) -> tuple[int, ...]:
+    """
+    Pairs each red bin with a black bin, in the order of the bin numbers, and returns the index of
+    the paired bin for every bin; the zero bins are paired with themselves. Replacing every spin by
+    its pair gives a spin sequence exactly as likely as the original, on which every bet on red or
+    black has the opposite result.
+
+    :param wheel: the wheel.
+    :return: the index of the mirrored bin, for each bin index.
+    """
+
+    red = wheel.getOutcome("Red")
+    black = wheel.getOutcome("Black")
+    reds = [index for index, bin in enumerate(wheel.bins) if red in bin]
+    blacks = [index for index, bin in enumerate(wheel.bins) if black in bin]
+    mirror = list(range(len(wheel.bins)))
+    for red_index, black_index in zip(reds, blacks):
+        mirror[red_index] = black_index
+        mirror[black_index] = red_index
+    return tuple(mirror)
+
+
+def variance_reduction(plain: float, reduced: float) -> float:
+    """
+    Returns the ratio of the variance of a plain estimate to the variance of a reduced one,
+    which is infinite when the reduced estimate has no variance at all.
+    """
+
+    if reduced == 0:
+        return math.inf if plain > 0 else 1.0
+    return plain / reduced
+
+
+class ExpectationGame(Game):
+    """
+    :class:`ExpectationGame` is a :class:`Game` which also adds up the expected net win of every
+    bet it resolves, from the known house edge of its :class:`Outcome`. The difference between
+    the player’s actual net win and this sum has an expected value of zero, which makes it a
+    control variate.
+
+    .. attribute:: expected
+
+       The expected net win of the bets resolved since it was last reset.
+    """
+
+    def __init__(self, wheel: Wheel, table: Table) -> None:
+        super().__init__(wheel, table)
+        self.expected = 0.0
+        self._edges: dict[Outcome, float] = {}
+
+    def edge(self, outcome: Outcome) -> float:
+        """
+        Returns the expected net win of a bet of one on the given :class:`Outcome`; negative, the
+        house edge.
+        """
+
+        if outcome not in self._edges:
+            winning = sum(1 for bin in self.wheel.bins if outcome in bin)
+            self._edges[outcome] = (
+                winning / len(self.wheel.bins) * (outcome.odds + 1) - 1
+            )
+        return self._edges[outcome]
+
+    def settle(self, player: Player, winning_bin: Bin) -> None:
+        for bet in self.table:
+            self.expected += bet.amount * self.edge(bet.outcome)
+        super().settle(player, winning_bin)
+
+
+class VarianceReducedSimulator(Simulator):
+    """
+    :class:`VarianceReducedSimulator` is a :class:`Simulator` which estimates the mean duration
+    and mean maximum stake with fewer sessions than plain Monte Carlo, in one of three modes:
+
+    - **gatherAntithetic()** plays sessions in pairs, the second on the spins of the first with
+      red and black swapped by :func:`mirror_bins`.
+
+    - **gatherControlVariate()** corrects each session by the difference between the player’s
+      net win and its expected value from the house edge of the bets placed.
+
+    - **gatherStratified()** splits the sessions by the colours of their first spins, whose
+      probabilities are known exactly.
+
+    These suit the strategies which bet on red or black, such as :class:`Martingale`,
+    :class:`PlayerFibonacci`, :class:`PlayerCancellation` and :class:`Player1326`. Each mode
+    returns an :class:`Estimate` with its variance reduction factor against plain Monte Carlo.
+    The raw duration and maximum of every session are still appended to **durations** and
+    **maxima**; in the stratified mode those lists over-represent the rare strata, so the means
+    must be taken from the :class:`Estimate`.
+
+    Every session is played on a spin sequence of **initDuration** bin indices drawn up front
+    with the wheel’s **rng**.
+
+    .. attribute:: mirror
+
+       The index of the mirrored bin, for each bin index.
+    """
+
+    def __init__(self, game: Game, player: Player) -> None:
+        """
+        :param game: The game we’re simulating.
+        :param player: The player.
+        """
+
+        super().__init__(game, player)
+        self.mirror = mirror_bins(game.wheel)
+
+    def draw(self, count: int) -> list[int]:
+        """
+        Draws **count** random bin indices with the wheel’s **rng**.
+        """
+
+        bins = len(self.game.wheel.bins)
+        return [self.game.wheel.rng.randrange(bins) for _ in range(count)]
+
+    def replay(self, spins: list[int]) -> tuple[int, int]:
+        """
+        Plays one session on the given spins, and records its duration and maximum stake.
+
+        :param spins: the bin indices, at least one per round.
+        :return: the duration and maximum stake of the session.
+        """
+
+        wheel = self.game.wheel
+        previous = wheel.spinStream
+        wheel.useSpinStream(SpinStream(SequenceGenerator(spins), max(len(spins), 1)))
+        try:
+            stake_values = self.session()
+        finally:
+            wheel.useSpinStream(previous)
+        duration = len(stake_values)
+        maximum = max(stake_values, default=self.initStake)
+        self.durations.append(duration)
+        self.maxima.append(maximum)
+        return duration, maximum
+
+    def gatherAntithetic(self) -> Estimate:
+        """
+        Plays **samples** sessions, rounded up to an even number, in antithetic pairs. Each pair
+        is estimated by its average; when one session of the pair runs into a losing streak its
+        mirror tends to run into a winning one, so the averages vary less than single sessions.
+
+        :return: the estimate.
+        """
+
+        pairs = max(math.ceil(self.samples / 2), 2)
+        values: list[tuple[int, int]] = []
+        averages: list[tuple[float, float]] = []
+        for _ in range(pairs):
+            spins = self.draw(self.initDuration)
+            first = self.replay(spins)
+            second = self.replay([self.mirror[index] for index in spins])
+            values.extend((first, second))
+            averages.append(((first[0] + second[0]) / 2, (first[1] + second[1]) / 2))
+        reductions = [
+            variance_reduction(
+                statistics.variance(value[metric] for value in values) / len(values),
+                statistics.variance(average[metric] for average in averages) / pairs,
+            )
+            for metric in (0, 1)
+        ]
+        return Estimate(
+            len(values),
+            statistics.fmean(average[0] for average in averages),
+            statistics.fmean(average[1] for average in averages),
+            *reductions,
+        )
+
+    def gatherControlVariate(self) -> Estimate:
+        """
+        Plays **samples** sessions, and measures for each the control: the player’s net win less
+        the expected net win of the bets they placed. The control has a known mean of zero, so
+        its observed mean, scaled by the regression coefficient of each metric on it, is
+        subtracted from the metric’s mean. The variance reduction factor is
+        :math:`1 / (1 - \\rho^2)`, where :math:`\\rho` is the correlation of metric and control.
+
+        :return: the estimate.
+        """
+
+        game = self.game
+        expectation = ExpectationGame(game.wheel, game.table)
+        self.game = expectation
+        samples = max(self.samples, 2)
+        values: list[tuple[int, int]] = []
+        controls: list[float] = []
+        try:
+            for _ in range(samples):
+                expectation.expected = 0.0
+                values.append(self.replay(self.draw(self.initDuration)))
+                controls.append(
+                    self.player.stake - self.initStake - expectation.expected
+                )
+        finally:
+            self.game = game
+        control_mean = statistics.fmean(controls)
+        control_variance = statistics.variance(controls)
+        means = []
+        reductions = []
+        for metric in (0, 1):
+            metric_values = [value[metric] for value in values]
+            variance = statistics.variance(metric_values)
+            beta = 0.0
+            if control_variance > 0:
+                beta = statistics.covariance(metric_values, controls) / control_variance
+            means.append(statistics.fmean(metric_values) - beta * control_mean)
+            adjusted = [
+                value - beta * control
+                for value, control in zip(metric_values, controls)
+            ]
+            reductions.append(
+                variance_reduction(variance, statistics.variance(adjusted))
+            )
+        return Estimate(samples, means[0], means[1], *reductions)
+
+    def gatherStratified(  # pylint: disable=too-many-locals
+        self, spins: int = 2
+    ) -> Estimate:
+        """
+        Splits the sessions into strata by the colour, red, black or green, of each of their
+        first **spins** spins. The probability of every stratum is known exactly, so each gets
+        its proportional share of **samples**, but at least two sessions, and the stratum means
+        are weighted by those probabilities. The variation between strata, which is large for a
+        strategy betting on one colour, then no longer adds to the variance of the estimate.
+
+        :param spins: the number of leading spins whose colours define the strata.
+        :return: the estimate.
+        """
+
+        wheel = self.game.wheel
+        red = wheel.getOutcome("Red")
+        black = wheel.getOutcome("Black")
+        colours: list[list[int]] = [[], [], []]
+        for index, bin in enumerate(wheel.bins):
+            colours[0 if red in bin else 1 if black in bin else 2].append(index)
+        strata = []
+        for pattern in product(range(3), repeat=min(spins, self.initDuration)):
+            probability = math.prod(
+                len(colours[colour]) / len(wheel.bins) for colour in pattern
+            )
+            count = max(round(self.samples * probability), 2)
+            values = [
+                self.replay(
+                    [wheel.rng.choice(colours[colour]) for colour in pattern]
+                    + self.draw(self.initDuration - len(pattern))
+                )
+                for _ in range(count)
+            ]
+            strata.append((probability, values))
+        samples = sum(len(values) for _, values in strata)
+        means = []
+        reductions = []
+        for metric in (0, 1):
+            stratum_means = [
+                statistics.fmean(value[metric] for value in values)
+                for _, values in strata
+            ]
+            stratum_variances = [
+                statistics.variance(value[metric] for value in values)
+                for _, values in strata
+            ]
+            mean = sum(
+                probability * stratum_mean
+                for (probability, _), stratum_mean in zip(strata, stratum_means)
+            )
+            plain = sum(
+                probability * (variance + (stratum_mean - mean) ** 2)
+                for (probability, _), stratum_mean, variance in zip(
+                    strata, stratum_means, stratum_variances
+                )
+            )
+            stratified = sum(
+                probability**2 * variance / len(values)
+                for (probability, values), variance in zip(strata, stratum_variances)
+            )
+            means.append(mean)
+            reductions.append(variance_reduction(plain / samples, stratified))
+        return Estimate(samples, means[0], means[1], *reductions)
@@ -0,0 +1,138 @@
+from typing import Optional
+import numpy as np
+from integer_statistics import IntegerStatistics
+from outcome import Outcome
+from wheel import Wheel
+
+
+class VectorizedSimulator:  # pylint: disable=too-many-instance-attributes
+    """
+    :class:`VectorizedSimulator` gathers the same raw statistics as :class:`Simulator` for a player
+    whose bet does not depend on the history of the game, such as
+    :py:class:`~players.passenger57.Passenger57`, who bets the same amount on the same
+    :class:`Outcome` on every spin.
+
+    Instead of cycling a :class:`Game` one spin at a time, every spin of a whole batch of sessions
+    is drawn at once as an array of bin indices. The stake trajectories are the cumulative sums of
+    the amounts won and lost, and the duration and maximum of each session are taken from the index
+    at which the player is ruined.
+
+    .. attribute:: wheel
+
+       The :class:`Wheel` instance whose payout matrix decides which spins the bet wins.
+
+    .. attribute:: outcome
+
+       The :class:`Outcome` the player bets on.
+
+    .. attribute:: betAmount
+
+       The amount the player bets on every spin.
+
+    .. attribute:: stopWhenBroke
+
+       If :samp:`True`, the session ends as soon as the stake is less than **betAmount**. If
+       :samp:`False`, the player keeps playing until the rounds run out, like
+       :py:class:`~players.passenger57.Passenger57` does.
+
+    .. attribute:: rng
+
+       A NumPy random number generator used to draw the bin indices.
+
+    .. attribute:: batchSize
+
+       The number of sessions drawn at once. This bounds the memory used by the spin array.
+
+    .. attribute:: initDuration
+
+       The duration value to use when initializing a session.
+
+    .. attribute:: initStake
+
+       The stake value to use when initializing a session.
+
+    .. attribute:: samples
+
+       The number of game sessions to simulate.
+
+    .. attribute:: durations
+
+       A **list** of lengths of time the player remained in the game.
+
+    .. attribute:: maxima
+
+       A **list** of maximum stakes of the player.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        wheel: Wheel,
+        outcome: Outcome,
+        betAmount: int,
+        stopWhenBroke: bool = False,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Saves the :class:`Wheel`, the :class:`Outcome` and the bet amount that define the fixed bet.
+
+        :param wheel: The wheel, with its bins and payout matrix already built.
+        :param outcome: The outcome the player bets on.
+        :param betAmount: The amount bet on every spin.
+        :param stopWhenBroke: Whether the session ends when the stake can't cover the bet.
+        :param seed: The seed of the random number generator.
+        """
+
+        self.wheel = wheel
+        self.outcome = outcome
+        self.betAmount = betAmount
+        self.stopWhenBroke = stopWhenBroke
+        self.rng = np.random.default_rng(seed)
+        self.initStake = 100
+        self.initDuration = 250
+        self.samples = 50
+        self.batchSize = 10_000
+        self.durations = IntegerStatistics()
+        self.maxima = IntegerStatistics()
+
+    def sessions(self, spins: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the duration and the maximum stake of a batch of sessions.
+
+        :param spins: A two-dimensional array of bin indices, one row per session and one column
+                      per spin. It must have at least **initDuration** columns.
+        :return: the array of durations and the array of maximum stakes, one value per session.
+        """
+
+        wins = self.wheel.payouts[:, self.wheel.getOutcomeId(self.outcome)] > 0
+        win_amount = int(self.outcome.winAmount(self.betAmount))
+        deltas = np.where(
+            wins[spins[:, : self.initDuration]], win_amount, -self.betAmount
+        ).astype(np.int64)
+        stakes = self.initStake + np.cumsum(deltas, axis=1)
+
+        durations = np.full(len(stakes), self.initDuration, dtype=np.int64)
+        if self.stopWhenBroke:
+            broke = stakes < self.betAmount
+            ruined = broke.any(axis=1)
+            durations[ruined] = np.argmax(broke[ruined], axis=1) + 1
+            played = np.arange(self.initDuration) < durations[:, np.newaxis]
+            stakes = np.where(played, stakes, np.iinfo(np.int64).min)
+        return durations, stakes.max(axis=1)
+
+    def gather(self) -> None:
+        """
+        Executes the number of game sessions in samples, **batchSize** sessions at a time, and
+        appends the duration and maximum stake of each session to the **durations** list and the
+        **maxima** list.
+        """
+
+        remaining = self.samples
+        while remaining > 0:
+            batch = min(remaining, self.batchSize)
+            spins = self.rng.integers(
+                0, len(self.wheel.bins), size=(batch, self.initDuration), dtype=np.uint8
+            )
+            durations, maxima = self.sessions(spins)
+            self.durations.extend(durations.tolist())
+            self.maxima.extend(maxima.tolist())
+            remaining -= batch
@@ -1,10 +1,11 @@
 import random
-from typing import Dict, Iterator
+from typing import Dict, Iterator, Optional
 from outcome import Outcome
 from bin import Bin
+from spin_stream import SpinStream
 
 
-class Wheel:
+class Wheel:  # pylint: disable=too-many-instance-attributes
     """
     :class:`Wheel` contains the 38 individual bins on a Roulette wheel, plus a random number
     generator. It can select a :class:`Bin` at random, simulating a spin of the Roulette wheel.
@@ -22,6 +23,21 @@ class Wheel:
 
         For testing, we’ll often want to seed this generator. For simulation processing, we can
         set the seed value using ``os.urandom()``.
+
+    .. attribute:: outcomes
+
+        A tuple of all the :class:`Outcome` instances on the wheel. The position of an
+        :class:`Outcome` in this tuple is its integer id.
+
+    .. attribute:: outcomeIds
+
+        Maps each :class:`Outcome` instance to its integer id.
+
+    .. attribute:: payouts
+
+        A dense matrix with one row per bin and one column per outcome id. Each cell holds the
+        multiplier applied to the amount of a winning bet, which is the odds plus one, or zero if
+        the :class:`Outcome` doesn't win in that bin. This is built by **buildPayoutMatrix()**.
     """
 
     def __init__(self) -> None:
@@ -32,34 +48,151 @@ class Wheel:
         At the present time, this does not do the full initialization of the Bin instances. We’ll
         rework this in a future exercise.
         """
+        # pylint: disable-next=import-outside-toplevel
+        import numpy as np
+
         self.bins = tuple(Bin() for _ in range(38))
         self.rng = random.Random()
         self.all_outcomes: Dict[str, Outcome] = {}
+        self.outcomes: tuple[Outcome, ...] = ()
+        self.outcomeIds: Dict[Outcome, int] = {}
+        self.payouts = np.zeros((len(self.bins), 0), dtype=np.int64)
+        self.spinStream: Optional[SpinStream] = None
+        self._building: Optional[list[set[Outcome]]] = None
 
     def addOutcome(self, number: int, outcome: Outcome) -> None:
         """
         Adds the given :class:`Outcome` object to the :class:`Bin` instance with the given number.
 
+        Between **startBuild()** and **finishBuild()**, the :class:`Outcome` is only collected in
+        a mutable set for the bin, which is cheap. Otherwise the :class:`Bin` is replaced at once.
+
         :param number: bin number, in the range zero to 37 inclusive.
         :type number: int
-        :param outcome: The Outcome to add to this Bin
+        :param outcome: The Outcome to add to this Bin. The shared instance from
+                        **Outcome.intern()** is stored in its place.
         :type outcome: Outcome
         """
-        updated_bin = Bin(list(self.bins[number].union(Bin([outcome]))))
-        self.bins = self.bins[:number] + (updated_bin,) + self.bins[number + 1 :]
+        outcome = Outcome.intern(outcome.name, outcome.odds)
+        if self._building is not None:
+            self._building[number].add(outcome)
+        else:
+            bins = list(self.bins)
+            bins[number] = Bin(bins[number] | {outcome})
+            self.bins = tuple(bins)
 
         self.all_outcomes[outcome.name] = outcome
 
+    def startBuild(self) -> None:
+        """
+        Starts collecting the outcomes given to **addOutcome()** in one mutable set per bin, so
+        that building all the bins doesn't create a new :class:`Bin` for every outcome.
+        """
+        self._building = [set(bin) for bin in self.bins]
+
+    def finishBuild(self) -> None:
+        """
+        Freezes the outcomes collected since **startBuild()** into the :class:`Bin` instances.
+        """
+        if self._building is None:
+            return
+        self.bins = tuple(Bin(outcomes) for outcomes in self._building)
+        self._building = None
+
+    def useLayout(self, layout: "Wheel") -> None:
+        """
+        Makes this wheel share the bins, outcomes and payout matrix of a wheel which is already
+        built. The shared :class:`Bin` instances and payout matrix are immutable; the outcome
+        lookups are copied so that adding outcomes later doesn't change the other wheel. The random
+        number generator is not shared.
+
+        :param layout: a :class:`Wheel` whose bins are built.
+        :type layout: Wheel
+        """
+        self.bins = layout.bins
+        self.all_outcomes = dict(layout.all_outcomes)
+        self.outcomes = layout.outcomes
+        self.outcomeIds = dict(layout.outcomeIds)
+        self.payouts = layout.payouts
+
+    def buildPayoutMatrix(self) -> None:
+        """
+        Gives each :class:`Outcome` an integer id and builds the **payouts** matrix from the
+        current :class:`Bin` instances. This is done once, after all the outcomes have been added;
+        any later call to **addOutcome()** requires the matrix to be built again.
+
+        The ids follow the order in which the outcomes were first added, so every wheel built by
+        the same :class:`BinBuilder` assigns the same ids.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import numpy as np
+
+        outcomes = list(self.all_outcomes.values())
+        known_outcomes = set(outcomes)
+        outcomes.extend(
+            sorted(
+                {outcome for bin in self.bins for outcome in bin} - known_outcomes,
+                key=lambda outcome: (outcome.name, outcome.odds),
+            )
+        )
+        self.outcomes = tuple(outcomes)
+        self.outcomeIds = {outcome: id for id, outcome in enumerate(self.outcomes)}
+
+        payouts = np.zeros((len(self.bins), len(self.outcomes)), dtype=np.int64)
+        for number, bin in enumerate(self.bins):
+            for outcome in bin:
+                payouts[number, self.outcomeIds[outcome]] = outcome.odds + 1
+        payouts.flags.writeable = False
+        self.payouts = payouts
+
+    def getOutcomeId(self, outcome: Outcome) -> int:
+        """
+        Returns the integer id of the given :class:`Outcome`, which is its column in the
+        **payouts** matrix.
+
+        :param outcome: an :class:`Outcome` on this wheel
+        :return: the id of the outcome
+        :rtype: int
+        """
+        if outcome not in self.outcomeIds:
+            raise KeyError(f"Outcome {outcome} has no id")
+        return self.outcomeIds[outcome]
+
+    def payout(self, bin: int, outcomeId: int, amount: int) -> int:
+        """
+        Resolves a bet of the given amount on the :class:`Outcome` with the given id against the
+        :class:`Bin` with the given number. This is a lookup in the **payouts** matrix.
+
+        :param bin: bin number, in the range zero to 37 inclusive.
+        :param outcomeId: the id of the :class:`Outcome` bet on.
+        :param amount: the amount bet.
+        :return: the amount paid back, including the amount bet, or zero if the bet lost.
+        :rtype: int
+        """
+        return amount * int(self.payouts[bin, outcomeId])
+
+    def useSpinStream(self, spinStream: Optional[SpinStream]) -> None:
+        """
+        Makes **choose()** take its bin indices from the given :class:`SpinStream`. Passing
+        :samp:`None` goes back to choosing with **rng**.
+
+        :param spinStream: the stream of bin indices, or :samp:`None`.
+        """
+        self.spinStream = spinStream
+
     def choose(self) -> Bin:
         """
         Generates a random number between 0 and 37, and returns the randomly selected Bin instance.
 
         The **Random.choice()** function of the **random** module will select one of the available
-        :class:`Bin` instances from the **bins** collection.
+        :class:`Bin` instances from the **bins** collection. If a **spinStream** is set, the bin
+        index is taken from it instead.
 
         :return: A Bin selected at random from the wheel.
         :rtype: Bin
         """
+        if self.spinStream is not None:
+            return self.bins[self.spinStream.next()]
         return self.rng.choice(self.bins)
 
     def get(self, bin: int) -> Bin:
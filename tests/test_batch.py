@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from unittest import TestCase
+
+from click.testing import CliRunner
+
+from batch import main, record, run_batch, write_records
+from result_cache import SimulationConfig, simulate
+
+
+class TestBatch(TestCase):
+    def setUp(self):
+        self.configs = [
+            SimulationConfig("Martingale", initDuration=20, samples=5, seed=2),
+            SimulationConfig("Passenger57", initDuration=20, samples=5, seed=2),
+        ]
+
+    def test_results_match_single_simulation(self):
+        results = run_batch(self.configs, chunkSize=2)
+
+        for config, (durations, maxima) in zip(self.configs, results):
+            expected = simulate(config)
+            self.assertEqual(expected["durations"], durations)
+            self.assertEqual(expected["maxima"], maxima)
+
+    def test_results_do_not_depend_on_number_of_workers(self):
+        self.assertEqual(
+            run_batch(self.configs, workers=1, chunkSize=2),
+            run_batch(self.configs, workers=2, chunkSize=2),
+        )
+
+    def test_raw_values_are_optional(self):
+        durations, maxima = run_batch(self.configs[:1])[0]
+
+        summary = record(self.configs[0], durations, maxima)
+        detailed = record(self.configs[0], durations, maxima, raw=True)
+
+        self.assertNotIn("durations", summary)
+        self.assertEqual(list(maxima), detailed["maxima"])
+        self.assertEqual(summary["maxima_mean"], detailed["maxima_mean"])
+
+    def test_record_without_sessions_has_no_summary(self):
+        config = SimulationConfig("Martingale", samples=0)
+        durations, maxima = run_batch([config])[0]
+
+        result = record(config, durations, maxima)
+
+        self.assertIsNone(result["durations_mean"])
+        self.assertIsNone(result["maxima_stdev"])
+        self.assertNotEqual(
+            0,
+            CliRunner()
+            .invoke(main, ["--player", "Martingale", "--samples", "0"])
+            .exit_code,
+        )
+
+    def test_records_are_written_as_jsonl_or_csv(self):
+        results = run_batch(self.configs)
+        records = [
+            record(config, durations, maxima, raw=True)
+            for config, (durations, maxima) in zip(self.configs, results)
+        ]
+        jsonl = io.StringIO()
+        table = io.StringIO()
+
+        write_records(records, jsonl, "jsonl", raw=True)
+        write_records(records, table, "csv", raw=True)
+
+        lines = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+        rows = list(csv.DictReader(io.StringIO(table.getvalue())))
+        self.assertEqual(records, lines)
+        self.assertEqual(["Martingale", "Passenger57"], [row["player"] for row in rows])
+        self.assertEqual(
+            records[1]["durations"],
+            [int(value) for value in rows[1]["durations"].split()],
+        )
+        with self.assertRaises(ValueError):
+            write_records(records, io.StringIO(), "xml")
+
+    def test_command_writes_one_record_per_player(self):
+        result = CliRunner().invoke(
+            main,
+            ["--player", "Martingale", "--player", "Random", "--samples", "3"]
+            + ["--duration", "10", "--format", "csv"],
+        )
+
+        self.assertEqual(0, result.exit_code)
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+        self.assertEqual(["Martingale", "Random"], [row["player"] for row in rows])
+
+    def test_command_capitalizes_and_checks_player_names(self):
+        result = CliRunner().invoke(
+            main, ["--player", "martingale", "--samples", "1", "--duration", "5"]
+        )
+
+        self.assertEqual(0, result.exit_code)
+        self.assertEqual("Martingale", json.loads(result.output)["player"])
+        for arguments in (
+            ["--player", "Nope"],
+            ["--player", "Random", "--workers", "0"],
+        ):
+            result = CliRunner().invoke(main, arguments)
+            self.assertEqual(2, result.exit_code)
+            self.assertNotIsInstance(result.exception, ValueError)
@@ -0,0 +1,83 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from test_player_factory import SteadyPlayer
+import player_factory as registry
+from benchmark import Benchmark, compare, load
+from player_factory import PLAYER_NAMES, register_player
+
+
+class TestBenchmark(TestCase):
+    def setUp(self):
+        self.benchmark = Benchmark()
+        self.benchmark.repeat = 1
+        self.benchmark.builds = 1
+        self.benchmark.spins = 10
+        self.benchmark.sessions = 2
+        self.benchmark.startups = 1
+
+    def test_run_measures_components_and_strategies(self):
+        results = self.benchmark.run(["Martingale"])
+
+        self.assertEqual(
+            {
+                "BinBuilder.buildBins",
+                "Wheel.choose",
+                "Game.cycle",
+                "IntegerStatistics",
+                "roulette startup",
+                "Martingale sessions",
+                "Martingale spins",
+            },
+            set(results),
+        )
+        self.assertEqual("spins/s", results["Martingale spins"]["unit"])
+        self.assertGreater(results["Martingale spins"]["rate"], 0)
+
+    def test_run_plays_registered_players_by_default(self):
+        self.addCleanup(registry.PLAYERS.pop, "Steady")
+        register_player("Steady")(SteadyPlayer)
+
+        with patch.object(self.benchmark, "play") as play_mock:
+            self.benchmark.run()
+
+        played = [call.args[0] for call in play_mock.call_args_list]
+        self.assertEqual(list(PLAYER_NAMES) + ["Steady"], played)
+
+    def test_best_keeps_fastest_run(self):
+        self.benchmark.repeat = 3
+        counts = iter([1, 2, 3])
+
+        count, seconds = self.benchmark.best(lambda: next(counts))
+
+        self.assertIn(count, [1, 2, 3])
+        self.assertGreaterEqual(seconds, 0)
+
+    def test_results_are_written_and_loaded(self):
+        self.benchmark.record("Wheel.choose", 100, 2.0, "spins/s")
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "benchmark.json")
+            self.benchmark.write(path)
+            results = load(path)
+
+        self.assertEqual({"Wheel.choose": {"rate": 50.0, "unit": "spins/s"}}, results)
+
+    def test_compare_flags_only_regressions_beyond_tolerance(self):
+        baseline = {
+            "Wheel.choose": {"rate": 100.0, "unit": "spins/s"},
+            "Game.cycle": {"rate": 100.0, "unit": "cycles/s"},
+            "IntegerStatistics": {"rate": 100.0, "unit": "values/s"},
+        }
+        results = {
+            "Wheel.choose": {"rate": 80.0, "unit": "spins/s"},
+            "Game.cycle": {"rate": 95.0, "unit": "cycles/s"},
+            "IntegerStatistics": {"rate": 150.0, "unit": "values/s"},
+            "Martingale spins": {"rate": 1.0, "unit": "spins/s"},
+        }
+
+        regressions = compare(baseline, results, tolerance=0.1)
+
+        self.assertEqual([("Wheel.choose", 100.0, 80.0)], regressions)
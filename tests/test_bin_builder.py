@@ -2,7 +2,7 @@ from unittest import TestCase
 from unittest.mock import Mock, patch
 from outcome import Outcome
 from wheel import Wheel
-from bin_builder import BinBuilder
+from bin_builder import BinBuilder, american_wheel
 
 
 class TestBinBuilder(TestCase):
@@ -192,6 +192,26 @@ class TestBinBuilder(TestCase):
             else:
                 self.assertIn(odd_bet_outcome, self.wheel.bins[bin_index])
 
+    def test_buildBins_builds_payout_matrix(self):
+        self.bin_builder.buildBins(self.wheel)
+
+        expected_number_of_outcomes = len(self.wheel.all_outcomes)
+        self.assertEqual((38, expected_number_of_outcomes), self.wheel.payouts.shape)
+        for number, wheel_bin in enumerate(self.wheel.binIterator()):
+            for outcome in self.wheel.outcomes:
+                won = self.wheel.payout(number, self.wheel.getOutcomeId(outcome), 1) > 0
+                self.assertEqual(outcome in wheel_bin, won)
+
+    def test_american_wheel_shares_prebuilt_layout(self):
+        self.bin_builder.buildBins(self.wheel)
+
+        first_wheel = american_wheel()
+        second_wheel = american_wheel()
+
+        self.assertEqual(self.wheel.bins, first_wheel.bins)
+        self.assertIs(first_wheel.bins, second_wheel.bins)
+        self.assertIsNot(first_wheel, second_wheel)
+
     def test_buildBins_invokes_helper_methods(self):
         helper_methods = {
             "bin_builder.BinBuilder.build_bins_for_straight_bets",
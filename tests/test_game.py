@@ -7,6 +7,7 @@ from wheel import Wheel
 from table import Table
 from bin_builder import BinBuilder
 from invalid_bet import InvalidBet
+from players.martingale import Martingale
 from players.passenger57 import Passenger57
 
 
@@ -49,6 +50,19 @@ class TestGame(TestCase):
                 self.game.cycle(self.passenger)
         lose_mock.assert_called_once()
 
+    def test_cycle_reports_invalid_bets_without_spinning(self):
+        martingale = Martingale(self.table)
+        martingale.betMultiple = 500
+        choose_mock = Mock(name="choose_mock")
+        with patch("wheel.Wheel.choose", choose_mock):
+            self.assertFalse(self.game.cycle(martingale))
+        choose_mock.assert_not_called()
+
+    def test_cycle_leaves_table_limit_to_players_which_check_it(self):
+        self.table.limit = 10
+
+        self.assertTrue(self.game.cycle(self.passenger))
+
     def test_choose_not_called_if_isValid_raises_exception(self):
         place_bets_mock = Mock(name="place_bets_mock", side_effect=InvalidBet)
         choose_mock = Mock(name="choose_mock")
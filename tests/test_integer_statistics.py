@@ -18,3 +18,9 @@ class TestIntegerStatistics(TestCase):
         actual_stdev_result = self.int_stat.stdev()
 
         self.assertEqual(expected_stdev_result, actual_stdev_result)
+
+    def test_calculate_half_width(self):
+        self.assertAlmostEqual(
+            1.96 * 3.317 / 11**0.5, self.int_stat.halfWidth(), places=3
+        )
+        self.assertEqual(float("inf"), IntegerStatistics([3]).halfWidth())
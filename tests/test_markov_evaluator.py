@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from bin_builder import american_wheel
+from table import Table
+from markov_evaluator import Distribution, MarkovEvaluator
+from players.fibonacci import PlayerFibonacci
+from players.martingale import Martingale
+from players.passenger57 import Passenger57
+from players.random import PlayerRandom
+
+
+class TestMarkovEvaluator(TestCase):
+    def setUp(self):
+        self.wheel = american_wheel()
+        self.table = Table()
+
+    def test_fixed_bet_distributions_are_exact(self):
+        evaluator = MarkovEvaluator(Passenger57(self.table, self.wheel), self.wheel)
+        evaluator.initDuration = 2
+        win = 18 / 38
+
+        evaluator.evaluate()
+
+        self.assertEqual([2], list(evaluator.durations))
+        self.assertAlmostEqual(1.0, evaluator.durations[2])
+        self.assertAlmostEqual(win**2, evaluator.maxima[140])
+        self.assertAlmostEqual(win * (1 - win), evaluator.maxima[120])
+        self.assertAlmostEqual((1 - win) * win, evaluator.maxima[100])
+        self.assertAlmostEqual((1 - win) ** 2, evaluator.maxima[80])
+
+    def test_martingale_distributions_sum_to_one(self):
+        martingale = Martingale(self.table)
+        evaluator = MarkovEvaluator(martingale, self.wheel)
+        evaluator.initDuration = 30
+
+        evaluator.evaluate()
+
+        self.assertAlmostEqual(1.0, sum(evaluator.durations.values()))
+        self.assertAlmostEqual(1.0, sum(evaluator.maxima.values()))
+        self.assertLess(evaluator.durations.mean(), 30)
+        self.assertEqual(0, martingale.losscount)
+        self.assertEqual(1, martingale.betMultiple)
+
+    def test_session_ended_before_first_cycle_keeps_initial_stake(self):
+        evaluator = MarkovEvaluator(Martingale(self.table), self.wheel)
+        evaluator.initStake = 0
+
+        evaluator.evaluate()
+
+        self.assertEqual({0: 1.0}, evaluator.durations)
+        self.assertEqual({0: 1.0}, evaluator.maxima)
+
+    def test_transitions_follow_the_betting_system(self):
+        evaluator = MarkovEvaluator(Martingale(self.table), self.wheel)
+
+        (win, win_stake, win_state), (loss, loss_stake, loss_state) = sorted(
+            evaluator.transitions(100, (0, 1))
+        )
+
+        self.assertAlmostEqual(18 / 38, win)
+        self.assertEqual((101, (0, 1)), (win_stake, win_state))
+        self.assertAlmostEqual(20 / 38, loss)
+        self.assertEqual((99, (1, 2)), (loss_stake, loss_state))
+        self.assertIsNone(evaluator.transitions(0, (0, 1)))
+
+    def test_player_without_state_attributes_is_rejected(self):
+        with self.assertRaises(ValueError):
+            MarkovEvaluator(PlayerRandom(self.table, self.wheel), self.wheel)
+
+    def test_too_many_states_raises_value_error(self):
+        evaluator = MarkovEvaluator(PlayerFibonacci(self.table), self.wheel)
+        evaluator.maxStates = 100
+
+        with self.assertRaises(ValueError):
+            evaluator.evaluate()
+
+
+class TestDistribution(TestCase):
+    def test_mean_and_stdev(self):
+        distribution = Distribution({1: 0.5, 3: 0.5})
+
+        self.assertEqual(2, distribution.mean())
+        self.assertEqual(1, distribution.stdev())
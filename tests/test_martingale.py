@@ -6,7 +6,6 @@ from game import Game
 from table import Table
 from bet import Bet
 from bin_builder import BinBuilder
-from invalid_bet import InvalidBet
 from wheel import Wheel
 from players.martingale import Martingale
 
@@ -71,11 +70,42 @@ class TestMartingale(TestCase):
 
     def test_attributes_are_reset_if_invalid_bet_is_placed(self):
         self.martingale.betMultiple = 500
-        with self.assertRaises(InvalidBet):
-            self.martingale.placeBets()
+        self.martingale.placeBets()
+
+        self.assertFalse(self.table.validate())
+        self.assertEqual(100, self.martingale.stake)
 
         expected_losscount_value = 0
         expected_betmultiple_value = 2**expected_losscount_value
 
         self.assertEqual(expected_losscount_value, self.martingale.losscount)
         self.assertEqual(expected_betmultiple_value, self.martingale.betMultiple)
+
+    def test_player_is_absorbed_when_bet_exceeds_table_limit(self):
+        self.martingale.losscount = 8
+        self.martingale.betMultiple = 256
+
+        self.assertFalse(self.martingale.absorbed())
+
+        self.martingale.losscount = 9
+        self.martingale.betMultiple = 512
+
+        self.assertTrue(self.martingale.absorbed())
+        self.assertEqual(0, self.martingale.losscount)
+        self.assertEqual(1, self.martingale.betMultiple)
+
+    def test_same_bet_is_reused_every_round(self):
+        self.martingale.placeBets()
+        first_bet = self.table.bets[0]
+        self.table.clear()
+        self.martingale.betMultiple = 4
+
+        self.martingale.placeBets()
+
+        self.assertIs(first_bet, self.table.bets[0])
+        self.assertEqual(4, first_bet.amount)
+
+    def test_player_attributes_are_slotted(self):
+        self.assertFalse(hasattr(self.martingale, "__dict__"))
+        self.assertEqual(100, self.martingale.stake)
+        self.assertEqual(250, self.martingale.roundsToGo)
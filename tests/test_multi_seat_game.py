@@ -0,0 +1,64 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from bin_builder import american_wheel
+from game import Game
+from multi_seat_game import MultiSeatGame
+from players.martingale import Martingale
+from players.passenger57 import Passenger57
+from simulator import Simulator
+from table import Table
+
+
+class TestMultiSeatGame(TestCase):
+    def setUp(self):
+        self.wheel = american_wheel()
+        self.game = MultiSeatGame(self.wheel)
+        self.martingale = Martingale(Table())
+        self.passenger = Passenger57(Table(), self.wheel)
+        for player in (self.martingale, self.passenger):
+            player.stake = 100
+            player.roundsToGo = 5
+            self.game.sit(player)
+
+    def test_cycle_spins_once_for_every_seat(self):
+        black = self.wheel.get(2)
+        choose_mock = Mock(name="choose_mock", return_value=black)
+        with patch("wheel.Wheel.choose", choose_mock):
+            self.game.cycle()
+
+        choose_mock.assert_called_once()
+        self.assertEqual([101], self.game.stakeValues[self.martingale])
+        self.assertEqual([120], self.game.stakeValues[self.passenger])
+        self.assertEqual(4, self.martingale.roundsToGo)
+
+    def test_seats_leave_without_stalling_others(self):
+        self.martingale.roundsToGo = 2
+
+        for _ in range(5):
+            self.game.cycle(self.wheel.get(2))
+
+        self.assertEqual([self.passenger], self.game.seats)
+        self.assertEqual(2, len(self.game.stakeValues[self.martingale]))
+        self.assertEqual(5, len(self.game.stakeValues[self.passenger]))
+
+        self.game.cycle()
+
+        self.assertEqual([], self.game.seats)
+
+    def test_single_seat_matches_simulator(self):
+        wheel = american_wheel()
+        wheel.rng.seed(8)
+        table = Table()
+        simulator = Simulator(Game(wheel, table), Martingale(table))
+        expected = simulator.session()
+        self.wheel.rng.seed(8)
+        game = MultiSeatGame(self.wheel)
+        player = Martingale(Table())
+        player.stake, player.roundsToGo = 100, 250
+        game.sit(player)
+
+        while game.seats:
+            game.cycle()
+
+        self.assertEqual(expected, game.stakeValues[player])
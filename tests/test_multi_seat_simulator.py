@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from bin_builder import american_wheel
+from multi_seat_simulator import MultiSeatSimulator
+from player_factory import PLAYER_NAMES
+
+
+class TestMultiSeatSimulator(TestCase):
+    def test_gather_collects_statistics_per_player(self):
+        wheel = american_wheel()
+        wheel.rng.seed(2)
+        simulator = MultiSeatSimulator(list(PLAYER_NAMES), wheel)
+        simulator.samples = 4
+        simulator.initDuration = 30
+
+        simulator.gather()
+
+        for name in PLAYER_NAMES:
+            self.assertEqual(4, len(simulator.durations[name]))
+            self.assertLessEqual(max(simulator.durations[name]), 30)
+            self.assertEqual(4, len(simulator.maxima[name]))
+
+    def test_repeated_player_names_are_rejected(self):
+        with self.assertRaises(ValueError):
+            MultiSeatSimulator(
+                ["Martingale", "Passenger57", "Martingale"], american_wheel()
+            )
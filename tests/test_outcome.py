@@ -25,3 +25,13 @@ class TestOutcome(TestCase):
 
     def test_inequality_when_names_differ(self):
         self.assertNotEqual(self.oc1, self.oc3)
+
+    def test_intern_returns_one_shared_instance(self):
+        red = Outcome.intern("Red", 1)
+
+        self.assertIs(red, Outcome.intern("Red", 1))
+        self.assertEqual(Outcome("Red", 1), red)
+        self.assertIsNot(red, Outcome.intern("Red", 2))
+
+    def test_outcome_has_no_instance_dict(self):
+        self.assertFalse(hasattr(Outcome.intern("Dozen 1", 2), "__dict__"))
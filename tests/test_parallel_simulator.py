@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from parallel_simulator import ParallelSimulator, SessionJob, run_jobs, run_sessions
+
+
+class TestParallelSimulator(TestCase):
+    def setUp(self):
+        self.simulator = ParallelSimulator("Martingale", workers=1, seed=42)
+        self.simulator.samples = 10
+        self.simulator.chunkSize = 3
+        self.simulator.initDuration = 20
+
+    def test_gather_collects_one_result_per_session(self):
+        self.simulator.gather()
+
+        self.assertEqual(10, len(self.simulator.durations))
+        self.assertEqual(10, len(self.simulator.maxima))
+
+    def test_results_do_not_depend_on_number_of_workers(self):
+        self.simulator.gather()
+
+        parallel_simulator = ParallelSimulator("Martingale", workers=3, seed=42)
+        parallel_simulator.samples = 10
+        parallel_simulator.chunkSize = 3
+        parallel_simulator.initDuration = 20
+        parallel_simulator.gather()
+
+        self.assertEqual(self.simulator.durations, parallel_simulator.durations)
+        self.assertEqual(self.simulator.maxima, parallel_simulator.maxima)
+
+    def test_run_sessions_is_reproducible_for_random_player(self):
+        seeds = [1, 2, 3]
+
+        first_results = run_sessions("Random", 100, 20, seeds)
+        second_results = run_sessions("Random", 100, 20, seeds)
+
+        self.assertEqual(first_results, second_results)
+        self.assertEqual(len(seeds), len(first_results))
+
+    def test_invalid_number_of_workers_raises_error(self):
+        with self.assertRaises(ValueError):
+            ParallelSimulator("Martingale", workers=0)
+
+    def test_run_jobs_merges_chunks_of_every_job_in_seed_order(self):
+        jobs = [
+            SessionJob("Martingale", 100, 20, [1, 2, 3, 4, 5]),
+            SessionJob("Random", 50, 10, [], 300),
+            SessionJob("Passenger57", 100, 20, [6, 7], 300),
+        ]
+
+        for workers in (1, 2):
+            results = dict(run_jobs(jobs, workers, chunkSize=2))
+
+            self.assertEqual(
+                [run_sessions(*job) for job in jobs],
+                [results[0], results[1], results[2]],
+            )
@@ -1,8 +1,20 @@
+from importlib.metadata import EntryPoint
 from unittest import TestCase
+from unittest.mock import patch
 from table import Table
 from wheel import Wheel
 from bin_builder import BinBuilder
-from player_factory import player_factory
+import player_factory as registry
+from parallel_simulator import ParallelSimulator
+from player_factory import (
+    PLAYER_NAMES,
+    dependencies,
+    player_class,
+    player_factory,
+    player_reference,
+    register_player,
+)
+from players.player import Player
 from players.martingale import Martingale
 from players.fibonacci import PlayerFibonacci
 from players.seven_reds import SevenReds
@@ -10,6 +22,13 @@ from players.random import PlayerRandom
 from players.passenger57 import Passenger57
 
 
+class SteadyPlayer(Player):
+    __slots__ = ()
+
+    def placeBets(self):
+        pass
+
+
 class TestPlayerFactory(TestCase):
     def setUp(self):
         self.table = Table()
@@ -42,3 +61,54 @@ class TestPlayerFactory(TestCase):
 
         with self.assertRaises(ValueError):
             player_factory("FIBONACCI789", self.table, self.wheel)
+
+    def test_every_registered_player_is_built(self):
+        for name in PLAYER_NAMES:
+            player = player_factory(name, self.table, self.wheel)
+            self.assertIsInstance(player, player_class(name))
+            self.assertIs(self.table, player.table)
+
+    def test_decorated_player_is_built_by_name(self):
+        self.addCleanup(registry.PLAYERS.pop, "Steady")
+        register_player("Steady")(SteadyPlayer)
+
+        player = player_factory("Steady", self.table, self.wheel)
+
+        self.assertIsInstance(player, SteadyPlayer)
+        self.assertEqual("test_player_factory:SteadyPlayer", player_reference("Steady"))
+
+    def test_registered_player_is_built_in_worker_processes(self):
+        self.addCleanup(registry.PLAYERS.pop, "Steady")
+        register_player("Steady")(SteadyPlayer)
+        simulator = ParallelSimulator("Steady", workers=2, seed=1)
+        simulator.samples = 4
+        simulator.initDuration = 5
+
+        simulator.gather()
+
+        self.assertEqual([5] * 4, simulator.durations)
+
+    def test_entry_points_are_discovered_lazily(self):
+        entry_point = EntryPoint(
+            "Steady", "test_player_factory:SteadyPlayer", registry.ENTRY_POINT_GROUP
+        )
+        self.addCleanup(registry.PLAYERS.pop, "Steady", None)
+        with patch.object(registry, "_discovered", False), patch(
+            "importlib.metadata.entry_points", return_value=[entry_point]
+        ):
+            self.assertIn("Steady", registry.player_names())
+            self.assertEqual(
+                "test_player_factory:SteadyPlayer", registry.PLAYERS["Steady"]
+            )
+            self.assertIsInstance(
+                player_factory("Steady", self.table, self.wheel), SteadyPlayer
+            )
+
+    def test_constructor_dependencies_are_read_once(self):
+        self.assertEqual(("table",), dependencies(Martingale))
+        self.assertEqual(("table", "wheel"), dependencies(Passenger57))
+        hits = dependencies.cache_info().hits
+
+        dependencies(Martingale)
+
+        self.assertEqual(hits + 1, dependencies.cache_info().hits)
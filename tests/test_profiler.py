@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from bin_builder import american_wheel
+from game import Game
+from players.martingale import Martingale
+from profiler import Profile, ProfiledGame, ProfiledSimulator, profile_players
+from simulator import Simulator
+from table import Table
+
+
+class TestProfiler(TestCase):
+    def test_profiled_session_matches_plain_session(self):
+        wheel = american_wheel()
+        table = Table()
+        profile = Profile()
+        simulator = ProfiledSimulator(
+            ProfiledGame(wheel, table, profile), Martingale(table)
+        )
+        wheel.rng.seed(3)
+
+        stake_values = simulator.session()
+
+        wheel.rng.seed(3)
+        plain_table = Table()
+        plain = Simulator(Game(wheel, plain_table), Martingale(plain_table))
+        self.assertEqual(plain.session(), stake_values)
+
+        cycle = ("Martingale", "session", "cycle")
+        self.assertEqual(1, profile.calls[("Martingale", "session")])
+        self.assertEqual(len(stake_values), profile.calls[cycle])
+        for phase in ("placeBets", "choose", "winners", "resolve"):
+            self.assertEqual(len(stake_values), profile.calls[cycle + (phase,)])
+            self.assertLessEqual(
+                profile.nanoseconds[cycle + (phase,)], profile.nanoseconds[cycle]
+            )
+
+    def test_self_time_excludes_nested_phases(self):
+        profile = Profile()
+        profile.add(("P", "session"), 10_000)
+        profile.add(("P", "session", "cycle"), 6_000)
+        profile.add(("P", "session", "cycle", "choose"), 4_000)
+
+        self.assertEqual(4_000, profile.selfTime(("P", "session")))
+        self.assertEqual(
+            "P;session 4\nP;session;cycle 2\nP;session;cycle;choose 4",
+            profile.folded(),
+        )
+
+    def test_profile_aggregates_per_player_class(self):
+        profile = profile_players(["Martingale", "Passenger57"], samples=2)
+
+        self.assertEqual(2, profile.calls[("Martingale", "session")])
+        self.assertEqual(2, profile.calls[("Passenger57", "session")])
+        self.assertIn("Passenger57;session;cycle;choose", profile.summary())
@@ -22,7 +22,7 @@ class TestRandom(TestCase):
         fixed_seed = 1
         self.random_player.rng.seed(fixed_seed)
         randomly_selected_outcome = self.random_player.rng.choice(
-            list(self.random_player.all_OC)
+            sorted(self.random_player.all_OC, key=lambda outcome: outcome.name)
         )
         self.random_player.rng.seed(fixed_seed)
         self.random_player.placeBets()
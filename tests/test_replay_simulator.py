@@ -0,0 +1,61 @@
+import os
+import shutil
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from bin_builder import american_wheel
+from game import Game
+from player_factory import player_factory
+from replay_simulator import ReplaySimulator
+from simulator import Simulator
+from spin_stream import SpinLogGenerator, SpinStream, write_spin_log
+from table import Table
+
+
+class TestReplaySimulator(TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = os.path.join(self.directory, "spins.npy")
+        write_spin_log(self.path, 1000, seed=4)
+        self.names = ["Martingale", "Passenger57", "Cancellation"]
+        self.replay = ReplaySimulator(self.names, self.path)
+        self.replay.initDuration = 100
+        self.replay.initStake = 50
+
+    def tearDown(self):
+        del self.replay
+        shutil.rmtree(self.directory)
+
+    def simulate(self, player_name, position):
+        wheel = american_wheel()
+        wheel.useSpinStream(SpinStream(SpinLogGenerator(self.path, position)))
+        table = Table()
+        simulator = Simulator(
+            Game(wheel, table), player_factory(player_name, table, wheel)
+        )
+        simulator.initDuration = 100
+        simulator.initStake = 50
+        return simulator.session()
+
+    def test_session_matches_simulator_on_same_spins(self):
+        stake_values = self.replay.session(3)
+
+        for name in self.names:
+            self.assertEqual(self.simulate(name, 300), stake_values[name])
+
+    def test_gather_replays_every_whole_session(self):
+        self.replay.gather()
+
+        for name in self.names:
+            self.assertEqual(10, len(self.replay.durations[name]))
+            self.assertEqual(10, len(self.replay.maxima[name]))
+
+    def test_too_many_samples_raises_error(self):
+        self.replay.samples = 11
+
+        with self.assertRaises(ValueError):
+            self.replay.gather()
+
+    def test_repeated_player_names_are_rejected(self):
+        with self.assertRaises(ValueError):
+            ReplaySimulator(["Martingale", "Martingale"], self.path)
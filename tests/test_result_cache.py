@@ -0,0 +1,57 @@
+import os
+import shutil
+from tempfile import mkdtemp
+from unittest import TestCase
+from unittest.mock import patch
+
+from result_cache import ResultCache, SimulationConfig, cache_key, simulate
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.cache = ResultCache(self.directory, maxEntries=2)
+        self.config = SimulationConfig("Martingale", initDuration=20, samples=6, seed=4)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_key_depends_on_whole_configuration(self):
+        self.assertEqual(cache_key(self.config), cache_key(self.config._replace()))
+        self.assertNotEqual(
+            cache_key(self.config), cache_key(self.config._replace(limit=100))
+        )
+
+    def test_second_run_is_read_from_cache(self):
+        first = self.cache.simulate(self.config)
+
+        with patch("result_cache.simulate") as simulate_mock:
+            second = self.cache.simulate(self.config)
+
+        simulate_mock.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(simulate(self.config)["maxima"], second["maxima"])
+        self.assertEqual(6, len(second["durations"]))
+
+    def test_least_recently_used_result_is_evicted(self):
+        configs = [self.config._replace(seed=seed) for seed in range(3)]
+        self.cache.simulate(configs[0])
+        self.cache.simulate(configs[1])
+        os.utime(self.cache.path(configs[1]), ns=(0, 0))
+        self.cache.get(configs[0])
+
+        self.cache.simulate(configs[2])
+
+        self.assertIsNotNone(self.cache.get(configs[0]))
+        self.assertIsNone(self.cache.get(configs[1]))
+        self.assertIsNotNone(self.cache.get(configs[2]))
+
+    def test_verification_replaces_corrupted_result(self):
+        result = self.cache.simulate(self.config)
+        self.assertTrue(self.cache.verify(self.config, result, 1.0))
+        corrupted = dict(result, maxima=[maximum + 1 for maximum in result["maxima"]])
+        self.cache.put(self.config, corrupted)
+
+        verified = self.cache.simulate(self.config, verify=0.5)
+
+        self.assertEqual(result["maxima"], verified["maxima"])
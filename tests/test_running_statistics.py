@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+from integer_statistics import IntegerStatistics
+from running_statistics import RunningStatistics
+
+
+class TestRunningStatistics(TestCase):
+    def setUp(self):
+        self.values = [10, 8, 13, 9, 11, 14, 6, 4, 12, 7, 5]
+        self.running_stat = RunningStatistics(self.values)
+
+    def test_statistics_match_integer_statistics(self):
+        int_stat = IntegerStatistics(self.values)
+
+        self.assertAlmostEqual(int_stat.mean(), self.running_stat.mean())
+        self.assertEqual(int_stat.stdev(), self.running_stat.stdev())
+        self.assertEqual(len(int_stat), len(self.running_stat))
+        self.assertAlmostEqual(int_stat.halfWidth(), self.running_stat.halfWidth())
+
+    def test_minimum_and_maximum_are_tracked(self):
+        self.assertEqual(4, self.running_stat.minimum)
+        self.assertEqual(14, self.running_stat.maximum)
+
+    def test_quantiles_are_computed_from_frequencies(self):
+        self.assertEqual(4, self.running_stat.quantile(0))
+        self.assertEqual(9, self.running_stat.quantile(0.5))
+        self.assertEqual(14, self.running_stat.quantile(1))
+
+        with self.assertRaises(ValueError):
+            self.running_stat.quantile(1.5)
+
+    def test_merge_is_same_as_appending_all_values(self):
+        first_shard = RunningStatistics(self.values[:4])
+        second_shard = RunningStatistics(self.values[4:])
+
+        first_shard.merge(second_shard)
+
+        self.assertEqual(self.running_stat.count, first_shard.count)
+        self.assertAlmostEqual(self.running_stat.mean(), first_shard.mean())
+        self.assertAlmostEqual(self.running_stat.variance(), first_shard.variance())
+        self.assertEqual(self.running_stat.frequencies, first_shard.frequencies)
+        self.assertEqual(self.running_stat.minimum, first_shard.minimum)
+
+    def test_mean_of_no_values_raises_error(self):
+        with self.assertRaises(ZeroDivisionError):
+            RunningStatistics().mean()
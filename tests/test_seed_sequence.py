@@ -0,0 +1,126 @@
+import json
+import os
+import random
+import subprocess
+import sys
+from unittest import TestCase
+
+import seed_sequence
+
+from bin_builder import american_wheel
+from parallel_simulator import ParallelSimulator
+from seed_sequence import SeedStream
+from table import Table
+from players.passenger57 import Passenger57
+from players.random import PlayerRandom
+
+
+class TestSeedStream(TestCase):
+    def test_same_master_seed_gives_same_children(self):
+        first = SeedStream(7).integers(5)
+        second = SeedStream(7).integers(5)
+
+        self.assertEqual(first, second)
+
+    def test_children_are_distinct(self):
+        seeds = SeedStream(7).integers(1000)
+
+        self.assertEqual(len(seeds), len(set(seeds)))
+
+    def test_different_master_seeds_give_different_children(self):
+        self.assertNotEqual(SeedStream(7).integers(5), SeedStream(8).integers(5))
+
+    def test_spawning_again_gives_new_children(self):
+        stream = SeedStream(7)
+
+        first = stream.integers(3)
+        second = stream.integers(3)
+
+        self.assertFalse(set(first) & set(second))
+        self.assertEqual(first + second, SeedStream(7).integers(6))
+
+    def test_named_child_is_reproducible_and_independent_of_spawning(self):
+        stream = SeedStream(7)
+        named = stream.child("Martingale").integer()
+        stream.spawn(10)
+
+        self.assertEqual(named, stream.child("Martingale").integer())
+        self.assertNotEqual(named, stream.child("Fibonacci").integer())
+        self.assertNotIn(named, SeedStream(7).integers(10))
+
+    def test_entropy_is_kept_when_drawn_from_operating_system(self):
+        stream = SeedStream()
+
+        self.assertEqual(stream.integers(3), SeedStream(stream.entropy).integers(3))
+
+    def test_random_and_generator_are_reproducible(self):
+        self.assertIsInstance(SeedStream(7).random(), random.Random)
+        self.assertEqual(
+            SeedStream(7).random().random(), SeedStream(7).random().random()
+        )
+        self.assertEqual(
+            SeedStream(7).generator().integers(1000, size=5).tolist(),
+            SeedStream(7).generator().integers(1000, size=5).tolist(),
+        )
+
+    def test_seed_gives_wheel_and_player_independent_streams(self):
+        spins = []
+        for _ in range(2):
+            wheel = american_wheel()
+            player = PlayerRandom(Table(), wheel)
+            SeedStream(7).seed(wheel, player)
+            spins.append(
+                (
+                    [wheel.rng.random() for _ in range(5)],
+                    [player.rng.random() for _ in range(5)],
+                )
+            )
+
+        self.assertEqual(spins[0], spins[1])
+        self.assertNotEqual(spins[0][0], spins[0][1])
+
+    def test_seed_skips_consumers_without_generator(self):
+        wheel = american_wheel()
+        SeedStream(7).seed(Passenger57(Table(), wheel), wheel)
+        other = american_wheel()
+        SeedStream(7).seed(None, other)
+
+        self.assertEqual(wheel.rng.random(), other.rng.random())
+
+    def test_parallel_simulator_keeps_drawn_master_seed(self):
+        simulator = ParallelSimulator("Random")
+        simulator.samples = 4
+        simulator.initDuration = 20
+        simulator.gather()
+
+        replay = ParallelSimulator("Random", workers=2, seed=simulator.seed)
+        replay.samples = 4
+        replay.initDuration = 20
+        replay.chunkSize = 1
+        replay.gather()
+
+        self.assertIsNotNone(simulator.seed)
+        self.assertEqual(simulator.durations, replay.durations)
+        self.assertEqual(simulator.maxima, replay.maxima)
+
+    def test_random_player_is_reproducible_across_hash_seeds(self):
+        source = os.path.dirname(os.path.abspath(seed_sequence.__file__))
+        script = (
+            "import json; from result_cache import SimulationConfig, simulate; "
+            "result = simulate(SimulationConfig('Random', initDuration=50, samples=5, seed=7)); "
+            "print(json.dumps([result['durations'], result['maxima']]))"
+        )
+        results = [
+            json.loads(
+                subprocess.run(
+                    [sys.executable, "-c", script],
+                    env=dict(os.environ, PYTHONPATH=source, PYTHONHASHSEED=hash_seed),
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+            )
+            for hash_seed in ("1", "2")
+        ]
+
+        self.assertEqual(results[0], results[1])
@@ -34,3 +34,12 @@ class TestSevenReds(TestCase):
         expected_redCount_value = 7
 
         self.assertEqual(expected_redCount_value, self.seven_reds.redCount)
+
+    def test_player_is_absorbed_only_when_about_to_bet(self):
+        self.seven_reds.betMultiple = 512
+
+        self.assertFalse(self.seven_reds.absorbed())
+
+        self.seven_reds.redCount = 0
+
+        self.assertTrue(self.seven_reds.absorbed())
@@ -7,7 +7,11 @@ from game import Game
 from table import Table
 from wheel import Wheel
 from invalid_bet import InvalidBet
+from running_statistics import RunningStatistics
+from bin_builder import american_wheel
+from players.player import Player
 from players.martingale import Martingale
+from players.seven_reds import SevenReds
 
 
 class TestSimulator(TestCase):
@@ -53,3 +57,84 @@ class TestSimulator(TestCase):
         cycle_mock = Mock(name="cycle_mock", side_effect=InvalidBet)
         with patch("game.Game.cycle", cycle_mock):
             self.simulator.session()
+
+    def test_simulator_gathers_into_running_statistics(self):
+        simulator = Simulator(
+            self.simulator.game, self.martingale, statistics=RunningStatistics
+        )
+        session_mock = Mock(name="session_mock", return_value=[1, 2, 5])
+        simulator.samples = 2
+
+        with patch("simulator.Simulator.session", session_mock):
+            simulator.gather()
+
+        self.assertIsInstance(simulator.maxima, RunningStatistics)
+        self.assertEqual(2, simulator.maxima.count)
+        self.assertEqual(5, simulator.maxima.mean())
+        self.assertEqual(3, simulator.durations.mean())
+
+    def assert_absorbed_sessions_match_playing_until_invalid_bet(self, player, limit):
+        def sessions():
+            wheel = american_wheel()
+            wheel.rng.seed(5)
+            table = Table()
+            table.limit = limit
+            simulator = Simulator(Game(wheel, table), player(table))
+            simulator.initStake = 1000
+            return [simulator.session() for _ in range(50)]
+
+        expected = sessions()
+        with patch.object(player, "absorbed", Player.absorbed):
+            self.assertEqual(expected, sessions())
+
+    def test_absorbed_session_matches_playing_until_invalid_bet(self):
+        self.assert_absorbed_sessions_match_playing_until_invalid_bet(Martingale, 30)
+
+    def test_absorbed_seven_reds_session_matches_playing_until_invalid_bet(self):
+        self.assert_absorbed_sessions_match_playing_until_invalid_bet(SevenReds, 3)
+
+    def test_absorbed_player_places_no_bet(self):
+        self.martingale.betMultiple = 512
+        place_bets_mock = Mock(name="place_bets_mock")
+
+        with patch("players.martingale.Martingale.placeBets", place_bets_mock):
+            self.assertEqual([], self.simulator.session())
+
+        place_bets_mock.assert_not_called()
+
+    def test_gather_adaptive_stops_when_precise(self):
+        session_mock = Mock(
+            name="session_mock", side_effect=[[1, 2, 5], [1, 2, 3, 4, 6]] * 50
+        )
+
+        with patch("simulator.Simulator.session", session_mock):
+            precision = self.simulator.gatherAdaptive(
+                precision=0.1, batchSize=10, maxSamples=100
+            )
+
+        self.assertTrue(precision.converged)
+        self.assertEqual(30, precision.samples)
+        self.assertEqual(30, len(self.simulator.durations))
+        self.assertLessEqual(precision.durations, 0.1 * self.simulator.durations.mean())
+
+    def test_sessions_ended_before_first_bet_keep_initial_stake(self):
+        self.martingale.table.limit = 0
+
+        precision = self.simulator.gatherAdaptive(batchSize=5, maxSamples=5)
+        self.simulator.gather()
+
+        self.assertEqual(5, precision.samples)
+        self.assertEqual([0] * 10, self.simulator.durations)
+        self.assertEqual([self.simulator.initStake] * 10, self.simulator.maxima)
+
+    def test_gather_adaptive_stops_at_sample_budget(self):
+        session_mock = Mock(name="session_mock", side_effect=[[1], [1, 2, 3, 500]] * 50)
+
+        with patch("simulator.Simulator.session", session_mock):
+            precision = self.simulator.gatherAdaptive(
+                precision=0.01, batchSize=7, maxSamples=30
+            )
+
+        self.assertFalse(precision.converged)
+        self.assertEqual(30, precision.samples)
+        self.assertEqual(30, self.simulator.samples)
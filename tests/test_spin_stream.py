@@ -0,0 +1,78 @@
+import os
+import shutil
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from spin_stream import (
+    MersenneTwisterGenerator,
+    PCG64Generator,
+    SpinLogGenerator,
+    SpinStream,
+    write_spin_log,
+)
+
+
+class TestSpinStream(TestCase):
+    def assert_sequence_independent_of_block_size(self, generator_class):
+        sequences = []
+        for block_size in (1, 7, 64, 1000):
+            stream = SpinStream(generator_class(seed=3), blockSize=block_size)
+            sequences.append([stream.next() for _ in range(200)])
+
+        for sequence in sequences[1:]:
+            self.assertEqual(sequences[0], sequence)
+
+    def test_mersenne_twister_sequence_independent_of_block_size(self):
+        self.assert_sequence_independent_of_block_size(MersenneTwisterGenerator)
+
+    def test_pcg64_sequence_independent_of_block_size(self):
+        self.assert_sequence_independent_of_block_size(PCG64Generator)
+
+    def test_indices_are_in_range_of_bins(self):
+        stream = SpinStream(PCG64Generator(seed=5), blockSize=100)
+
+        indices = [stream.next() for _ in range(1000)]
+
+        self.assertEqual(set(range(38)), set(indices))
+
+    def test_take_continues_sequence_of_next(self):
+        stream = SpinStream(MersenneTwisterGenerator(seed=9), blockSize=10)
+        reference = SpinStream(MersenneTwisterGenerator(seed=9), blockSize=10)
+
+        first_index = stream.next()
+        indices = stream.take(25)
+        last_index = stream.next()
+
+        expected_indices = [reference.next() for _ in range(27)]
+        self.assertEqual(expected_indices, [first_index] + indices + [last_index])
+
+    def test_invalid_block_size_raises_error(self):
+        with self.assertRaises(ValueError):
+            SpinStream(MersenneTwisterGenerator(), blockSize=0)
+
+
+class TestSpinLog(TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = os.path.join(self.directory, "spins.npy")
+        write_spin_log(self.path, 100, seed=11)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_log_holds_pcg64_sequence(self):
+        stream = SpinStream(SpinLogGenerator(self.path), blockSize=30)
+
+        self.assertEqual(PCG64Generator(seed=11).draw(100), stream.take(100))
+
+    def test_replay_starts_at_position(self):
+        generator = SpinLogGenerator(self.path, position=90)
+
+        self.assertEqual(PCG64Generator(seed=11).draw(100)[90:], generator.draw(30))
+
+    def test_exhausted_log_raises_error(self):
+        stream = SpinStream(SpinLogGenerator(self.path), blockSize=64)
+        stream.take(100)
+
+        with self.assertRaises(ValueError):
+            stream.next()
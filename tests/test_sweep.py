@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+from tempfile import mkdtemp
+from unittest import TestCase
+from unittest.mock import patch
+
+from sweep import Sweep, SweepCell, cell_summary, run_cell
+
+
+class TestSweep(TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = os.path.join(self.directory, "sweep.jsonl")
+        self.grid = {
+            "players": ["Martingale", "Passenger57"],
+            "stakes": [50, 100],
+            "durations": [10],
+            "limits": [300],
+            "samples": 4,
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_lines(self):
+        with open(self.path, encoding="utf-8") as file:
+            return [json.loads(line) for line in file]
+
+    def test_run_writes_one_summary_per_cell(self):
+        sweep = Sweep(self.grid, self.path, seed=7)
+
+        self.assertEqual(4, sweep.run())
+
+        lines = self.read_lines()
+        self.assertEqual(
+            {cell.key() for cell in sweep.cells()}, {line["key"] for line in lines}
+        )
+        self.assertEqual(10, lines[0]["durations"]["max"])
+
+    def test_completed_cells_are_not_recomputed(self):
+        Sweep(self.grid, self.path).run()
+        self.grid["stakes"].append(200)
+
+        with patch("sweep.cell_summary", wraps=cell_summary) as cell_summary_mock:
+            self.assertEqual(2, Sweep(self.grid, self.path).run())
+
+        self.assertEqual(
+            {"Martingale/200/10/300", "Passenger57/200/10/300"},
+            {call.args[0].key() for call in cell_summary_mock.call_args_list},
+        )
+        self.assertEqual(6, len(self.read_lines()))
+
+    def test_cells_run_with_other_settings_are_not_resumed(self):
+        Sweep(self.grid, self.path, seed=7).run()
+
+        with self.assertRaises(ValueError):
+            Sweep(self.grid, self.path, seed=8).run()
+        self.grid["samples"] = 5
+        with self.assertRaises(ValueError):
+            Sweep(self.grid, self.path, seed=7).run()
+        self.assertEqual(4, len(self.read_lines()))
+
+    def test_incomplete_last_line_is_run_again(self):
+        sweep = Sweep(self.grid, self.path)
+        sweep.run()
+        with open(self.path, "rb+") as file:
+            file.truncate(os.path.getsize(self.path) - 10)
+
+        self.assertEqual(1, sweep.run())
+        self.assertEqual(4, len(self.read_lines()))
+
+    def test_last_line_without_newline_is_run_again(self):
+        sweep = Sweep(self.grid, self.path)
+        sweep.run()
+        with open(self.path, "rb+") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+
+        self.assertEqual(1, sweep.run())
+        self.assertEqual(
+            {cell.key() for cell in sweep.cells()},
+            {line["key"] for line in self.read_lines()},
+        )
+
+    def test_cell_results_do_not_depend_on_order(self):
+        cell = SweepCell("Martingale", 100, 20, 300)
+
+        self.assertEqual(run_cell(cell, 5, seed=3), run_cell(cell, 5, seed=3))
+
+    def test_sweep_matches_cells_run_alone(self):
+        sweep = Sweep(self.grid, self.path, workers=2, seed=7)
+        sweep.chunkSize = 3
+        sweep.run()
+
+        for line in self.read_lines():
+            cell = SweepCell(line["player"], line["stake"], line["duration"], 300)
+            self.assertEqual(run_cell(cell, 4, seed=7), line)
+
+    def test_results_do_not_depend_on_number_of_workers(self):
+        Sweep(self.grid, self.path, workers=1).run()
+        serial = sorted(self.read_lines(), key=lambda line: line["key"])
+        os.remove(self.path)
+
+        Sweep(self.grid, self.path, workers=2).run()
+        parallel = sorted(self.read_lines(), key=lambda line: line["key"])
+
+        self.assertEqual(serial, parallel)
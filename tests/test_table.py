@@ -26,6 +26,21 @@ class TestTable(TestCase):
         with self.assertRaises(InvalidBet):
             self.table.isValid()
 
+    def test_validate_returns_status_from_running_total(self):
+        self.table.placeBet(self.bet2)
+
+        self.assertTrue(self.table.validate())
+
+        self.table.placeBet(self.bet1)
+
+        self.assertEqual(305, self.table.total)
+        self.assertFalse(self.table.validate())
+
+        self.table.clear()
+
+        self.assertEqual(0, self.table.total)
+        self.assertTrue(self.table.validate())
+
     def test_iter_returns_iterator_of_bets(self):
         empty_list_iterator = iter(self.table)
         self.assertEqual([], list(empty_list_iterator))
@@ -72,3 +87,31 @@ class TestTable(TestCase):
         expected_result_with_bets = f"Table({repr_string})"
 
         self.assertEqual(expected_result_with_bets, repr_result_with_bets)
+
+    def test_clear_empties_bets_in_place(self):
+        bets = self.table.bets
+        self.table.placeBet(self.bet1)
+
+        self.table.clear()
+
+        self.assertEqual([], self.table.bets)
+        self.assertIs(bets, self.table.bets)
+
+    def test_bets_cannot_be_changed_without_placing(self):
+        self.table.placeBet(self.bet1)
+
+        with self.assertRaises(AttributeError):
+            self.table.bets.append(self.bet2)
+        with self.assertRaises(TypeError):
+            self.table.bets[0] = self.bet2
+
+        self.assertEqual([self.bet1], self.table.bets)
+        self.assertEqual(5, self.table.total)
+
+    def test_assigning_bets_places_each_bet(self):
+        self.table.placeBet(self.bet2)
+
+        self.table.bets = [self.bet1]
+
+        self.assertEqual([self.bet1], self.table.bets)
+        self.assertEqual(5, self.table.total)
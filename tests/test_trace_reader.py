@@ -0,0 +1,60 @@
+import shutil
+from tempfile import mkdtemp
+from unittest import TestCase
+
+import numpy as np
+
+from integer_statistics import IntegerStatistics
+from trace_reader import TraceReader, drawdown, time_to_peak
+from trace_writer import TraceWriter
+
+
+class TestTraceReader(TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.sessions = [[110, 100, 120, 90], [90, 80], [100, 130, 110]]
+        with TraceWriter(self.directory, bufferSize=3) as trace:
+            for stakes in self.sessions:
+                trace.startSession()
+                for stake in stakes:
+                    trace.record(stake, 10, False)
+        self.reader = TraceReader(self.directory, chunkSize=4)
+
+    def tearDown(self):
+        del self.reader
+        shutil.rmtree(self.directory)
+
+    def test_sessions_are_views_into_the_mapping(self):
+        self.assertEqual(3, len(self.reader))
+        self.assertEqual([90, 80], self.reader.stakes(1).tolist())
+        self.assertIsInstance(self.reader.stakes(2).base, np.memmap)
+
+        with self.assertRaises(IndexError):
+            self.reader.stakes(3)
+
+    def test_blocks_hold_whole_sessions(self):
+        self.assertEqual([(0, 1), (1, 2), (2, 3)], list(self.reader.blocks()))
+
+        self.reader.chunkSize = 100
+
+        self.assertEqual([(0, 3)], list(self.reader.blocks()))
+
+    def test_summaries_match_integer_statistics(self):
+        maxima = IntegerStatistics(max(stakes) for stakes in self.sessions)
+        durations = IntegerStatistics(len(stakes) for stakes in self.sessions)
+
+        self.assertEqual(maxima.mean(), self.reader.maxima().mean())
+        self.assertEqual(maxima.stdev(), self.reader.maxima().stdev())
+        self.assertEqual(durations.mean(), self.reader.durations().mean())
+
+    def test_reduce_computes_metric_per_session(self):
+        drawdowns = self.reader.reduce(drawdown)
+        times_to_peak = self.reader.reduce(time_to_peak)
+
+        self.assertEqual({30: 1, 10: 1, 20: 1}, drawdowns.frequencies)
+        self.assertEqual({3: 1, 1: 1, 2: 1}, times_to_peak.frequencies)
+
+    def test_ruin_probability_by_spin(self):
+        ruin = self.reader.ruinProbability(4)
+
+        self.assertEqual([0, 1 / 3, 2 / 3, 2 / 3], ruin.tolist())
@@ -0,0 +1,63 @@
+import os
+import shutil
+from tempfile import mkdtemp
+from unittest import TestCase
+
+import numpy as np
+
+from bin_builder import american_wheel
+from game import Game
+from simulator import Simulator
+from table import Table
+from trace_writer import TRACE_COLUMNS, TraceWriter
+from players.passenger57 import Passenger57
+
+
+class TestTraceWriter(TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def load(self, name):
+        return np.load(os.path.join(self.directory, f"{name}.npy"))
+
+    def test_rows_are_written_across_buffer_flushes(self):
+        with TraceWriter(self.directory, bufferSize=2) as trace:
+            trace.startSession()
+            trace.record(110, 10, True)
+            trace.record(100, 10, False)
+            trace.record(90, 10, False)
+            trace.startSession()
+            trace.record(120, 20, True)
+
+        self.assertEqual([0, 0, 0, 1], self.load("session").tolist())
+        self.assertEqual([0, 1, 2, 0], self.load("spin").tolist())
+        self.assertEqual([110, 100, 90, 120], self.load("stake").tolist())
+        self.assertEqual([10, 10, 10, 20], self.load("bet").tolist())
+        self.assertEqual([True, False, False, True], self.load("won").tolist())
+
+    def test_empty_trace_can_be_loaded(self):
+        TraceWriter(self.directory).close()
+
+        for name, dtype in TRACE_COLUMNS.items():
+            self.assertEqual((0,), self.load(name).shape)
+            self.assertEqual(dtype, self.load(name).dtype)
+
+    def test_simulator_records_every_spin(self):
+        wheel = american_wheel()
+        table = Table()
+        simulator = Simulator(Game(wheel, table), Passenger57(table, wheel))
+        simulator.samples = 3
+        simulator.initDuration = 5
+
+        with TraceWriter(self.directory) as simulator.trace:
+            simulator.gather()
+
+        stakes = self.load("stake")
+        won = self.load("won")
+        self.assertEqual(15, len(stakes))
+        self.assertEqual([20] * 15, self.load("bet").tolist())
+        self.assertEqual(simulator.maxima[0], stakes[:5].max())
+        self.assertTrue(np.array_equal(stakes[1:5] > stakes[:4], won[1:5]))
@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+from bin_builder import american_wheel
+from game import Game
+from players.martingale import Martingale
+from players.passenger57 import Passenger57
+from table import Table
+from variance_reduction import VarianceReducedSimulator, mirror_bins
+
+
+class TestVarianceReduction(TestCase):
+    def setUp(self):
+        self.wheel = american_wheel()
+        self.wheel.rng.seed(1)
+        table = Table()
+        self.simulator = VarianceReducedSimulator(
+            Game(self.wheel, table), Martingale(table)
+        )
+        self.simulator.samples = 200
+
+    def test_mirror_swaps_red_and_black(self):
+        mirror = mirror_bins(self.wheel)
+        red = self.wheel.getOutcome("Red")
+        black = self.wheel.getOutcome("Black")
+
+        self.assertEqual(list(range(38)), [mirror[index] for index in mirror])
+        self.assertEqual((0, 37), (mirror[0], mirror[37]))
+        for index in range(1, 37):
+            self.assertEqual(
+                red in self.wheel.bins[index], black in self.wheel.bins[mirror[index]]
+            )
+
+    def test_replay_plays_given_spins_and_restores_stream(self):
+        black = self.wheel.getOutcome("Black")
+        spins = [
+            index for index, bin in enumerate(self.wheel.bins) if black in bin
+        ] * 14
+
+        duration, maximum = self.simulator.replay(spins[:250])
+
+        self.assertEqual((250, 350), (duration, maximum))
+        self.assertIsNone(self.wheel.spinStream)
+
+    def test_antithetic_pairs_reduce_variance(self):
+        estimate = self.simulator.gatherAntithetic()
+
+        self.assertEqual(200, estimate.samples)
+        self.assertEqual(200, len(self.simulator.durations))
+        self.assertGreater(estimate.maximaReduction, 1)
+
+    def test_control_variate_reduces_variance(self):
+        estimate = self.simulator.gatherControlVariate()
+
+        self.assertEqual(200, estimate.samples)
+        self.assertGreater(estimate.durationsReduction, 1)
+        self.assertGreater(estimate.maximaReduction, 1)
+        self.assertIsInstance(self.simulator.game, Game)
+
+    def test_stratified_estimate_weights_every_stratum(self):
+        estimate = self.simulator.gatherStratified(spins=1)
+
+        self.assertEqual(95 + 95 + 11, estimate.samples)
+        self.assertLess(abs(estimate.maxima - self.simulator.maxima.mean()), 10)
+
+    def test_constant_metric_has_no_reduction(self):
+        table = Table()
+        simulator = VarianceReducedSimulator(
+            Game(self.wheel, table), Passenger57(table, self.wheel)
+        )
+        simulator.samples = 20
+        simulator.initDuration = 30
+
+        estimate = simulator.gatherAntithetic()
+
+        self.assertEqual((30, 1.0), (estimate.durations, estimate.durationsReduction))
@@ -0,0 +1,65 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from bin_builder import BinBuilder
+from game import Game
+from simulator import Simulator
+from table import Table
+from vectorized_simulator import VectorizedSimulator
+from wheel import Wheel
+from players.passenger57 import Passenger57
+
+
+class TestVectorizedSimulator(TestCase):
+    def setUp(self):
+        self.wheel = Wheel()
+        BinBuilder().buildBins(self.wheel)
+        self.black = self.wheel.getOutcome("Black")
+        self.simulator = VectorizedSimulator(self.wheel, self.black, 20, seed=1)
+        self.simulator.initDuration = 30
+
+    def simulate_session(self, spins):
+        table = Table()
+        passenger57 = Passenger57(table, self.wheel)
+        simulator = Simulator(Game(self.wheel, table), passenger57)
+        simulator.initDuration = self.simulator.initDuration
+        simulator.initStake = self.simulator.initStake
+        choose_mock = Mock(side_effect=[self.wheel.get(spin) for spin in spins])
+        with patch("wheel.Wheel.choose", choose_mock):
+            return simulator.session()
+
+    def test_sessions_match_object_simulation(self):
+        spins = np.random.default_rng(7).integers(0, 38, size=(5, 30))
+
+        durations, maxima = self.simulator.sessions(spins)
+
+        for row, duration, maximum in zip(spins, durations, maxima):
+            stake_values = self.simulate_session(row)
+            self.assertEqual(len(stake_values), duration)
+            self.assertEqual(max(stake_values), maximum)
+
+    def test_session_ends_at_first_ruin_when_stopping_when_broke(self):
+        self.simulator.stopWhenBroke = True
+        self.simulator.initStake = 50
+        red_bin = 1
+        black_bin = 2
+        spins = np.array([[black_bin, red_bin, red_bin, red_bin] + [black_bin] * 26])
+
+        durations, maxima = self.simulator.sessions(spins)
+
+        expected_duration = 4
+        expected_maximum = 70
+        self.assertEqual(expected_duration, durations[0])
+        self.assertEqual(expected_maximum, maxima[0])
+
+    def test_gather_collects_integer_statistics(self):
+        self.simulator.samples = 25
+        self.simulator.batchSize = 10
+
+        self.simulator.gather()
+
+        self.assertEqual(25, len(self.simulator.durations))
+        self.assertEqual([30] * 25, self.simulator.durations)
+        self.assertIsInstance(self.simulator.maxima[0], int)
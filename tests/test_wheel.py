@@ -2,6 +2,8 @@ from unittest import TestCase
 from outcome import Outcome
 from bin import Bin
 from wheel import Wheel
+from bin_builder import american_wheel
+from spin_stream import PCG64Generator, SpinStream
 
 
 class TestWheel(TestCase):
@@ -22,6 +24,11 @@ class TestWheel(TestCase):
         self.wheel.addOutcome(bin_number, self.oc1)
         self.assertIn(self.oc1, self.wheel.bins[0])
 
+    def test_addOutcome_stores_interned_outcome(self):
+        self.wheel.addOutcome(0, Outcome("Red", 1))
+
+        self.assertIs(Outcome.intern("Red", 1), self.wheel.getOutcome("Red"))
+
     def test_choose_returns_random_bin_object(self):
         random_bin = self.wheel.choose()
         self.assertIn(random_bin, self.wheel.bins)
@@ -54,3 +61,65 @@ class TestWheel(TestCase):
     def test_getOutcome_raises_error_for_invalid_name(self):
         with self.assertRaises(KeyError):
             self.wheel.getOutcome("Invalid name")
+
+    def test_buildPayoutMatrix_gives_each_outcome_an_id(self):
+        self.wheel.addOutcome(1, self.oc1)
+        self.wheel.addOutcome(2, self.oc2)
+
+        self.wheel.buildPayoutMatrix()
+
+        self.assertEqual((self.oc1, self.oc2), self.wheel.outcomes)
+        self.assertEqual(0, self.wheel.getOutcomeId(self.oc1))
+        self.assertEqual(1, self.wheel.getOutcomeId(self.oc2))
+        self.assertEqual((38, 2), self.wheel.payouts.shape)
+
+    def test_payout_resolves_bets_from_matrix(self):
+        self.wheel.addOutcome(1, self.oc1)
+        self.wheel.addOutcome(1, self.oc2)
+        self.wheel.buildPayoutMatrix()
+        red_id = self.wheel.getOutcomeId(self.oc1)
+        black_id = self.wheel.getOutcomeId(self.oc2)
+
+        self.assertEqual(20, self.wheel.payout(1, red_id, 10))
+        self.assertEqual(30, self.wheel.payout(1, black_id, 10))
+        self.assertEqual(0, self.wheel.payout(2, red_id, 10))
+
+    def test_getOutcomeId_raises_error_for_unknown_outcome(self):
+        self.wheel.buildPayoutMatrix()
+        with self.assertRaises(KeyError):
+            self.wheel.getOutcomeId(self.oc1)
+
+    def test_addOutcome_collects_outcomes_until_build_is_finished(self):
+        self.wheel.startBuild()
+        self.wheel.addOutcome(0, self.oc1)
+        self.wheel.addOutcome(0, self.oc2)
+
+        self.assertNotIn(self.oc1, self.wheel.bins[0])
+
+        self.wheel.finishBuild()
+
+        self.assertEqual(Bin([self.oc1, self.oc2]), self.wheel.bins[0])
+        self.assertIsInstance(self.wheel.bins[0], Bin)
+
+    def test_useLayout_shares_bins_of_built_wheel(self):
+        self.wheel.addOutcome(3, self.oc1)
+        self.wheel.buildPayoutMatrix()
+        other_wheel = Wheel()
+
+        other_wheel.useLayout(self.wheel)
+
+        self.assertIs(self.wheel.bins, other_wheel.bins)
+        self.assertIs(self.wheel.payouts, other_wheel.payouts)
+        self.assertEqual(self.oc1, other_wheel.getOutcome("Red"))
+        self.assertIsNot(self.wheel.rng, other_wheel.rng)
+
+    def test_choose_takes_bins_from_spin_stream(self):
+        stream = SpinStream(PCG64Generator(seed=11), blockSize=16)
+        reference = SpinStream(PCG64Generator(seed=11), blockSize=16)
+        wheel = american_wheel()
+        wheel.useSpinStream(stream)
+
+        chosen_bins = [wheel.choose() for _ in range(40)]
+
+        expected_bins = [wheel.get(reference.next()) for _ in range(40)]
+        self.assertEqual(expected_bins, chosen_bins)